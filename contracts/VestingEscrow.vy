@@ -186,16 +186,21 @@ def claim(
     """
     self._check_sender_is_recipient()
 
-    claimable: uint256 = min(self._unclaimed(), amount)
-    self.total_claimed += claimable
+    return self._claim(beneficiary, amount)
 
-    assert self.token.transfer(
-        beneficiary, claimable, default_return_value=True
-    ), "transfer failed"
 
-    log Claim(beneficiary, claimable)
+@external
+def claim_via_factory(sender: address, beneficiary: address) -> uint256:
+    """
+    @notice Claim all vested tokens for the recipient calling
+            `VestingEscrowFactory.batch_claim`
+    @param sender Address calling the factory, must be the recipient
+    @param beneficiary Address to transfer claimed tokens to
+    """
+    assert msg.sender == self.factory.address, "msg.sender not factory"
+    assert sender == self.recipient, "msg.sender not recipient"
 
-    return claimable
+    return self._claim(beneficiary, max_value(uint256))
 
 
 @external
@@ -203,14 +208,14 @@ def revoke_unvested():
     """
     @notice Disable further flow of tokens and revoke the unvested part to owner
     """
-    self._check_sender_is_owner_or_manager()
+    owner: address = self._check_sender_is_owner_or_manager()
 
     revokable: uint256 = self._locked()
     assert revokable > 0, "nothing to revoke"
     self.disabled_at = block.timestamp
 
     assert self.token.transfer(
-        self._owner(), revokable, default_return_value=True
+        owner, revokable, default_return_value=True
     ), "transfer failed"
 
     log UnvestedTokensRevoked(msg.sender, revokable)
@@ -221,7 +226,7 @@ def revoke_all():
     """
     @notice Disable further flow of tokens and revoke all tokens to owner
     """
-    self._check_sender_is_owner()
+    owner: address = self._check_sender_is_owner()
     assert self.is_fully_revokable, "not allowed for ordinary vesting"
     assert not self.is_fully_revoked, "already fully revoked"
 
@@ -233,7 +238,7 @@ def revoke_all():
     self.disabled_at = block.timestamp
 
     assert self.token.transfer(
-        self._owner(), revokable, default_return_value=True
+        owner, revokable, default_return_value=True
     ), "transfer failed"
 
     log VestingFullyRevoked(msg.sender, revokable)
@@ -277,9 +282,32 @@ def aragon_vote(abi_encoded_params: Bytes[1000]):
     @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_aragon_vote_calldata
     """
     self._check_sender_is_recipient()
-    self._check_voting_adapter_is_set()
     raw_call(
-        self.factory.voting_adapter(),
+        self._voting_adapter(),
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("aragon_vote(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@external
+def aragon_vote_via_factory(
+    sender: address, voting_adapter: address, abi_encoded_params: Bytes[1000]
+):
+    """
+    @notice Participate Aragon vote for the recipient calling
+            `VestingEscrowFactory.batch_aragon_vote`
+    @param sender Address calling the factory, must be the recipient
+    @param voting_adapter Voting adapter of the factory
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_aragon_vote_calldata
+    """
+    assert msg.sender == self.factory.address, "msg.sender not factory"
+    assert sender == self.recipient, "msg.sender not recipient"
+
+    raw_call(
+        voting_adapter,
         _abi_encode(
             abi_encoded_params,
             method_id=method_id("aragon_vote(bytes)"),
@@ -295,9 +323,8 @@ def snapshot_set_delegate(abi_encoded_params: Bytes[1000]):
     @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_snapshot_set_delegate_calldata
     """
     self._check_sender_is_recipient()
-    self._check_voting_adapter_is_set()
     raw_call(
-        self.factory.voting_adapter(),
+        self._voting_adapter(),
         _abi_encode(
             abi_encoded_params,
             method_id=method_id("snapshot_set_delegate(bytes)"),
@@ -313,9 +340,8 @@ def delegate(abi_encoded_params: Bytes[1000]):
     @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_delegate_calldata
     """
     self._check_sender_is_recipient()
-    self._check_voting_adapter_is_set()
     raw_call(
-        self.factory.voting_adapter(),
+        self._voting_adapter(),
         _abi_encode(
             abi_encoded_params,
             method_id=method_id("delegate(bytes)"),
@@ -325,25 +351,36 @@ def delegate(abi_encoded_params: Bytes[1000]):
 
 
 @internal
-def _owner() -> address:
-    return self.factory.owner()
+def _claim(beneficiary: address, amount: uint256) -> uint256:
+    claimable: uint256 = min(self._unclaimed(), amount)
+    self.total_claimed += claimable
+
+    assert self.token.transfer(
+        beneficiary, claimable, default_return_value=True
+    ), "transfer failed"
 
+    log Claim(beneficiary, claimable)
 
-@internal
-def _manager() -> address:
-    return self.factory.manager()
+    return claimable
 
 
 @internal
-def _check_sender_is_owner_or_manager():
-    assert (
-        msg.sender == self._owner() or msg.sender == self._manager()
-    ), "msg.sender not owner or manager"
+def _check_sender_is_owner_or_manager() -> address:
+    # fetch each role once, the owner is returned to be reused by the caller
+    factory: IVestingEscrowFactory = self.factory
+    owner: address = factory.owner()
+    if msg.sender != owner:
+        assert (
+            msg.sender == factory.manager()
+        ), "msg.sender not owner or manager"
+    return owner
 
 
 @internal
-def _check_sender_is_owner():
-    assert msg.sender == self._owner(), "msg.sender not owner"
+def _check_sender_is_owner() -> address:
+    owner: address = self.factory.owner()
+    assert msg.sender == owner, "msg.sender not owner"
+    return owner
 
 
 @internal
@@ -352,10 +389,10 @@ def _check_sender_is_recipient():
 
 
 @internal
-def _check_voting_adapter_is_set():
-    assert self.factory.voting_adapter() != empty(
-        address
-    ), "voting adapter not set"
+def _voting_adapter() -> address:
+    voting_adapter: address = self.factory.voting_adapter()
+    assert voting_adapter != empty(address), "voting adapter not set"
+    return voting_adapter
 
 
 @internal
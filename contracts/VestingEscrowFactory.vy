@@ -21,6 +21,23 @@ interface IVestingEscrow:
         is_fully_revokable: bool,
         voting_adapter_addr: address,
     ) -> bool: nonpayable
+    def claim_via_factory(
+        sender: address, beneficiary: address
+    ) -> uint256: nonpayable
+    def aragon_vote_via_factory(
+        sender: address,
+        voting_adapter: address,
+        abi_encoded_params: Bytes[1000],
+    ): nonpayable
+
+
+struct VestingParams:
+    amount: uint256
+    recipient: address
+    vesting_duration: uint256
+    vesting_start: uint256
+    cliff_length: uint256
+    is_fully_revokable: bool
 
 
 event VestingEscrowCreated:
@@ -50,6 +67,8 @@ event ManagerChanged:
     manager: address
 
 
+MAX_BATCH_SIZE: constant(uint256) = 100
+
 TARGET: immutable(address)
 TOKEN: immutable(address)
 voting_adapter: public(address)
@@ -103,33 +122,95 @@ def deploy_vesting_contract(
     @param cliff_length Duration after which the first portion vests
     @param is_fully_revokable Fully revockable flag
     """
-    assert vesting_duration > 0, "incorrect vesting duration"
-    assert cliff_length <= vesting_duration, "incorrect vesting cliff"
-    assert recipient != empty(address), "zero recipient"
-    assert amount > 0, "incorrect amount"
-
-    escrow: address = create_minimal_proxy_to(TARGET)
-
-    assert ERC20(TOKEN).transferFrom(
-        msg.sender, escrow, amount, default_return_value=True
-    ), "transferFrom deployer to escrow failed"
-
-    IVestingEscrow(escrow).initialize(
-        TOKEN,
+    return self._deploy_vesting_contract(
+        msg.sender,
         amount,
         recipient,
+        vesting_duration,
         vesting_start,
-        vesting_start + vesting_duration,
         cliff_length,
         is_fully_revokable,
-        self,
     )
-    log VestingEscrowCreated(
-        msg.sender,
-        recipient,
-        escrow,
-    )
-    return escrow
+
+
+@external
+def deploy_vesting_contracts(
+    params: DynArray[VestingParams, MAX_BATCH_SIZE]
+) -> DynArray[address, MAX_BATCH_SIZE]:
+    """
+    @notice Deploy and fund a batch of new vesting contracts
+    @dev Tokens for the whole batch are pulled from the sender with a single
+         `transferFrom` and then distributed to the deployed escrows
+    @param params List of the vesting parameters, one entry per escrow
+    """
+    assert len(params) > 0, "empty batch"
+
+    total: uint256 = 0
+    for p in params:
+        total += p.amount
+
+    assert ERC20(TOKEN).transferFrom(
+        msg.sender, self, total, default_return_value=True
+    ), "transferFrom deployer to factory failed"
+
+    escrows: DynArray[address, MAX_BATCH_SIZE] = []
+    for p in params:
+        escrows.append(
+            self._deploy_vesting_contract(
+                self,
+                p.amount,
+                p.recipient,
+                p.vesting_duration,
+                p.vesting_start,
+                p.cliff_length,
+                p.is_fully_revokable,
+            )
+        )
+    return escrows
+
+
+@external
+def batch_claim(
+    escrows: DynArray[address, MAX_BATCH_SIZE],
+    beneficiary: address = msg.sender,
+) -> uint256:
+    """
+    @notice Claim all vested tokens from many escrows of the sender at once
+    @dev Escrows accept the call only from their factory and only on behalf
+         of their recipient
+    @param escrows List of the escrows to claim from, the sender must be
+           the recipient of each of them
+    @param beneficiary Address to transfer claimed tokens to
+    @return Total amount of the claimed tokens
+    """
+    claimed: uint256 = 0
+    for escrow in escrows:
+        claimed += IVestingEscrow(escrow).claim_via_factory(
+            msg.sender, beneficiary
+        )
+    return claimed
+
+
+@external
+def batch_aragon_vote(
+    escrows: DynArray[address, MAX_BATCH_SIZE],
+    abi_encoded_params: Bytes[1000],
+):
+    """
+    @notice Participate Aragon vote from many escrows of the sender at once
+    @dev Escrows accept the call only from their factory and only on behalf
+         of their recipient
+    @param escrows List of the escrows to vote from, the sender must be
+           the recipient of each of them
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from
+           VotingAdapter.encode_aragon_vote_calldata
+    """
+    voting_adapter: address = self.voting_adapter
+    assert voting_adapter != empty(address), "voting adapter not set"
+    for escrow in escrows:
+        IVestingEscrow(escrow).aragon_vote_via_factory(
+            msg.sender, voting_adapter, abi_encoded_params
+        )
 
 
 @external
@@ -206,6 +287,64 @@ def target() -> address:
     return TARGET
 
 
+@external
+@view
+def roles() -> (address, address, address):
+    """
+    @notice Get the owner, manager and voting adapter addresses in a single call
+    """
+    return self.owner, self.manager, self.voting_adapter
+
+
+@internal
+def _deploy_vesting_contract(
+    funder: address,
+    amount: uint256,
+    recipient: address,
+    vesting_duration: uint256,
+    vesting_start: uint256,
+    cliff_length: uint256,
+    is_fully_revokable: bool,
+) -> address:
+    """
+    @notice Deploy a new vesting contract and fund it from `funder`
+    @dev If `funder` is the factory itself, tokens are expected to be already
+         transferred to the factory by the caller
+    """
+    assert vesting_duration > 0, "incorrect vesting duration"
+    assert cliff_length <= vesting_duration, "incorrect vesting cliff"
+    assert recipient != empty(address), "zero recipient"
+    assert amount > 0, "incorrect amount"
+
+    escrow: address = create_minimal_proxy_to(TARGET)
+
+    if funder == self:
+        assert ERC20(TOKEN).transfer(
+            escrow, amount, default_return_value=True
+        ), "transfer factory to escrow failed"
+    else:
+        assert ERC20(TOKEN).transferFrom(
+            funder, escrow, amount, default_return_value=True
+        ), "transferFrom deployer to escrow failed"
+
+    IVestingEscrow(escrow).initialize(
+        TOKEN,
+        amount,
+        recipient,
+        vesting_start,
+        vesting_start + vesting_duration,
+        cliff_length,
+        is_fully_revokable,
+        self,
+    )
+    log VestingEscrowCreated(
+        msg.sender,
+        recipient,
+        escrow,
+    )
+    return escrow
+
+
 @internal
 def _check_sender_is_owner():
     assert msg.sender == self.owner, "msg.sender not owner"
@@ -0,0 +1,377 @@
+# @version 0.3.7
+
+"""
+@title Vesting Escrow Factory Immutable Args
+@author Curve Finance, Yearn Finance, Lido Finance
+@license GPL-3.0
+@notice Stores and distributes ERC20 tokens by deploying `VestingEscrowImmutableArgs` contracts
+@dev ABI compatible with `VestingEscrowFactory`. Escrows are EIP-1167 proxies
+     created from the blueprint with the vesting params appended to the proxy
+     code, see `utils/immutable_args.py`
+"""
+
+from vyper.interfaces import ERC20
+
+
+interface IVestingEscrow:
+    def initialize(
+        token: address,
+        amount: uint256,
+        recipient: address,
+        start_time: uint256,
+        end_time: uint256,
+        cliff_length: uint256,
+        is_fully_revokable: bool,
+        voting_adapter_addr: address,
+    ) -> bool: nonpayable
+    def claim_via_factory(
+        sender: address, beneficiary: address
+    ) -> uint256: nonpayable
+    def aragon_vote_via_factory(
+        sender: address,
+        voting_adapter: address,
+        abi_encoded_params: Bytes[1000],
+    ): nonpayable
+
+
+struct VestingParams:
+    amount: uint256
+    recipient: address
+    vesting_duration: uint256
+    vesting_start: uint256
+    cliff_length: uint256
+    is_fully_revokable: bool
+
+
+event VestingEscrowCreated:
+    creator: indexed(address)
+    recipient: indexed(address)
+    escrow: address
+
+
+event ERC20Recovered:
+    token: address
+    amount: uint256
+
+
+event ETHRecovered:
+    amount: uint256
+
+
+event VotingAdapterUpgraded:
+    voting_adapter: address
+
+
+event OwnerChanged:
+    owner: address
+
+
+event ManagerChanged:
+    manager: address
+
+
+MAX_BATCH_SIZE: constant(uint256) = 100
+
+TARGET: immutable(address)
+TOKEN: immutable(address)
+voting_adapter: public(address)
+owner: public(address)
+manager: public(address)
+
+
+@external
+def __init__(
+    target: address,
+    token: address,
+    owner: address,
+    manager: address,
+    voting_adapter: address,
+):
+    """
+    @notice Contract constructor
+    @dev Prior to deployment you must deploy one copy of `VestingEscrowImmutableArgs`
+         and the proxy blueprint pointing to it
+    @param target Address of the blueprint of `VestingEscrowImmutableArgs` proxies
+    @param token Address of the ERC20 token being distributed using escrows
+    @param owner Address of the owner of the deployed escrows
+    @param manager Address of the manager of the deployed escrows
+    @param voting_adapter Address of the Lido Voting Adapter
+    """
+    assert target != empty(address), "zero target"
+    assert owner != empty(address), "zero owner"
+    assert token != empty(address), "zero token"
+    TARGET = target
+    TOKEN = token
+    self.owner = owner
+    self.manager = manager
+    self.voting_adapter = voting_adapter
+
+
+@external
+def deploy_vesting_contract(
+    amount: uint256,
+    recipient: address,
+    vesting_duration: uint256,
+    vesting_start: uint256 = block.timestamp,
+    cliff_length: uint256 = 0,
+    is_fully_revokable: bool = False,  # use ordinary escrow by default
+) -> address:
+    """
+    @notice Deploy and fund a new vesting contract
+    @param amount Amount of the tokens to be vested after fundings
+    @param recipient Address to vest tokens for
+    @param vesting_duration Time period over which tokens are released
+    @param vesting_start Epoch time when tokens begin to vest
+    @param cliff_length Duration after which the first portion vests
+    @param is_fully_revokable Fully revockable flag
+    """
+    return self._deploy_vesting_contract(
+        msg.sender,
+        amount,
+        recipient,
+        vesting_duration,
+        vesting_start,
+        cliff_length,
+        is_fully_revokable,
+    )
+
+
+@external
+def deploy_vesting_contracts(
+    params: DynArray[VestingParams, MAX_BATCH_SIZE]
+) -> DynArray[address, MAX_BATCH_SIZE]:
+    """
+    @notice Deploy and fund a batch of new vesting contracts
+    @dev Tokens for the whole batch are pulled from the sender with a single
+         `transferFrom` and then distributed to the deployed escrows
+    @param params List of the vesting parameters, one entry per escrow
+    """
+    assert len(params) > 0, "empty batch"
+
+    total: uint256 = 0
+    for p in params:
+        total += p.amount
+
+    assert ERC20(TOKEN).transferFrom(
+        msg.sender, self, total, default_return_value=True
+    ), "transferFrom deployer to factory failed"
+
+    escrows: DynArray[address, MAX_BATCH_SIZE] = []
+    for p in params:
+        escrows.append(
+            self._deploy_vesting_contract(
+                self,
+                p.amount,
+                p.recipient,
+                p.vesting_duration,
+                p.vesting_start,
+                p.cliff_length,
+                p.is_fully_revokable,
+            )
+        )
+    return escrows
+
+
+@external
+def batch_claim(
+    escrows: DynArray[address, MAX_BATCH_SIZE],
+    beneficiary: address = msg.sender,
+) -> uint256:
+    """
+    @notice Claim all vested tokens from many escrows of the sender at once
+    @dev Escrows accept the call only from their factory and only on behalf
+         of their recipient
+    @param escrows List of the escrows to claim from, the sender must be
+           the recipient of each of them
+    @param beneficiary Address to transfer claimed tokens to
+    @return Total amount of the claimed tokens
+    """
+    claimed: uint256 = 0
+    for escrow in escrows:
+        claimed += IVestingEscrow(escrow).claim_via_factory(
+            msg.sender, beneficiary
+        )
+    return claimed
+
+
+@external
+def batch_aragon_vote(
+    escrows: DynArray[address, MAX_BATCH_SIZE],
+    abi_encoded_params: Bytes[1000],
+):
+    """
+    @notice Participate Aragon vote from many escrows of the sender at once
+    @dev Escrows accept the call only from their factory and only on behalf
+         of their recipient
+    @param escrows List of the escrows to vote from, the sender must be
+           the recipient of each of them
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from
+           VotingAdapter.encode_aragon_vote_calldata
+    """
+    voting_adapter: address = self.voting_adapter
+    assert voting_adapter != empty(address), "voting adapter not set"
+    for escrow in escrows:
+        IVestingEscrow(escrow).aragon_vote_via_factory(
+            msg.sender, voting_adapter, abi_encoded_params
+        )
+
+
+@external
+def recover_erc20(token: address, amount: uint256):
+    """
+    @notice Recover ERC20 tokens to owner
+    @param token Address of the ERC20 token to be recovered
+    """
+    if amount != 0:
+        assert ERC20(token).transfer(
+            self.owner, amount, default_return_value=True
+        ), "transfer failed"
+        log ERC20Recovered(token, amount)
+
+
+@external
+def recover_ether():
+    """
+    @notice Recover Ether to owner
+    """
+    amount: uint256 = self.balance
+    if amount != 0:
+        self._safe_send_ether(self.owner, amount)
+        log ETHRecovered(amount)
+
+
+@external
+def update_voting_adapter(voting_adapter: address):
+    """
+    @notice Update voting_adapter to be used by vestings
+    @param voting_adapter Address of the new VotingAdapter implementation
+    """
+    self._check_sender_is_owner()
+    self.voting_adapter = voting_adapter
+    log VotingAdapterUpgraded(voting_adapter)
+
+
+@external
+def change_owner(owner: address):
+    """
+    @notice Change contract owner.
+    @param owner Address of the new owner. Must be non-zero.
+    """
+    self._check_sender_is_owner()
+    assert owner != empty(address), "zero owner address"
+
+    self.owner = owner
+    log OwnerChanged(owner)
+
+
+@external
+def change_manager(manager: address):
+    """
+    @notice Set contract manager.
+            Can update manager if it is already set.
+            Can be called only by the owner.
+    @param manager Address of the new manager
+    """
+    self._check_sender_is_owner()
+
+    self.manager = manager
+    log ManagerChanged(manager)
+
+
+@external
+@view
+def token() -> address:
+    return TOKEN
+
+
+@external
+@view
+def target() -> address:
+    return TARGET
+
+
+@external
+@view
+def roles() -> (address, address, address):
+    """
+    @notice Get the owner, manager and voting adapter addresses in a single call
+    """
+    return self.owner, self.manager, self.voting_adapter
+
+
+@internal
+def _deploy_vesting_contract(
+    funder: address,
+    amount: uint256,
+    recipient: address,
+    vesting_duration: uint256,
+    vesting_start: uint256,
+    cliff_length: uint256,
+    is_fully_revokable: bool,
+) -> address:
+    """
+    @notice Deploy a new vesting contract and fund it from `funder`
+    @dev If `funder` is the factory itself, tokens are expected to be already
+         transferred to the factory by the caller
+    """
+    assert vesting_duration > 0, "incorrect vesting duration"
+    assert cliff_length <= vesting_duration, "incorrect vesting cliff"
+    assert recipient != empty(address), "zero recipient"
+    assert amount > 0, "incorrect amount"
+
+    vesting_end: uint256 = vesting_start + vesting_duration
+    escrow: address = create_from_blueprint(
+        TARGET,
+        TOKEN,
+        amount,
+        recipient,
+        vesting_start,
+        vesting_end,
+        cliff_length,
+        is_fully_revokable,
+        self,
+        code_offset=3,
+    )
+
+    if funder == self:
+        assert ERC20(TOKEN).transfer(
+            escrow, amount, default_return_value=True
+        ), "transfer factory to escrow failed"
+    else:
+        assert ERC20(TOKEN).transferFrom(
+            funder, escrow, amount, default_return_value=True
+        ), "transferFrom deployer to escrow failed"
+
+    IVestingEscrow(escrow).initialize(
+        TOKEN,
+        amount,
+        recipient,
+        vesting_start,
+        vesting_end,
+        cliff_length,
+        is_fully_revokable,
+        self,
+    )
+    log VestingEscrowCreated(
+        msg.sender,
+        recipient,
+        escrow,
+    )
+    return escrow
+
+
+@internal
+def _check_sender_is_owner():
+    assert msg.sender == self.owner, "msg.sender not owner"
+
+
+@internal
+def _safe_send_ether(_to: address, _value: uint256):
+    """
+    @notice Overcome 2300 gas limit on simple send
+    """
+    _response: Bytes[32] = raw_call(
+        _to, empty(bytes32), value=_value, max_outsize=32
+    )
+    if len(_response) > 0:
+        assert convert(_response, bool), "ETH transfer failed"
@@ -0,0 +1,498 @@
+# @version 0.3.7
+
+"""
+@title Vesting Escrow Immutable Args
+@author Curve Finance, Yearn Finance, Lido Finance
+@license GPL-3.0
+@notice Vests ERC20 tokens for a single address
+@dev ABI compatible drop-in for `VestingEscrow` intended to be deployed many
+     times via `VestingEscrowFactoryImmutableArgs` as EIP-1167 proxies with
+     the vesting params appended to the proxy code. The params are read from
+     the proxy code, only the claim and revoke state is kept in storage
+"""
+
+from vyper.interfaces import ERC20
+
+
+interface IVestingEscrowFactory:
+    def voting_adapter() -> address: nonpayable
+    def owner() -> address: nonpayable
+    def manager() -> address: nonpayable
+
+
+event VestingEscrowInitialized:
+    factory: indexed(address)
+    recipient: indexed(address)
+    token: indexed(address)
+    amount: uint256
+    start_time: uint256
+    end_time: uint256
+    cliff_length: uint256
+    is_fully_revokable: bool
+
+
+event Claim:
+    beneficiary: indexed(address)
+    claimed: uint256
+
+
+event UnvestedTokensRevoked:
+    recoverer: indexed(address)
+    revoked: uint256
+
+
+event VestingFullyRevoked:
+    recoverer: indexed(address)
+    revoked: uint256
+
+
+event ERC20Recovered:
+    token: address
+    amount: uint256
+
+
+event ETHRecovered:
+    amount: uint256
+
+
+# the `initialize` args appended to the proxy code
+struct VestingArgs:
+    token: address
+    amount: uint256
+    recipient: address
+    start_time: uint256
+    end_time: uint256
+    cliff_length: uint256
+    is_fully_revokable: bool
+    factory: address
+
+
+# size of the EIP-1167 proxy runtime code, the args are appended right after
+ARGS_OFFSET: constant(uint256) = 45
+# ABI encoded `VestingArgs`
+ARGS_SIZE: constant(uint256) = 256
+
+total_claimed: public(uint256)
+disabled_at: public(uint256)
+initialized: public(bool)
+is_fully_revoked: public(bool)
+
+
+@external
+def __init__():
+    """
+    @notice Initialize source contract implementation.
+    """
+    # ensure that the original contract cannot be initialized
+    self.initialized = True
+
+
+@external
+def initialize(
+    token: address,
+    amount: uint256,
+    recipient: address,
+    start_time: uint256,
+    end_time: uint256,
+    cliff_length: uint256,
+    is_fully_revokable: bool,
+    factory: address,
+) -> bool:
+    """
+    @notice Initialize the contract.
+    @dev The args must be the same as appended to the proxy code by
+         `VestingEscrowFactoryImmutableArgs`. It may be called once per
+         deployment.
+    @param token Address of the ERC20 token being distributed
+    @param amount Amount of the ERC20 token to be controleed by escrow
+    @param recipient Address to vest tokens for
+    @param start_time Epoch time at which token distribution starts
+    @param end_time Time until everything should be vested
+    @param cliff_length Duration after which the first portion vests
+    @param factory Address of the parent factory
+    """
+    assert not self.initialized, "can only initialize once"
+    self.initialized = True
+
+    # `self.code` is compiled to CODECOPY which reads the implementation code
+    # within the proxy delegatecall, EXTCODECOPY of the proxy is needed
+    proxy: address = self
+    assert _abi_encode(
+        token,
+        amount,
+        recipient,
+        start_time,
+        end_time,
+        cliff_length,
+        is_fully_revokable,
+        factory,
+    ) == slice(proxy.code, ARGS_OFFSET, ARGS_SIZE), "args mismatch"
+
+    assert ERC20(token).balanceOf(self) >= amount, "insufficient balance"
+
+    self.disabled_at = end_time  # Set to maximum time
+
+    log VestingEscrowInitialized(
+        factory,
+        recipient,
+        token,
+        amount,
+        start_time,
+        end_time,
+        cliff_length,
+        is_fully_revokable,
+    )
+
+    return True
+
+
+@external
+@view
+def recipient() -> address:
+    return self._args().recipient
+
+
+@external
+@view
+def token() -> address:
+    return self._args().token
+
+
+@external
+@view
+def start_time() -> uint256:
+    return self._args().start_time
+
+
+@external
+@view
+def end_time() -> uint256:
+    return self._args().end_time
+
+
+@external
+@view
+def cliff_length() -> uint256:
+    return self._args().cliff_length
+
+
+@external
+@view
+def factory() -> address:
+    return self._args().factory
+
+
+@external
+@view
+def total_locked() -> uint256:
+    return self._args().amount
+
+
+@external
+@view
+def is_fully_revokable() -> bool:
+    return self._args().is_fully_revokable
+
+
+@internal
+@view
+def _total_vested_at(args: VestingArgs, time: uint256) -> uint256:
+    if time < args.start_time + args.cliff_length:
+        return 0
+    return min(
+        args.amount * (time - args.start_time) / (args.end_time - args.start_time),
+        args.amount,
+    )
+
+
+@internal
+@view
+def _unclaimed(args: VestingArgs) -> uint256:
+    if self.is_fully_revoked:
+        return 0
+    claim_time: uint256 = min(block.timestamp, self.disabled_at)
+    return self._total_vested_at(args, claim_time) - self.total_claimed
+
+
+@external
+@view
+def unclaimed() -> uint256:
+    """
+    @notice Get the number of unclaimed, vested tokens for recipient
+    """
+    return self._unclaimed(self._args())
+
+
+@internal
+@view
+def _locked(args: VestingArgs) -> uint256:
+    if block.timestamp >= self.disabled_at:
+        return 0
+    return args.amount - self._total_vested_at(args, block.timestamp)
+
+
+@external
+@view
+def locked() -> uint256:
+    """
+    @notice Get the number of locked tokens for recipient
+    """
+    return self._locked(self._args())
+
+
+@external
+def claim(
+    beneficiary: address = msg.sender, amount: uint256 = max_value(uint256)
+) -> uint256:
+    """
+    @notice Claim tokens which have vested
+    @param beneficiary Address to transfer claimed tokens to
+    @param amount Amount of tokens to claim
+    """
+    args: VestingArgs = self._args()
+    self._check_sender_is_recipient(args)
+
+    return self._claim(args, beneficiary, amount)
+
+
+@external
+def claim_via_factory(sender: address, beneficiary: address) -> uint256:
+    """
+    @notice Claim all vested tokens for the recipient calling
+            `VestingEscrowFactory.batch_claim`
+    @param sender Address calling the factory, must be the recipient
+    @param beneficiary Address to transfer claimed tokens to
+    """
+    args: VestingArgs = self._args()
+    assert msg.sender == args.factory, "msg.sender not factory"
+    assert sender == args.recipient, "msg.sender not recipient"
+
+    return self._claim(args, beneficiary, max_value(uint256))
+
+
+@external
+def revoke_unvested():
+    """
+    @notice Disable further flow of tokens and revoke the unvested part to owner
+    """
+    args: VestingArgs = self._args()
+    owner: address = self._check_sender_is_owner_or_manager(args)
+
+    revokable: uint256 = self._locked(args)
+    assert revokable > 0, "nothing to revoke"
+    self.disabled_at = block.timestamp
+
+    assert ERC20(args.token).transfer(
+        owner, revokable, default_return_value=True
+    ), "transfer failed"
+
+    log UnvestedTokensRevoked(msg.sender, revokable)
+
+
+@external
+def revoke_all():
+    """
+    @notice Disable further flow of tokens and revoke all tokens to owner
+    """
+    args: VestingArgs = self._args()
+    owner: address = self._check_sender_is_owner(args)
+    assert args.is_fully_revokable, "not allowed for ordinary vesting"
+    assert not self.is_fully_revoked, "already fully revoked"
+
+    # NOTE: do not revoke extra tokens
+    revokable: uint256 = self._locked(args) + self._unclaimed(args)
+    assert revokable > 0, "nothing to revoke"
+
+    self.is_fully_revoked = True
+    self.disabled_at = block.timestamp
+
+    assert ERC20(args.token).transfer(
+        owner, revokable, default_return_value=True
+    ), "transfer failed"
+
+    log VestingFullyRevoked(msg.sender, revokable)
+
+
+@external
+def recover_erc20(token: address, amount: uint256):
+    """
+    @notice Recover ERC20 tokens to recipient
+    @param token Address of the ERC20 token to be recovered
+    @param amount Amount of the ERC20 token to be recovered
+    """
+    args: VestingArgs = self._args()
+    recoverable: uint256 = amount
+    if token == args.token:
+        available: uint256 = ERC20(token).balanceOf(self) - (
+            self._locked(args) + self._unclaimed(args)
+        )
+        recoverable = min(recoverable, available)
+    if recoverable > 0:
+        assert ERC20(token).transfer(
+            args.recipient, recoverable, default_return_value=True
+        ), "transfer failed"
+        log ERC20Recovered(token, recoverable)
+
+
+@external
+def recover_ether():
+    """
+    @notice Recover Ether to recipient
+    """
+    amount: uint256 = self.balance
+    if amount != 0:
+        self._safe_send_ether(self._args().recipient, amount)
+        log ETHRecovered(amount)
+
+
+@external
+def aragon_vote(abi_encoded_params: Bytes[1000]):
+    """
+    @notice Participate Aragon vote using all available tokens on the contract's balance
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_aragon_vote_calldata
+    """
+    args: VestingArgs = self._args()
+    self._check_sender_is_recipient(args)
+    raw_call(
+        self._voting_adapter(args),
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("aragon_vote(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@external
+def aragon_vote_via_factory(
+    sender: address, voting_adapter: address, abi_encoded_params: Bytes[1000]
+):
+    """
+    @notice Participate Aragon vote for the recipient calling
+            `VestingEscrowFactory.batch_aragon_vote`
+    @param sender Address calling the factory, must be the recipient
+    @param voting_adapter Voting adapter of the factory
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_aragon_vote_calldata
+    """
+    args: VestingArgs = self._args()
+    assert msg.sender == args.factory, "msg.sender not factory"
+    assert sender == args.recipient, "msg.sender not recipient"
+
+    raw_call(
+        voting_adapter,
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("aragon_vote(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@external
+def snapshot_set_delegate(abi_encoded_params: Bytes[1000]):
+    """
+    @notice Delegate Snapshot voting power of all available tokens on the contract's balance
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_snapshot_set_delegate_calldata
+    """
+    args: VestingArgs = self._args()
+    self._check_sender_is_recipient(args)
+    raw_call(
+        self._voting_adapter(args),
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("snapshot_set_delegate(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@external
+def delegate(abi_encoded_params: Bytes[1000]):
+    """
+    @notice Delegate voting power of all available tokens on the contract's balance
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_delegate_calldata
+    """
+    args: VestingArgs = self._args()
+    self._check_sender_is_recipient(args)
+    raw_call(
+        self._voting_adapter(args),
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("delegate(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@internal
+def _claim(args: VestingArgs, beneficiary: address, amount: uint256) -> uint256:
+    claimable: uint256 = min(self._unclaimed(args), amount)
+    self.total_claimed += claimable
+
+    assert ERC20(args.token).transfer(
+        beneficiary, claimable, default_return_value=True
+    ), "transfer failed"
+
+    log Claim(beneficiary, claimable)
+
+    return claimable
+
+
+@internal
+def _check_sender_is_owner_or_manager(args: VestingArgs) -> address:
+    # fetch each role once, the owner is returned to be reused by the caller
+    factory: IVestingEscrowFactory = IVestingEscrowFactory(args.factory)
+    owner: address = factory.owner()
+    if msg.sender != owner:
+        assert (
+            msg.sender == factory.manager()
+        ), "msg.sender not owner or manager"
+    return owner
+
+
+@internal
+def _check_sender_is_owner(args: VestingArgs) -> address:
+    owner: address = IVestingEscrowFactory(args.factory).owner()
+    assert msg.sender == owner, "msg.sender not owner"
+    return owner
+
+
+@internal
+def _check_sender_is_recipient(args: VestingArgs):
+    assert msg.sender == args.recipient, "msg.sender not recipient"
+
+
+@internal
+def _voting_adapter(args: VestingArgs) -> address:
+    voting_adapter: address = IVestingEscrowFactory(
+        args.factory
+    ).voting_adapter()
+    assert voting_adapter != empty(address), "voting adapter not set"
+    return voting_adapter
+
+
+@internal
+def _safe_send_ether(_to: address, _value: uint256):
+    """
+    @notice Overcome 2300 gas limit on simple send
+    """
+    _response: Bytes[32] = raw_call(
+        _to, empty(bytes32), value=_value, max_outsize=32
+    )
+    if len(_response) > 0:
+        assert convert(_response, bool), "ETH transfer failed"
+
+
+@internal
+@view
+def _args() -> VestingArgs:
+    """
+    @dev Copy the args from the proxy code once per call, the callers pass
+         them on instead of reading each field separately
+    """
+    # `self.code` is compiled to CODECOPY of the implementation code within
+    # the proxy delegatecall, EXTCODECOPY of the proxy is needed
+    proxy: address = self
+    return _abi_decode(
+        slice(proxy.code, ARGS_OFFSET, ARGS_SIZE), VestingArgs
+    )
@@ -0,0 +1,555 @@
+# @version 0.3.7
+
+"""
+@title Vesting Escrow Packed
+@author Curve Finance, Yearn Finance, Lido Finance
+@license GPL-3.0
+@notice Vests ERC20 tokens for a single address
+@dev ABI compatible drop-in for `VestingEscrow` intended to be deployed many
+     times via `VotingEscrowFactory`. Schedule timestamps, flags and amounts
+     share storage slots with the addresses, so the clone initialization
+     writes 4 storage slots instead of 10
+"""
+
+from vyper.interfaces import ERC20
+
+
+interface IVestingEscrowFactory:
+    def voting_adapter() -> address: nonpayable
+    def owner() -> address: nonpayable
+    def manager() -> address: nonpayable
+
+
+event VestingEscrowInitialized:
+    factory: indexed(address)
+    recipient: indexed(address)
+    token: indexed(address)
+    amount: uint256
+    start_time: uint256
+    end_time: uint256
+    cliff_length: uint256
+    is_fully_revokable: bool
+
+
+event Claim:
+    beneficiary: indexed(address)
+    claimed: uint256
+
+
+event UnvestedTokensRevoked:
+    recoverer: indexed(address)
+    revoked: uint256
+
+
+event VestingFullyRevoked:
+    recoverer: indexed(address)
+    revoked: uint256
+
+
+event ERC20Recovered:
+    token: address
+    amount: uint256
+
+
+event ETHRecovered:
+    amount: uint256
+
+
+ADDRESS_MASK: constant(uint256) = 2**160 - 1
+INITIALIZED_FLAG: constant(uint256) = 2**160
+FULLY_REVOKABLE_FLAG: constant(uint256) = 2**161
+FULLY_REVOKED_FLAG: constant(uint256) = 2**162
+
+TIMESTAMP_MASK: constant(uint256) = 2**64 - 1
+END_TIME_SHIFT: constant(int128) = 64
+CLIFF_LENGTH_SHIFT: constant(int128) = 128
+DISABLED_AT_SHIFT: constant(int128) = 192
+
+AMOUNT_MASK: constant(uint256) = 2**96 - 1
+AMOUNT_SHIFT: constant(int128) = 160
+
+# recipient | initialized | is_fully_revokable | is_fully_revoked
+recipient_data: uint256
+# start_time | end_time | cliff_length | disabled_at, 64 bits each
+schedule_data: uint256
+# factory | total_locked
+factory_data: uint256
+# token | total_claimed, the token is read along with the claimed amount
+token_data: uint256
+
+
+@external
+def __init__():
+    """
+    @notice Initialize source contract implementation.
+    """
+    # ensure that the original contract cannot be initialized
+    self.recipient_data = INITIALIZED_FLAG
+
+
+@external
+def initialize(
+    token: address,
+    amount: uint256,
+    recipient: address,
+    start_time: uint256,
+    end_time: uint256,
+    cliff_length: uint256,
+    is_fully_revokable: bool,
+    factory: address,
+) -> bool:
+    """
+    @notice Initialize the contract.
+    @dev This function is separate from `__init__` because of the factory pattern
+         used in `VestingEscrowFactory.deploy_vesting_contract`. It may be called
+         once per deployment.
+    @param token Address of the ERC20 token being distributed
+    @param amount Amount of the ERC20 token to be controleed by escrow
+    @param recipient Address to vest tokens for
+    @param start_time Epoch time at which token distribution starts
+    @param end_time Time until everything should be vested
+    @param cliff_length Duration after which the first portion vests
+    @param factory Address of the parent factory
+    """
+    assert self.recipient_data & INITIALIZED_FLAG == 0, "can only initialize once"
+    assert amount <= AMOUNT_MASK, "amount overflow"
+    assert end_time <= TIMESTAMP_MASK, "end time overflow"
+    assert start_time <= end_time, "start time after end time"
+    assert cliff_length <= end_time - start_time, "incorrect vesting cliff"
+
+    recipient_data: uint256 = convert(recipient, uint256) | INITIALIZED_FLAG
+    if is_fully_revokable:
+        recipient_data |= FULLY_REVOKABLE_FLAG
+    self.recipient_data = recipient_data
+
+    # disabled_at is set to maximum time
+    self.schedule_data = (
+        start_time
+        | shift(end_time, END_TIME_SHIFT)
+        | shift(cliff_length, CLIFF_LENGTH_SHIFT)
+        | shift(end_time, DISABLED_AT_SHIFT)
+    )
+
+    assert ERC20(token).balanceOf(self) >= amount, "insufficient balance"
+
+    self.factory_data = convert(factory, uint256) | shift(amount, AMOUNT_SHIFT)
+    self.token_data = convert(token, uint256)
+    log VestingEscrowInitialized(
+        factory,
+        recipient,
+        token,
+        amount,
+        start_time,
+        end_time,
+        cliff_length,
+        is_fully_revokable,
+    )
+
+    return True
+
+
+@external
+@view
+def recipient() -> address:
+    return self._recipient()
+
+
+@external
+@view
+def token() -> address:
+    return self._token()
+
+
+@external
+@view
+def factory() -> address:
+    return self._factory().address
+
+
+@external
+@view
+def total_locked() -> uint256:
+    return self._total_locked()
+
+
+@external
+@view
+def total_claimed() -> uint256:
+    return self._total_claimed()
+
+
+@external
+@view
+def start_time() -> uint256:
+    return self.schedule_data & TIMESTAMP_MASK
+
+
+@external
+@view
+def end_time() -> uint256:
+    return shift(self.schedule_data, -END_TIME_SHIFT) & TIMESTAMP_MASK
+
+
+@external
+@view
+def cliff_length() -> uint256:
+    return shift(self.schedule_data, -CLIFF_LENGTH_SHIFT) & TIMESTAMP_MASK
+
+
+@external
+@view
+def disabled_at() -> uint256:
+    return self._disabled_at()
+
+
+@external
+@view
+def is_fully_revokable() -> bool:
+    return self.recipient_data & FULLY_REVOKABLE_FLAG != 0
+
+
+@external
+@view
+def initialized() -> bool:
+    return self.recipient_data & INITIALIZED_FLAG != 0
+
+
+@external
+@view
+def is_fully_revoked() -> bool:
+    return self._is_fully_revoked()
+
+
+@internal
+@view
+def _total_vested_at(time: uint256) -> uint256:
+    schedule: uint256 = self.schedule_data
+    start: uint256 = schedule & TIMESTAMP_MASK
+    end: uint256 = shift(schedule, -END_TIME_SHIFT) & TIMESTAMP_MASK
+    cliff: uint256 = shift(schedule, -CLIFF_LENGTH_SHIFT) & TIMESTAMP_MASK
+    locked: uint256 = self._total_locked()
+    if time < start + cliff:
+        return 0
+    return min(locked * (time - start) / (end - start), locked)
+
+
+@internal
+@view
+def _unclaimed() -> uint256:
+    if self._is_fully_revoked():
+        return 0
+    claim_time: uint256 = min(block.timestamp, self._disabled_at())
+    return self._total_vested_at(claim_time) - self._total_claimed()
+
+
+@external
+@view
+def unclaimed() -> uint256:
+    """
+    @notice Get the number of unclaimed, vested tokens for recipient
+    """
+    return self._unclaimed()
+
+
+@internal
+@view
+def _locked() -> uint256:
+    if block.timestamp >= self._disabled_at():
+        return 0
+    return self._total_locked() - self._total_vested_at(block.timestamp)
+
+
+@external
+@view
+def locked() -> uint256:
+    """
+    @notice Get the number of locked tokens for recipient
+    """
+    return self._locked()
+
+
+@external
+def claim(
+    beneficiary: address = msg.sender, amount: uint256 = max_value(uint256)
+) -> uint256:
+    """
+    @notice Claim tokens which have vested
+    @param beneficiary Address to transfer claimed tokens to
+    @param amount Amount of tokens to claim
+    """
+    self._check_sender_is_recipient()
+
+    return self._claim(beneficiary, amount)
+
+
+@external
+def claim_via_factory(sender: address, beneficiary: address) -> uint256:
+    """
+    @notice Claim all vested tokens for the recipient calling
+            `VestingEscrowFactory.batch_claim`
+    @param sender Address calling the factory, must be the recipient
+    @param beneficiary Address to transfer claimed tokens to
+    """
+    assert msg.sender == self._factory().address, "msg.sender not factory"
+    assert sender == self._recipient(), "msg.sender not recipient"
+
+    return self._claim(beneficiary, max_value(uint256))
+
+
+@external
+def revoke_unvested():
+    """
+    @notice Disable further flow of tokens and revoke the unvested part to owner
+    """
+    owner: address = self._check_sender_is_owner_or_manager()
+
+    revokable: uint256 = self._locked()
+    assert revokable > 0, "nothing to revoke"
+    self._set_disabled_at(block.timestamp)
+
+    assert ERC20(self._token()).transfer(
+        owner, revokable, default_return_value=True
+    ), "transfer failed"
+
+    log UnvestedTokensRevoked(msg.sender, revokable)
+
+
+@external
+def revoke_all():
+    """
+    @notice Disable further flow of tokens and revoke all tokens to owner
+    """
+    owner: address = self._check_sender_is_owner()
+    recipient_data: uint256 = self.recipient_data
+    assert (
+        recipient_data & FULLY_REVOKABLE_FLAG != 0
+    ), "not allowed for ordinary vesting"
+    assert recipient_data & FULLY_REVOKED_FLAG == 0, "already fully revoked"
+
+    # NOTE: do not revoke extra tokens
+    revokable: uint256 = self._locked() + self._unclaimed()
+    assert revokable > 0, "nothing to revoke"
+
+    self.recipient_data = recipient_data | FULLY_REVOKED_FLAG
+    self._set_disabled_at(block.timestamp)
+
+    assert ERC20(self._token()).transfer(
+        owner, revokable, default_return_value=True
+    ), "transfer failed"
+
+    log VestingFullyRevoked(msg.sender, revokable)
+
+
+@external
+def recover_erc20(token: address, amount: uint256):
+    """
+    @notice Recover ERC20 tokens to recipient
+    @param token Address of the ERC20 token to be recovered
+    @param amount Amount of the ERC20 token to be recovered
+    """
+    recoverable: uint256 = amount
+    if token == self._token():
+        available: uint256 = ERC20(token).balanceOf(self) - (
+            self._locked() + self._unclaimed()
+        )
+        recoverable = min(recoverable, available)
+    if recoverable > 0:
+        assert ERC20(token).transfer(
+            self._recipient(), recoverable, default_return_value=True
+        ), "transfer failed"
+        log ERC20Recovered(token, recoverable)
+
+
+@external
+def recover_ether():
+    """
+    @notice Recover Ether to recipient
+    """
+    amount: uint256 = self.balance
+    if amount != 0:
+        self._safe_send_ether(self._recipient(), amount)
+        log ETHRecovered(amount)
+
+
+@external
+def aragon_vote(abi_encoded_params: Bytes[1000]):
+    """
+    @notice Participate Aragon vote using all available tokens on the contract's balance
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_aragon_vote_calldata
+    """
+    self._check_sender_is_recipient()
+    raw_call(
+        self._voting_adapter(),
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("aragon_vote(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@external
+def aragon_vote_via_factory(
+    sender: address, voting_adapter: address, abi_encoded_params: Bytes[1000]
+):
+    """
+    @notice Participate Aragon vote for the recipient calling
+            `VestingEscrowFactory.batch_aragon_vote`
+    @param sender Address calling the factory, must be the recipient
+    @param voting_adapter Voting adapter of the factory
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_aragon_vote_calldata
+    """
+    assert msg.sender == self._factory().address, "msg.sender not factory"
+    assert sender == self._recipient(), "msg.sender not recipient"
+
+    raw_call(
+        voting_adapter,
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("aragon_vote(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@external
+def snapshot_set_delegate(abi_encoded_params: Bytes[1000]):
+    """
+    @notice Delegate Snapshot voting power of all available tokens on the contract's balance
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_snapshot_set_delegate_calldata
+    """
+    self._check_sender_is_recipient()
+    raw_call(
+        self._voting_adapter(),
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("snapshot_set_delegate(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@external
+def delegate(abi_encoded_params: Bytes[1000]):
+    """
+    @notice Delegate voting power of all available tokens on the contract's balance
+    @param abi_encoded_params Abi encoded data for call. Can be obtained from VotingAdapter.encode_delegate_calldata
+    """
+    self._check_sender_is_recipient()
+    raw_call(
+        self._voting_adapter(),
+        _abi_encode(
+            abi_encoded_params,
+            method_id=method_id("delegate(bytes)"),
+        ),
+        is_delegate_call=True,
+    )
+
+
+@internal
+@view
+def _recipient() -> address:
+    return convert(self.recipient_data & ADDRESS_MASK, address)
+
+
+@internal
+@view
+def _token() -> address:
+    return convert(self.token_data & ADDRESS_MASK, address)
+
+
+@internal
+@view
+def _total_claimed() -> uint256:
+    return shift(self.token_data, -AMOUNT_SHIFT)
+
+
+@internal
+@view
+def _factory() -> IVestingEscrowFactory:
+    return IVestingEscrowFactory(
+        convert(self.factory_data & ADDRESS_MASK, address)
+    )
+
+
+@internal
+@view
+def _total_locked() -> uint256:
+    return shift(self.factory_data, -AMOUNT_SHIFT)
+
+
+@internal
+@view
+def _disabled_at() -> uint256:
+    return shift(self.schedule_data, -DISABLED_AT_SHIFT)
+
+
+@internal
+@view
+def _is_fully_revoked() -> bool:
+    return self.recipient_data & FULLY_REVOKED_FLAG != 0
+
+
+@internal
+def _set_disabled_at(disabled_at: uint256):
+    self.schedule_data = (
+        self.schedule_data & (2**192 - 1)
+    ) | shift(disabled_at, DISABLED_AT_SHIFT)
+
+
+@internal
+def _claim(beneficiary: address, amount: uint256) -> uint256:
+    claimable: uint256 = min(self._unclaimed(), amount)
+    # total_claimed <= total_locked, so it fits the amount bits
+    self.token_data += shift(claimable, AMOUNT_SHIFT)
+
+    assert ERC20(self._token()).transfer(
+        beneficiary, claimable, default_return_value=True
+    ), "transfer failed"
+
+    log Claim(beneficiary, claimable)
+
+    return claimable
+
+
+@internal
+def _check_sender_is_owner_or_manager() -> address:
+    # fetch each role once, the owner is returned to be reused by the caller
+    factory: IVestingEscrowFactory = self._factory()
+    owner: address = factory.owner()
+    if msg.sender != owner:
+        assert (
+            msg.sender == factory.manager()
+        ), "msg.sender not owner or manager"
+    return owner
+
+
+@internal
+def _check_sender_is_owner() -> address:
+    owner: address = self._factory().owner()
+    assert msg.sender == owner, "msg.sender not owner"
+    return owner
+
+
+@internal
+def _check_sender_is_recipient():
+    assert msg.sender == self._recipient(), "msg.sender not recipient"
+
+
+@internal
+def _voting_adapter() -> address:
+    voting_adapter: address = self._factory().voting_adapter()
+    assert voting_adapter != empty(address), "voting adapter not set"
+    return voting_adapter
+
+
+@internal
+def _safe_send_ether(_to: address, _value: uint256):
+    """
+    @notice Overcome 2300 gas limit on simple send
+    """
+    _response: Bytes[32] = raw_call(
+        _to, empty(bytes32), value=_value, max_outsize=32
+    )
+    if len(_response) > 0:
+        assert convert(_response, bool), "ETH transfer failed"
@@ -0,0 +1,92 @@
+# @version 0.3.7
+
+"""
+@title Vesting Lens
+@author Lido Finance
+@license GPL-3.0
+@notice Reads the state of many `VestingEscrow` contracts in a single call
+@dev View-only helper intended to be used off-chain via `eth_call`
+"""
+
+from vyper.interfaces import ERC20
+
+
+interface IVestingEscrow:
+    def recipient() -> address: view
+    def token() -> address: view
+    def start_time() -> uint256: view
+    def end_time() -> uint256: view
+    def cliff_length() -> uint256: view
+    def factory() -> address: view
+    def total_locked() -> uint256: view
+    def is_fully_revokable() -> bool: view
+    def total_claimed() -> uint256: view
+    def disabled_at() -> uint256: view
+    def initialized() -> bool: view
+    def is_fully_revoked() -> bool: view
+    def unclaimed() -> uint256: view
+    def locked() -> uint256: view
+
+
+struct EscrowState:
+    escrow: address
+    recipient: address
+    token: address
+    start_time: uint256
+    end_time: uint256
+    cliff_length: uint256
+    factory: address
+    total_locked: uint256
+    is_fully_revokable: bool
+    total_claimed: uint256
+    disabled_at: uint256
+    initialized: bool
+    is_fully_revoked: bool
+    unclaimed: uint256
+    locked: uint256
+    token_balance: uint256
+
+
+MAX_ESCROWS: constant(uint256) = 100
+
+
+@external
+@view
+def get_escrows_state(
+    escrows: DynArray[address, MAX_ESCROWS]
+) -> DynArray[EscrowState, MAX_ESCROWS]:
+    """
+    @notice Get public fields, unclaimed, locked and token balance of the escrows
+    @param escrows Addresses of the `VestingEscrow` contracts
+    """
+    result: DynArray[EscrowState, MAX_ESCROWS] = []
+    for escrow in escrows:
+        result.append(self._get_escrow_state(escrow))
+    return result
+
+
+@internal
+@view
+def _get_escrow_state(escrow: address) -> EscrowState:
+    vesting: IVestingEscrow = IVestingEscrow(escrow)
+    token: address = vesting.token()
+    return EscrowState(
+        {
+            escrow: escrow,
+            recipient: vesting.recipient(),
+            token: token,
+            start_time: vesting.start_time(),
+            end_time: vesting.end_time(),
+            cliff_length: vesting.cliff_length(),
+            factory: vesting.factory(),
+            total_locked: vesting.total_locked(),
+            is_fully_revokable: vesting.is_fully_revokable(),
+            total_claimed: vesting.total_claimed(),
+            disabled_at: vesting.disabled_at(),
+            initialized: vesting.initialized(),
+            is_fully_revoked: vesting.is_fully_revoked(),
+            unclaimed: vesting.unclaimed(),
+            locked: vesting.locked(),
+            token_balance: ERC20(token).balanceOf(escrow),
+        }
+    )
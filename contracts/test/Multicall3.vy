@@ -0,0 +1,39 @@
+# @version 0.3.7
+
+"""
+@notice Multicall3 stand-in for development chains
+@dev Implements `aggregate3` of https://github.com/mds1/multicall with bounded inputs
+"""
+
+
+struct Call3:
+    target: address
+    allowFailure: bool
+    callData: Bytes[MAX_DATA_SIZE]
+
+
+struct Result:
+    success: bool
+    returnData: Bytes[MAX_DATA_SIZE]
+
+
+MAX_CALLS: constant(uint256) = 128
+MAX_DATA_SIZE: constant(uint256) = 256
+
+
+@external
+@payable
+def aggregate3(calls: DynArray[Call3, MAX_CALLS]) -> DynArray[Result, MAX_CALLS]:
+    results: DynArray[Result, MAX_CALLS] = []
+    for c in calls:
+        success: bool = False
+        response: Bytes[MAX_DATA_SIZE] = b""
+        success, response = raw_call(
+            c.target,
+            c.callData,
+            max_outsize=MAX_DATA_SIZE,
+            revert_on_failure=False,
+        )
+        assert success or c.allowFailure, "Multicall3: call failed"
+        results.append(Result({success: success, returnData: response}))
+    return results
@@ -0,0 +1,94 @@
+"""
+Usage:
+    brownie run batch_claim escrows 0xrecipient [db]
+    brownie run batch_claim build 0xrecipient [beneficiary] [db]
+    brownie run batch_claim claim [beneficiary] [db]
+
+Escrows of the recipient are taken from the events index (see `indexer`), synced before the lookup,
+and filtered by the unclaimed amount read with VestingLens.
+"""
+
+import json
+from typing import NamedTuple, Optional, Sequence
+
+from brownie import VestingEscrowFactory, accounts  # type: ignore
+from eth_utils import to_checksum_address
+
+from scripts.indexer import find_synced_escrows
+from utils import log
+from utils.event_index import EventIndex, get_factory_address
+from utils.helpers import get_is_live, loadAccount
+from utils.lens import EscrowState, read_escrows_state
+
+# must not exceed VestingEscrowFactory.MAX_BATCH_SIZE
+CLAIM_BATCH_SIZE = 100
+
+
+class BatchClaim(NamedTuple):
+    """Single `VestingEscrowFactory.batch_claim` transaction"""
+
+    to: str
+    data: str
+    escrows: list[str]
+    amount: int  # unclaimed at the time of the build
+
+
+def escrows(recipient: str, db_path: Optional[str] = None) -> None:
+    """Print escrows of the recipient with tokens to claim"""
+    for state in find_synced_escrows(find_claimable_escrows, recipient, db_path):
+        log.info(state.escrow, state.unclaimed)
+
+
+def build(recipient: str, beneficiary: Optional[str] = None, db_path: Optional[str] = None) -> None:
+    """Print batch claim transactions to be sent by the recipient"""
+    factory = VestingEscrowFactory.at(get_factory_address())
+    batches = build_batch_claims(
+        factory, find_synced_escrows(find_claimable_escrows, recipient, db_path), beneficiary or recipient
+    )
+    print(json.dumps([batch._asdict() for batch in batches], indent=2))
+
+
+def claim(beneficiary: Optional[str] = None, db_path: Optional[str] = None) -> None:
+    """Claim from all escrows of the CLAIMER account (accounts[0] on development chains)"""
+    sender = loadAccount("CLAIMER") if get_is_live() else accounts[0]
+    beneficiary = beneficiary or sender.address
+    factory = VestingEscrowFactory.at(get_factory_address())
+    for batch in build_batch_claims(
+        factory, find_synced_escrows(find_claimable_escrows, sender.address, db_path), beneficiary
+    ):
+        tx = factory.batch_claim(batch.escrows, beneficiary, {"from": sender})
+        log.okay(f"Claimed {tx.return_value} from {len(batch.escrows)} escrows, gas used", tx.gas_used)
+
+
+def find_claimable_escrows(
+    index: EventIndex,
+    factory_address: str,
+    recipient: str,
+    lens=None,
+) -> list[EscrowState]:
+    """States of the recipient escrows created by the factory with non-zero unclaimed amount"""
+    created = index.escrows(factory=to_checksum_address(factory_address), recipient=to_checksum_address(recipient))
+    states = read_escrows_state([escrow.escrow for escrow in created], lens)
+    return [state for state in states if state.unclaimed > 0]
+
+
+def build_batch_claims(
+    factory,
+    states: Sequence[EscrowState],
+    beneficiary: str,
+    chunk_size: int = CLAIM_BATCH_SIZE,
+) -> list[BatchClaim]:
+    """Split the escrows into `batch_claim` calls of at most `chunk_size` escrows"""
+    claims = []
+    for i in range(0, len(states), chunk_size):
+        chunk = states[i : i + chunk_size]
+        chunk_escrows = [state.escrow for state in chunk]
+        claims.append(
+            BatchClaim(
+                to=factory.address,
+                data=factory.batch_claim.encode_input(chunk_escrows, beneficiary),
+                escrows=chunk_escrows,
+                amount=sum(state.unclaimed for state in chunk),
+            )
+        )
+    return claims
@@ -0,0 +1,138 @@
+"""
+Usage:
+    brownie run batch_vote build vote_id supports 0xrecipient [db]
+    brownie run batch_vote vote vote_id supports [db]
+
+Escrows of the recipient are taken from the events index (see `indexer`), synced before the lookup,
+and filtered by the token balance read with VestingLens.
+"""
+
+import json
+from typing import NamedTuple, Optional, Sequence
+
+from brownie import VestingEscrow, VestingEscrowFactory, VotingAdapter, accounts, web3  # type: ignore
+from eth_utils import to_checksum_address
+
+from scripts.indexer import find_synced_escrows
+from utils import log
+from utils.event_index import EventIndex, get_factory_address
+from utils.helpers import get_is_live, loadAccount
+from utils.lens import EscrowState, read_escrows_state
+
+# must not exceed VestingEscrowFactory.MAX_BATCH_SIZE
+VOTE_BATCH_SIZE = 100
+
+
+class BatchVote(NamedTuple):
+    """Single `VestingEscrowFactory.batch_aragon_vote` transaction"""
+
+    to: str
+    data: str
+    escrows: list[str]
+
+
+class VoteGasReport(NamedTuple):
+    """Estimated gas of voting with `VestingEscrow.aragon_vote` per escrow compared with the batches"""
+
+    per_escrow: list[int]
+    per_batch: list[int]
+
+    @property
+    def escrows_count(self) -> int:
+        return len(self.per_escrow)
+
+    @property
+    def per_escrow_total(self) -> int:
+        return sum(self.per_escrow)
+
+    @property
+    def batched_total(self) -> int:
+        return sum(self.per_batch)
+
+
+def build(vote_id, supports, recipient: str, db_path: Optional[str] = None) -> None:
+    """Print batch vote transactions to be sent by the recipient and their estimated gas"""
+    factory = VestingEscrowFactory.at(get_factory_address())
+    params = _encode_vote(factory, vote_id, supports)
+    batches = build_batch_votes(
+        factory, [state.escrow for state in find_synced_escrows(find_voting_escrows, recipient, db_path)], params
+    )
+    print(json.dumps([batch._asdict() for batch in batches], indent=2))
+    _log_gas_report(estimate_vote_gas(batches, params, recipient))
+
+
+def vote(vote_id, supports, db_path: Optional[str] = None) -> None:
+    """Vote from all escrows of the VOTER account (accounts[0] on development chains)"""
+    sender = loadAccount("VOTER") if get_is_live() else accounts[0]
+    factory = VestingEscrowFactory.at(get_factory_address())
+    params = _encode_vote(factory, vote_id, supports)
+    batches = build_batch_votes(
+        factory, [state.escrow for state in find_synced_escrows(find_voting_escrows, sender.address, db_path)], params
+    )
+    _log_gas_report(estimate_vote_gas(batches, params, sender.address))
+    for batch in batches:
+        tx = factory.batch_aragon_vote(batch.escrows, params, {"from": sender})
+        log.okay(f"Voted from {len(batch.escrows)} escrows, gas used", tx.gas_used)
+
+
+def find_voting_escrows(
+    index: EventIndex,
+    factory_address: str,
+    recipient: str,
+    lens=None,
+) -> list[EscrowState]:
+    """States of the recipient escrows created by the factory with tokens to vote with"""
+    created = index.escrows(factory=to_checksum_address(factory_address), recipient=to_checksum_address(recipient))
+    states = read_escrows_state([escrow.escrow for escrow in created], lens)
+    return [state for state in states if state.token_balance > 0]
+
+
+def build_batch_votes(
+    factory,
+    escrows: Sequence[str],
+    abi_encoded_params: str,
+    chunk_size: int = VOTE_BATCH_SIZE,
+) -> list[BatchVote]:
+    """Split the escrows into `batch_aragon_vote` calls of at most `chunk_size` escrows"""
+    votes = []
+    for i in range(0, len(escrows), chunk_size):
+        chunk = list(escrows[i : i + chunk_size])
+        votes.append(
+            BatchVote(
+                to=factory.address,
+                data=factory.batch_aragon_vote.encode_input(chunk, abi_encoded_params),
+                escrows=chunk,
+            )
+        )
+    return votes
+
+
+def estimate_vote_gas(batches: Sequence[BatchVote], abi_encoded_params: str, sender: str) -> VoteGasReport:
+    """Estimate gas of the batches and of voting from every escrow with a separate transaction"""
+    per_escrow = [
+        VestingEscrow.at(escrow).aragon_vote.estimate_gas(abi_encoded_params, {"from": sender})
+        for batch in batches
+        for escrow in batch.escrows
+    ]
+    per_batch = [web3.eth.estimate_gas({"from": sender, "to": batch.to, "data": batch.data}) for batch in batches]
+    return VoteGasReport(per_escrow=per_escrow, per_batch=per_batch)
+
+
+def _encode_vote(factory, vote_id, supports) -> str:
+    supports = supports if isinstance(supports, bool) else str(supports).lower() == "true"
+    return VotingAdapter.at(factory.voting_adapter()).encode_aragon_vote_calldata(int(vote_id), supports)
+
+
+def _log_gas_report(report: VoteGasReport) -> None:
+    if not report.escrows_count:
+        log.warn("No escrows to vote from")
+        return
+    log.info("Escrows to vote from", report.escrows_count)
+    log.info(
+        "Per escrow transactions gas",
+        f"{report.per_escrow_total} ({report.per_escrow_total // report.escrows_count} per escrow)",
+    )
+    log.info(
+        f"Batched in {len(report.per_batch)} transactions gas",
+        f"{report.batched_total} ({report.batched_total // report.escrows_count} per escrow)",
+    )
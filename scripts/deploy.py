@@ -1,13 +1,14 @@
-from brownie import VestingEscrow, VestingEscrowFactory, VotingAdapter
+from brownie import VestingEscrow, VestingEscrowFactory, VestingLens, VotingAdapter
 
 import utils.log as log
 from utils.deployed_state import read_or_update_state
+from utils.multicall import read_fields
 
 
 def do_deploy_escrow(tx_params):
     deployedState = read_or_update_state()
 
-    if deployedState.vestingEscrowAddress:
+    if deployedState.get("vestingEscrowAddress"):
         escrow_simple = VestingEscrow.at(deployedState.vestingEscrowAddress)
         log.warn("VestingEscrow already deployed at", deployedState.vestingEscrowAddress)
     else:
@@ -63,16 +64,17 @@ def do_deploy_voting_adapter(tx_params, deploy_args):
 
 
 def check_deployed_voting_adapter(voting_adapter, deploy_args):
-    assert voting_adapter.voting_contract_addr() == deploy_args.voting_addr, "Invalid aragon voting address"
+    fields = read_fields(voting_adapter, ["voting_contract_addr", "snapshot_delegate_contract_addr"])
+    assert fields["voting_contract_addr"] == deploy_args.voting_addr, "Invalid aragon voting address"
     assert (
-        voting_adapter.snapshot_delegate_contract_addr() == deploy_args.snapshot_delegate_addr
+        fields["snapshot_delegate_contract_addr"] == deploy_args.snapshot_delegate_addr
     ), "Invalid snapshot delegation address"
 
 
 def do_deploy_factory(tx_params, deploy_args):
     deployedState = read_or_update_state()
 
-    if deployedState.factoryAddress:
+    if deployedState.get("factoryAddress"):
         factory = VestingEscrowFactory.at(deployedState.factoryAddress)
         log.warn("VestingEscrowFactory already deployed at", deployedState.factoryAddress)
     else:
@@ -104,8 +106,32 @@ def do_deploy_factory(tx_params, deploy_args):
 
 
 def check_deployed_factory(factory, deploy_args):
-    assert factory.target() == deploy_args.target, "Invalid target"
-    assert factory.token() == deploy_args.token, "Invalid vesting token"
-    assert factory.voting_adapter() == deploy_args.voting_adapter, "Invalid voting_adapter"
-    assert factory.owner() == deploy_args.owner, "Invalid owner"
-    assert factory.manager() == deploy_args.manager, "Invalid manager"
+    fields = read_fields(factory, ["target", "token", "voting_adapter", "owner", "manager"])
+    assert fields["target"] == deploy_args.target, "Invalid target"
+    assert fields["token"] == deploy_args.token, "Invalid vesting token"
+    assert fields["voting_adapter"] == deploy_args.voting_adapter, "Invalid voting_adapter"
+    assert fields["owner"] == deploy_args.owner, "Invalid owner"
+    assert fields["manager"] == deploy_args.manager, "Invalid manager"
+
+
+def do_deploy_lens(tx_params):
+    deployedState = read_or_update_state()
+
+    if deployedState.get("vestingLensAddress"):
+        lens = VestingLens.at(deployedState.vestingLensAddress)
+        log.warn("VestingLens already deployed at", deployedState.vestingLensAddress)
+    else:
+        log.info("Deploying VestingLens...")
+        lens = VestingLens.deploy(tx_params)
+        log.info("> txHash:", lens.tx.txid)
+
+        read_or_update_state(
+            {
+                "vestingLensDeployer": tx_params["from"].address,
+                "vestingLensDeployTx": lens.tx.txid,
+                "vestingLensAddress": lens.address,
+            }
+        )
+        log.okay("VestingLens deployed at", lens.address)
+
+    return lens
@@ -0,0 +1,175 @@
+"""
+Usage:
+    brownie run indexer sync [factory] [db] [from_block]
+    brownie run indexer escrows [recipient] [db]
+    brownie run indexer balances [recipient] [db]
+"""
+
+from contextlib import nullcontext
+from typing import Callable, Optional, Sequence
+
+from brownie import VestingEscrow, VestingEscrowFactory, web3  # type: ignore
+from eth_utils import encode_hex, event_abi_to_log_topic, to_checksum_address
+
+from utils import log
+from utils.async_calls import async_batch_call, escrow_calls
+from utils.event_index import EscrowCreated, EscrowEvent, EventIndex, default_db_path, get_factory_address
+from utils.helpers import is_development_chain
+from utils.lens import EscrowState, get_params_cache, read_escrows_params
+
+BLOCK_CHUNK_SIZE = 10_000
+ADDRESSES_PER_QUERY = 1_000
+# blocks behind the head considered safe from reorgs on live networks
+CONFIRMATIONS = 64
+
+# event name -> (account field, amount field)
+ESCROW_EVENTS = {
+    "Claim": ("beneficiary", "claimed"),
+    "UnvestedTokensRevoked": ("recoverer", "revoked"),
+    "VestingFullyRevoked": ("recoverer", "revoked"),
+    "ERC20Recovered": ("token", "amount"),
+}
+
+
+def sync(factory_address: Optional[str] = None, db_path: Optional[str] = None, from_block=0) -> None:
+    """Index factory and escrows events up to the latest confirmed block"""
+    factory_address = get_factory_address(factory_address)
+    to_block = confirmed_block()
+
+    with EventIndex(db_path or default_db_path()) as index:
+        with log.block(f"Syncing events of {factory_address} up to block {to_block}"):
+            sync_events(index, factory_address, int(from_block), to_block)
+        log.okay("Escrows indexed", len(index.escrows(factory=to_checksum_address(factory_address))))
+        log.okay("Escrow events indexed", len(index.events()))
+
+
+def escrows(recipient: Optional[str] = None, db_path: Optional[str] = None) -> None:
+    """Print indexed escrows with their params, optionally filtered by recipient"""
+    with EventIndex(db_path or default_db_path()) as index:
+        created = index.escrows(recipient=recipient)
+        with get_params_cache() or nullcontext() as cache:
+            params_list = read_escrows_params([escrow.escrow for escrow in created], cache=cache)
+
+        for escrow, params in zip(created, params_list):
+            log.info(f"{escrow.escrow} recipient={escrow.recipient} block={escrow.block_number}")
+            log.note(
+                f"  total_locked={params.total_locked} start_time={params.start_time} end_time={params.end_time} "
+                f"cliff_length={params.cliff_length} is_fully_revokable={params.is_fully_revokable}"
+            )
+            for event in index.events(escrow=escrow.escrow):
+                log.note(f"  {event.event} account={event.account} amount={event.amount} block={event.block_number}")
+
+
+def balances(recipient: Optional[str] = None, db_path: Optional[str] = None) -> None:
+    """Print unclaimed and locked amounts of indexed escrows, read with concurrent view calls"""
+    with EventIndex(db_path or default_db_path()) as index:
+        addresses = [escrow.escrow for escrow in index.escrows(recipient=recipient)]
+
+    values = async_batch_call(escrow_calls(addresses, "unclaimed") + escrow_calls(addresses, "locked"))
+    for escrow, unclaimed, locked in zip(addresses, values, values[len(addresses) :]):
+        log.info(f"{escrow} unclaimed={unclaimed} locked={locked}")
+
+
+def sync_events(
+    index: EventIndex,
+    factory_address: str,
+    from_block: int = 0,
+    to_block: Optional[int] = None,
+    chunk_size: int = BLOCK_CHUNK_SIZE,
+) -> int:
+    """Fetch events in block range chunks starting after the last synced block, return the last synced block"""
+    factory_address = to_checksum_address(factory_address)
+    to_block = web3.eth.block_number if to_block is None else to_block
+    last_synced = index.last_synced_block(factory_address)
+    if last_synced is not None:
+        from_block = max(from_block, last_synced + 1)
+
+    factory_events = _decoders(VestingEscrowFactory.abi, ["VestingEscrowCreated"])
+    escrow_events = _decoders(VestingEscrow.abi, list(ESCROW_EVENTS))
+    known_escrows = [e.escrow for e in index.escrows(factory=factory_address)]
+
+    for start in range(from_block, to_block + 1, chunk_size):
+        end = min(start + chunk_size - 1, to_block)
+
+        created = [
+            _to_escrow_created(factory_events, entry)
+            for entry in _get_logs([factory_address], factory_events, start, end)
+        ]
+        # escrows created in this range may already have events in the same range
+        known_escrows.extend(c.escrow for c in created)
+        events = [
+            _to_escrow_event(escrow_events, entry) for entry in _get_logs(known_escrows, escrow_events, start, end)
+        ]
+
+        index.save_chunk(factory_address, end, created, events)
+
+    return to_block
+
+
+def confirmed_block() -> int:
+    """Latest block considered safe from reorgs, the latest block on development chains"""
+    if is_development_chain():
+        return web3.eth.block_number
+    return web3.eth.block_number - CONFIRMATIONS
+
+
+def find_synced_escrows(
+    find: Callable[[EventIndex, str, str], list[EscrowState]],
+    recipient: str,
+    db_path: Optional[str] = None,
+) -> list[EscrowState]:
+    """Sync the index of the FACTORY_ADDRESS factory up to the confirmed block and `find` the recipient escrows in it"""
+    factory_address = get_factory_address()
+    with EventIndex(db_path or default_db_path()) as index:
+        sync_events(index, factory_address, to_block=confirmed_block())
+        return find(index, factory_address, recipient)
+
+
+def _decoders(abi: list, names: Sequence[str]) -> dict:
+    """Map event topic to the web3 event used to decode the log"""
+    contract = web3.eth.contract(abi=abi)
+    events = [getattr(contract.events, name)() for name in names]
+    return {event_abi_to_log_topic(event.abi): event for event in events}
+
+
+def _get_logs(addresses: Sequence[str], decoders: dict, from_block: int, to_block: int) -> list:
+    entries = []
+    for i in range(0, len(addresses), ADDRESSES_PER_QUERY):
+        entries.extend(
+            web3.eth.get_logs(
+                {
+                    "address": list(addresses[i : i + ADDRESSES_PER_QUERY]),
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "topics": [[encode_hex(topic) for topic in decoders]],
+                }
+            )
+        )
+    return sorted(entries, key=lambda entry: (entry["blockNumber"], entry["logIndex"]))
+
+
+def _to_escrow_created(decoders: dict, entry) -> EscrowCreated:
+    event = decoders[bytes(entry["topics"][0])].processLog(entry)
+    return EscrowCreated(
+        escrow=event.args.escrow,
+        factory=event.address,
+        creator=event.args.creator,
+        recipient=event.args.recipient,
+        block_number=event.blockNumber,
+        tx_hash=event.transactionHash.hex(),
+        log_index=event.logIndex,
+    )
+
+
+def _to_escrow_event(decoders: dict, entry) -> EscrowEvent:
+    event = decoders[bytes(entry["topics"][0])].processLog(entry)
+    account_field, amount_field = ESCROW_EVENTS[event.event]
+    return EscrowEvent(
+        escrow=event.address,
+        event=event.event,
+        account=event.args[account_field],
+        amount=event.args[amount_field],
+        block_number=event.blockNumber,
+        tx_hash=event.transactionHash.hex(),
+        log_index=event.logIndex,
+    )
@@ -1,22 +1,18 @@
-from brownie import VestingEscrow, VestingEscrowFactory, VotingAdapter, network
+from brownie import VestingEscrow, VestingEscrowFactory, VestingLens, VotingAdapter, network
 
 import utils.log as log
-from scripts.deploy import do_deploy_escrow, do_deploy_factory, do_deploy_voting_adapter
+from scripts.deploy import do_deploy_escrow, do_deploy_factory, do_deploy_lens, do_deploy_voting_adapter
 from utils.config import get_common_deploy_args, prepare_factory_deploy_args, prepare_voting_adapter_deploy_args
 from utils.env import get_env
 from utils.helpers import get_deployer_account, pprint_map, proceedPrompt
 
-# environment
-WEB3_INFURA_PROJECT_ID = get_env("WEB3_INFURA_PROJECT_ID")
-ETHERSCAN_TOKEN = get_env("ETHERSCAN_TOKEN")
-
 
 def check_env():
-    if not WEB3_INFURA_PROJECT_ID:
+    if not get_env("WEB3_INFURA_PROJECT_ID"):
         log.error("`WEB3_INFURA_PROJECT_ID` env not found!")
         exit()
 
-    if network.show_active() == "mainnet" and not ETHERSCAN_TOKEN:
+    if network.show_active() == "mainnet" and not get_env("ETHERSCAN_TOKEN"):
         log.error("`ETHERSCAN_TOKEN` env not found!")
         exit()
 
@@ -129,3 +125,29 @@ def deploy_voting_adapter():
         log.info(f"The current network '{network.show_active()}' is not 'mainnet'. Source publication skipped")
 
     log.note("All deployed metadata saved to", f"./deployed-{network.show_active()}.json")
+
+
+def deploy_lens():
+    log.info("-= VestingLens deploy =-")
+    log.info("This script will deploy VestingLens contract")
+
+    check_env()
+    deployer = get_deployer_account()
+
+    log.note("NETWORK", network.show_active())
+    log.note("DEPLOYER", deployer.address)
+
+    proceedPrompt()
+
+    log.note(f"VestingLens deploy")
+    lens = do_deploy_lens({"from": deployer, "max_fee": "100 gwei", "priority_fee": "1 gwei"})
+
+    if network.show_active() == "mainnet":
+        proceed = log.prompt_yes_no("(Re)Try to publish source codes?")
+        if proceed:
+            VestingLens.publish_source(lens)
+            log.okay("Contract source published!")
+    else:
+        log.info(f"The current network '{network.show_active()}' is not 'mainnet'. Source publication skipped")
+
+    log.note("All deployed metadata saved to", f"./deployed-{network.show_active()}.json")
@@ -1,15 +1,27 @@
 """
 Usage:
     brownie run multisig_tx build input.csv [prod!] [nonce]
-    brownie run multisig_tx check 0xsafeTxHash input.csv
+    brownie run multisig_tx check 0xsafeTxHash[,0xsafeTxHash...] input.csv
+    brownie run multisig_tx manifest input.csv manifest.json
+
+Rows of the CSV are split into as many Safe transactions with consecutive nonces as needed to keep each of them
+under MULTISEND_GAS_LIMIT gas, 15M by default.
+
+With MANIFEST env set to a manifest signed by MANIFEST_SIGNER, `build` and `check` run in batch mode: the CSV
+checksum and the factory params are checked against the manifest, and the remaining questions are asked once in
+a summary at the end, or not at all with ASSUME_YES env set.
+
+`build` and `manifest` require FACTORY_ADDRESS env. `check` takes the factory from the deploy calls of the
+transactions, and only compares it with FACTORY_ADDRESS if the env is set.
 """
 
 import csv
 import os
 import sys
+from collections import defaultdict
 from datetime import datetime
 from hashlib import sha256
-from typing import NamedTuple, Sequence, TypedDict, Optional
+from typing import Optional, Sequence, TypedDict
 
 from ape_safe import ApeSafe, SafeTx
 from brownie import ERC20  # type: ignore
@@ -23,7 +35,15 @@ from web3 import HTTPProvider
 from web3._utils.encoding import to_json
 
 from utils import log
-from utils.helpers import chain_snapshot, pprint_map
+from utils.async_calls import async_read_escrows_state
+from utils.env import load_env
+from utils.factory_model import simulate_deployment
+from utils.helpers import chain_snapshot, loadAccount, pprint_map
+from utils.lens import EscrowState
+from utils.manifest import load_manifest, save_manifest, sign_manifest
+from utils.multicall import batch_call, read_fields
+from utils.multisend import DEFAULT_MULTISEND_GAS_LIMIT, decode_multisend, split_by_gas
+from utils.vesting_params import VestingParams, match_params
 
 LDO_ADDRESS = "0x5A98FcBEA516Cf06857215779Fd812CA3beF1B32"
 LDO_WHALE = "0x3e40D73EB977Dc6a537aF587D48316feE66E9C8c"
@@ -31,36 +51,70 @@ NOV_FIRST = 1667260800
 
 FRAME_RPC = "http://127.0.0.1:1248"
 
+FACTORY_FIELDS = ["owner", "target", "manager", "token"]
+
+
+class Prompts:
+    """Questions to the operator asked one by one, or in batch mode all at once in a summary"""
+
+    def __init__(self, batch: bool = False, assume_yes: bool = False):
+        self.batch = batch
+        self.assume_yes = assume_yes
+        self.pending: list[str] = []
+
+    def confirm(self, question: str) -> None:
+        """Ask the question, or defer it to the summary in batch mode, and abort the script if declined"""
+        if self.batch:
+            self.pending.append(question)
+            return
+
+        if not log.prompt_yes_no(question):
+            log.warn("Script aborted")
+            sys.exit(1)
+
+    def confirm_summary(self) -> None:
+        """Ask all the deferred questions at once"""
+        if not self.pending:
+            return
+
+        log.info("Confirmations required:")
+        for question in self.pending:
+            log.note(question)
+        self.pending = []
+
+        if self.assume_yes:
+            log.warn("Confirmed with ASSUME_YES")
+            return
+        if not log.prompt_yes_no("Confirm all of the above?"):
+            log.warn("Script aborted")
+            sys.exit(1)
+
 
 def build(csv_filename: str, non_empty_for_prod=None, nonce=None):
     """Build vesting contracts deployment tx by parameters defined in CSV file"""
+    config = _read_envs(["SAFE_ADDRESS", "FACTORY_ADDRESS"])
+    prompts, manifest = _batch_mode(config)
+
     is_prod = bool(non_empty_for_prod)
     if is_prod:
         log.warn("SCRIPT RAN IN PRODUCTION ENV")
-        if not log.prompt_yes_no("ARE YOU SURE YOU WANT TO CONTINUE?"):
-            log.warn("Script aborted")
-            return
+        prompts.confirm("ARE YOU SURE YOU WANT TO CONTINUE IN PRODUCTION ENV?")
 
     nonce = int(nonce) if nonce else None
     if nonce:
         log.warn(f"Using nonce={nonce}")
 
     _assert_mainnet_fork()
-    _check_frame_conn()
-
-    config = _read_envs(["SAFE_ADDRESS", "FACTORY_ADDRESS"])
+    _check_frame_conn(prompts)
 
     with log.block("Validating factory parameters"):
-        _print_factory_params(config["FACTORY_ADDRESS"])
-        if not log.prompt_yes_no("Are the factory params valid?"):
-            log.warn("Script aborted")
-            sys.exit(1)
+        _validate_factory_params(config["FACTORY_ADDRESS"], prompts, manifest)
 
     with log.block("Reading input file"):
-        raw_params_list = _read_csv(csv_filename)
-        params_list = tuple(VestingParams.from_tuple(p) for p in raw_params_list)
-        for num, params in enumerate(params_list):
-            _preview_vesting_params(num + 1, params)
+        params_list = _read_params(csv_filename, prompts, manifest)
+
+    with log.block("Simulating deployment"):
+        _simulate_deployment(params_list, config["SAFE_ADDRESS"], config["FACTORY_ADDRESS"])
 
     safe = ApeSafe(config["SAFE_ADDRESS"])
     ldo = ERC20.at(LDO_ADDRESS)
@@ -83,89 +137,150 @@ def build(csv_filename: str, non_empty_for_prod=None, nonce=None):
                 sys.exit(1)
 
             log.warn(msg)
-            if not log.prompt_yes_no("ARE YOU SURE YOU WANT TO CONTINUE?"):
-                log.warn("Script aborted")
-                sys.exit(1)
+            prompts.confirm(f"{msg}. ARE YOU SURE YOU WANT TO CONTINUE?")
 
     if not enough_ldo_on_safe:
         ldo.transfer(safe.address, vestings_sum, {"from": LDO_WHALE})
 
+    gas_limit = int(config.get("MULTISEND_GAS_LIMIT") or DEFAULT_MULTISEND_GAS_LIMIT)
+
     with chain_snapshot():
-        with log.block("Constructing multisend transaction"):
-
-            ldo.approve(factory, vestings_sum, {"from": safe.address})
-            for params in params_list:
-                factory.deploy_vesting_contract(
-                    params.amount,
-                    params.recipient,
-                    params.vesting_duration,
-                    params.vesting_start,
-                    params.cliff_length,
-                    params.is_fully_revokable,
-                    {"from": safe.address},
-                )
+        with log.block("Measuring deployment gas"):
+            approve_gas = ldo.approve(factory, vestings_sum, {"from": safe.address}).gas_used
+            deploy_gas = [_deploy_vesting_contract(factory, params, safe.address).gas_used for params in params_list]
+            # gas used by separate transactions overestimates the same calls inside a multisend
+            chunks = split_by_gas(deploy_gas, gas_limit, approve_gas)
+            log.info(f"Vestings split into {len(chunks)} transactions under {gas_limit:,} gas")
+            for num, chunk in enumerate(chunks):
+                gas = approve_gas + sum(deploy_gas[i] for i in chunk)
+                log.info(f"  Transaction {num + 1}: vestings {chunk.start + 1}-{chunk.stop}, ~{gas:,} gas")
 
+    with chain_snapshot():
+        with log.block("Constructing multisend transactions"):
             pending_nonce = safe.pending_nonce()
             nonce = nonce or pending_nonce
 
             if nonce != pending_nonce:
                 log.warn(f"Nonce mismatch: pending={pending_nonce}, used={nonce}")
-                if not log.prompt_yes_no("Continue?"):
-                    log.warn("Script aborted")
-                    return
-
-            safe_tx = safe.multisend_from_receipts(safe_nonce=nonce)
-
-    _preview_and_check_tx(safe, safe_tx, params_list)
-
-    log.info(f"SafeTX hash: {safe_tx.safe_tx_hash.hex()}")
-
-    if log.prompt_yes_no("Sign with frame?"):
-        safe.sign_with_frame(safe_tx, frame_rpc=FRAME_RPC)
-    elif log.prompt_yes_no("Sign manually?"):
-        _sign_safe_tx_manually(safe_tx)
-    elif is_prod:
-        log.error("Signature required")
-        return
+                prompts.confirm(f"Continue with nonce={nonce} while pending={pending_nonce}?")
+
+            safe_txs = []
+            for num, chunk in enumerate(chunks):
+                chunk_params = params_list[chunk.start : chunk.stop]
+                # every transaction approves only its own vestings to leave no allowance after a partial execution
+                receipts = [ldo.approve(factory, sum(p.amount for p in chunk_params), {"from": safe.address})]
+                receipts += [_deploy_vesting_contract(factory, params, safe.address) for params in chunk_params]
+                safe_txs.append((safe.multisend_from_receipts(receipts, safe_nonce=nonce + num), chunk_params))
+
+    # transactions are previewed in the order of their nonces on top of each other
+    for num, (safe_tx, chunk_params) in enumerate(safe_txs):
+        with log.block(f"Checking transaction {num + 1}/{len(safe_txs)} with nonce {safe_tx.safe_nonce}"):
+            _preview_and_check_tx(safe, safe_tx, chunk_params, gas_limit, prompts)
+
+    if prompts.batch and is_prod:
+        prompts.confirm(f"Sign and post {len(safe_txs)} transactions?")
+    prompts.confirm_summary()
+
+    for num, (safe_tx, _) in enumerate(safe_txs):
+        log.info(f"SafeTX {num + 1}/{len(safe_txs)} hash: {safe_tx.safe_tx_hash.hex()}")
+
+        # the only non-interactive signer is frame, it asks for the confirmation on the device itself
+        if (prompts.batch and is_prod) or (not prompts.batch and log.prompt_yes_no("Sign with frame?")):
+            safe.sign_with_frame(safe_tx, frame_rpc=FRAME_RPC)
+        elif not prompts.batch and log.prompt_yes_no("Sign manually?"):
+            _sign_safe_tx_manually(safe_tx)
+        elif is_prod:
+            log.error("Signature required")
+            return
 
-    if len(safe_tx.signatures):
-        log.info("Transaction signed")
+        if len(safe_tx.signatures):
+            log.info("Transaction signed")
 
     if not is_prod:
         log.warn("Testing flow is finished")
         return
 
-    if log.prompt_yes_no("Post transaction?"):
-        with log.block("Posting transaction"):
-            safe.post_transaction(safe_tx)
+    if prompts.batch or log.prompt_yes_no(f"Post {len(safe_txs)} transactions?"):
+        with log.block("Posting transactions"):
+            for safe_tx, _ in safe_txs:
+                safe.post_transaction(safe_tx)
 
     log.info("Visit multisig transactions queue page:")
     _print_safe_txs_queue_link(safe)
 
 
-def check(safe_tx_hash: str, csv_filename: str) -> None:
-    """Check the given safeTxHash against the given CSV"""
+def check(safe_tx_hashes: str, csv_filename: str) -> None:
+    """Check the given comma separated safeTxHashes, in the order of their nonces, against the given CSV"""
     _assert_mainnet_fork()
     config = _read_envs(["SAFE_ADDRESS"])
+    prompts, manifest = _batch_mode(config)
+    gas_limit = int(config.get("MULTISEND_GAS_LIMIT") or DEFAULT_MULTISEND_GAS_LIMIT)
+
+    safe = ApeSafe(config["SAFE_ADDRESS"])
+
+    safe_txs = []
+    for safe_tx_hash in safe_tx_hashes.split(","):
+        log.info(f"Retrieving transaction {safe_tx_hash} from Gnosis Safe")
+        safe_tx = safe.get_safe_tx_by_safe_tx_hash(safe_tx_hash)
+        safe_txs.append((safe_tx_hash, safe_tx, _deploy_calls(safe_tx)))
+
+    factory_address = _deployment_factory([call for _, _, calls in safe_txs for call in calls], config)
+
+    if manifest:
+        with log.block("Validating factory parameters"):
+            if manifest["factory"]["address"].lower() != factory_address.lower():
+                raise RuntimeError(
+                    f"Factory mismatch. Manifest: {manifest['factory']['address']}, transactions: {factory_address}"
+                )
+            _validate_factory_params(factory_address, prompts, manifest)
 
     with log.block("Reading input file"):
-        raw_params_list = _read_csv(csv_filename)
-        params_list = tuple(VestingParams.from_tuple(p) for p in raw_params_list)
-        for num, params in enumerate(params_list):
-            _preview_vesting_params(num + 1, params)
+        params_list = _read_params(csv_filename, prompts, manifest)
 
-    safe = ApeSafe(config["SAFE_ADDRESS"])
+    with log.block("Simulating deployment"):
+        _simulate_deployment(params_list, config["SAFE_ADDRESS"], factory_address)
+
+    offset = 0
+    for safe_tx_hash, safe_tx, calls in safe_txs:
+        chunk_params = params_list[offset : offset + len(calls)]
+        offset += len(calls)
+        with log.block(f"Checking transaction {safe_tx_hash} with nonce {safe_tx.safe_nonce}"):
+            _preview_and_check_tx(safe, safe_tx, chunk_params, gas_limit, prompts)
+
+    if offset != len(params_list):
+        raise RuntimeError(f"Vestings count mismatch. Expected: {len(params_list)}, deployed: {offset}")
+
+    prompts.confirm_summary()
+
+
+def manifest(csv_filename: str, manifest_filename: str) -> None:
+    """Sign the manifest of the CSV file and the factory params with the SIGNER account for the batch mode"""
+    _assert_mainnet_fork()
+    config = _read_envs(["SAFE_ADDRESS", "FACTORY_ADDRESS"])
+    prompts = Prompts(batch=True)
 
-    log.info("Retrieving transaction from Gnosis Safe")
-    safe_tx = safe.get_safe_tx_by_safe_tx_hash(safe_tx_hash)
-    _preview_and_check_tx(safe, safe_tx, params_list)
+    with log.block("Reading factory parameters"):
+        factory_params = _validate_factory_params(config["FACTORY_ADDRESS"], prompts, None)
+
+    with log.block("Reading input file"):
+        params_list = _read_params(csv_filename, prompts, None)
+
+    prompts.confirm(f"Sign the manifest of {len(params_list)} vestings?")
+    prompts.confirm_summary()
+
+    signer = loadAccount("SIGNER")
+    if not signer:
+        sys.exit(1)
+    body = {"csv_sha256": _get_file_sha256(csv_filename), "safe": config["SAFE_ADDRESS"], "factory": factory_params}
+    save_manifest(sign_manifest(body, signer.private_key), manifest_filename)
+    log.okay(f"Manifest signed by {signer.address} saved to", manifest_filename)
 
 
 def fake_factory() -> None:
     """Use to deploy factory for testing purpose"""
     from brownie import history
 
-    config = _read_envs()
+    config = _read_envs(["SAFE_ADDRESS"])
     safe = ApeSafe(config["SAFE_ADDRESS"])
     ldo = ERC20.at(LDO_ADDRESS)
 
@@ -191,7 +306,9 @@ def fake_factory() -> None:
     input("Press ENTER to exit...")
 
 
-def _preview_and_check_tx(safe: ApeSafe, safe_tx: SafeTx, params_list: Sequence["VestingParams"]):
+def _preview_and_check_tx(
+    safe: ApeSafe, safe_tx: SafeTx, params_list: Sequence[VestingParams], gas_limit: int, prompts: Prompts
+):
     vestings_sum = sum(p.amount for p in params_list)
     starting_balance = _ldo_balance(safe.address)
 
@@ -199,14 +316,17 @@ def _preview_and_check_tx(safe: ApeSafe, safe_tx: SafeTx, params_list: Sequence[
         # do not reset chain in testing to keep the fake factory and other contracts intact
         tx = safe.preview(safe_tx, reset=False)
 
+    with log.block("Check gas used by the transaction"):
+        log.info("Gas used", tx.gas_used)
+        assert tx.gas_used <= gas_limit, f"Gas used {tx.gas_used} exceeds the limit of {gas_limit}"
+
     with log.block("Check LDO balance change after simulation"):
         ending_balance = _ldo_balance(safe.address)
         assert starting_balance - ending_balance == vestings_sum, "LDOs difference after deploy mismatch"
 
     # give some time to inspect the output before to continue
-    if not log.prompt_yes_no("Continue?"):
-        log.warn("Script aborted")
-        sys.exit(1)
+    if not prompts.batch:
+        prompts.confirm("Continue?")
 
     with log.block("Check vestings"):
         _check_tx(tx, params_list)
@@ -218,10 +338,15 @@ class Config(TypedDict):
     FACTORY_ADDRESS: str
     SAFE_ADDRESS: str
     SKIP_LDO_CHECK: str
+    MULTISEND_GAS_LIMIT: str
+    MANIFEST: str
+    MANIFEST_SIGNER: str
+    ASSUME_YES: str
 
 
 def _read_envs(keys: Optional[list[str]] = None) -> Config:
     """Read environment variables to Config object"""
+    load_env()
     config = os.environ.copy()
 
     for k in config.copy():
@@ -236,12 +361,72 @@ def _read_envs(keys: Optional[list[str]] = None) -> Config:
     return Config(**config)
 
 
-def _read_csv(filename: str) -> list[tuple]:
+def _batch_mode(config: Config) -> tuple[Prompts, Optional[dict]]:
+    """Prompts and the verified manifest of the batch mode if MANIFEST env is set"""
+    if "MANIFEST" not in config:
+        if "ASSUME_YES" in config:
+            raise RuntimeError("ASSUME_YES requires MANIFEST")
+        return Prompts(), None
+
+    if "MANIFEST_SIGNER" not in config:
+        raise RuntimeError("MANIFEST_SIGNER is required to verify the manifest")
+
+    manifest = load_manifest(config["MANIFEST"], config["MANIFEST_SIGNER"])
+    log.okay(f"Manifest {config['MANIFEST']} signed by", manifest["signer"])
+    if manifest["safe"].lower() != config["SAFE_ADDRESS"].lower():
+        raise RuntimeError(f"Safe mismatch. Manifest: {manifest['safe']}, SAFE_ADDRESS: {config['SAFE_ADDRESS']}")
+
+    return Prompts(batch=True, assume_yes="ASSUME_YES" in config), manifest
+
+
+def _deploy_vesting_contract(factory: VestingEscrowFactory, params: VestingParams, sender: str) -> TransactionReceipt:
+    return factory.deploy_vesting_contract(
+        params.amount,
+        params.recipient,
+        params.vesting_duration,
+        params.vesting_start,
+        params.cliff_length,
+        params.is_fully_revokable,
+        {"from": sender},
+    )
+
+
+def _read_params(filename: str, prompts: Prompts, manifest: Optional[dict]) -> tuple[VestingParams, ...]:
+    """Read and preview vestings params of the CSV file"""
+    expected_sha256 = manifest["csv_sha256"] if manifest else None
+    params_list = tuple(VestingParams.from_tuple(p) for p in _read_csv(filename, prompts, expected_sha256))
+
+    if prompts.batch:
+        _print_vestings_table(params_list)
+        if not manifest:
+            prompts.confirm(f"Are the {len(params_list)} vestings params valid?")
+    else:
+        for num, params in enumerate(params_list):
+            _preview_vesting_params(num + 1, params, prompts)
+    return params_list
+
+
+def _simulate_deployment(params_list: Sequence[VestingParams], safe_address: str, factory_address: str) -> None:
+    """Run the vestings through the off-chain model of the factory to catch reverting rows before any RPC call"""
+    model, errors = simulate_deployment(params_list, safe_address, LDO_ADDRESS, factory_address)
+    for num, reason in errors:
+        log.error(f"Vesting #{num + 1} reverts", reason)
+    if errors:
+        sys.exit(1)
+
+    total = sum(p.amount for p in params_list)
+    log.okay(f"{len(model.escrows)} vestings of {(total / 10 ** 18):,} LDO in total pass the model checks")
+
+
+def _read_csv(filename: str, prompts: Prompts, expected_sha256: Optional[str] = None) -> list[tuple]:
     """Read checksum-protected CSV file"""
     chksum = _get_file_sha256(filename)
-    if not log.prompt_yes_no(f"File's checksum: {chksum}, is it correct?"):
-        log.warn("Aborted!")
-        sys.exit(1)
+    if expected_sha256:
+        if chksum != expected_sha256:
+            raise RuntimeError(f"File's checksum {chksum} doesn't match the manifest {expected_sha256}")
+        log.okay("File's checksum matches the manifest", chksum)
+    else:
+        prompts.confirm(f"File's checksum: {chksum}, is it correct?")
 
     with open(filename, encoding="utf-8") as f:
         reader = csv.reader(f, delimiter=",")
@@ -257,7 +442,7 @@ def _get_file_sha256(filename: str) -> str:
         return sha256(f.read()).hexdigest()
 
 
-def _preview_vesting_params(number: int, params: "VestingParams") -> None:
+def _preview_vesting_params(number: int, params: VestingParams, prompts: Prompts) -> None:
     log.info(f"Vesting {number} params:")
     log.info(f"  Recipient: {params.recipient}")
     total = params.amount / 10**18
@@ -269,9 +454,22 @@ def _preview_vesting_params(number: int, params: "VestingParams") -> None:
         log.info(f"  Cliff end: {_unix_time_to_date(NOV_FIRST)} (synthetic, actual cliff is before Nov 1st)")
     log.info(f"  Vesting end: {_unix_time_to_date(params.vesting_start + params.vesting_duration)}")
     log.info(f"  Fully revocable: {params.is_fully_revokable}")
-    if not log.prompt_yes_no(f"Are the vesting {number} params valid?"):
-        log.warn("Script aborted")
-        sys.exit(1)
+    prompts.confirm(f"Are the vesting {number} params valid?")
+
+
+def _print_vestings_table(params_list: Sequence[VestingParams]) -> None:
+    """Print the same values as `_preview_vesting_params` for all the vestings at once"""
+    log.info(f"{len(params_list)} vestings, {sum(p.amount for p in params_list) / 10**18:,.2f} LDO in total:")
+    print(f"{'#':>4}  {'Recipient':<42}  {'Amount, LDO':>18}  {'Start':<10}  {'Cliff end':<11}  {'End':<10}  Revocable")
+    for num, params in enumerate(params_list):
+        cliff_end = params.vesting_start + params.cliff_length
+        # synthetic cliff end is marked with an asterisk, the actual cliff is before Nov 1st
+        cliff = _unix_time_to_date(cliff_end) if cliff_end >= NOV_FIRST else _unix_time_to_date(NOV_FIRST) + "*"
+        print(
+            f"{num + 1:>4}  {params.recipient:<42}  {params.amount / 10**18:>18,.2f}  "
+            f"{_unix_time_to_date(params.vesting_start):<10}  {cliff:<11}  "
+            f"{_unix_time_to_date(params.vesting_start + params.vesting_duration):<10}  {params.is_fully_revokable}"
+        )
 
 
 def _unix_time_to_date(unix_time: int) -> str:
@@ -279,31 +477,6 @@ def _unix_time_to_date(unix_time: int) -> str:
     return datetime.utcfromtimestamp(unix_time).strftime("%Y-%m-%d")
 
 
-class VestingParams(NamedTuple):
-    """Tuple of parameters to read from CSV line"""
-
-    amount: int
-    recipient: str
-    vesting_duration: int
-    vesting_start: int
-    cliff_length: int
-    is_fully_revokable: bool
-
-    @classmethod
-    def from_tuple(cls, tupl: tuple) -> "VestingParams":
-        """Construct new VestingParams from tuple of strings"""
-        if len(tupl) != len(cls._fields):
-            raise ValueError("Fields length mismatch to construct VestingParams")
-        return cls(
-            int(tupl[0]),
-            tupl[1],
-            int(tupl[2]),
-            int(tupl[3]),
-            int(tupl[4]),
-            tupl[5] == "1",
-        )
-
-
 def _assert_mainnet_fork():
     """Check that scripts is running on mainnet-fork network"""
     if network.show_active() != "mainnet-fork":
@@ -311,27 +484,52 @@ def _assert_mainnet_fork():
         sys.exit(1)
 
 
-def _check_frame_conn():
+def _check_frame_conn(prompts: Prompts):
     """Check that frame connection is established"""
     p = HTTPProvider(FRAME_RPC)
     if not p.isConnected():
         log.warn("Frame connection is not established")
-        if not log.prompt_yes_no("Do you want to continue?"):
-            log.warn("Script aborted")
-            sys.exit(1)
+        prompts.confirm("Frame connection is not established, do you want to continue?")
+
 
+def _deploy_calls(safe_tx: SafeTx) -> list[tuple[str, bytes]]:
+    """(to, data) of the `deploy_vesting_contract` calls packed into the multisend transaction"""
+    deploy_selector = bytes.fromhex(VestingEscrowFactory.signatures["deploy_vesting_contract"][2:])
+    return [(to, data) for to, data in decode_multisend(safe_tx.data) if data[:4] == deploy_selector]
+
+
+def _deployment_factory(calls: Sequence[tuple[str, bytes]], config: Config) -> str:
+    """The factory all the deploy calls are sent to, checked against FACTORY_ADDRESS env if it is set"""
+    factories = {to.lower(): to for to, _ in calls}
+    if len(factories) != 1:
+        raise RuntimeError(
+            f"Transactions must deploy vestings with a single factory, found: {list(factories.values())}"
+        )
 
-def _print_factory_params(factory_address: str) -> None:
+    (factory_address,) = factories.values()
+    if "FACTORY_ADDRESS" in config and config["FACTORY_ADDRESS"].lower() != factory_address.lower():
+        raise RuntimeError(
+            f"Factory mismatch. FACTORY_ADDRESS: {config['FACTORY_ADDRESS']}, transactions: {factory_address}"
+        )
+    log.okay("Vestings are deployed by the factory", factory_address)
+    return factory_address
+
+
+def _validate_factory_params(factory_address: str, prompts: Prompts, manifest: Optional[dict]) -> dict:
+    """Print the factory params and compare them with the manifest or ask the operator"""
     factory = VestingEscrowFactory.at(factory_address)
-    pprint_map(
-        {
-            "address": factory_address,
-            "owner": factory.owner(),
-            "target": factory.target(),
-            "manager": factory.manager(),
-            "token": factory.token(),
-        }
-    )
+    params = {"address": factory_address, **read_fields(factory, FACTORY_FIELDS)}
+    pprint_map(params)
+
+    if manifest:
+        expected = manifest["factory"]
+        for field, value in params.items():
+            if str(value).lower() != str(expected.get(field, "")).lower():
+                raise RuntimeError(f"Factory {field} mismatch. Actual: {value}, manifest: {expected.get(field)}")
+        log.okay("Factory params match the manifest")
+    else:
+        prompts.confirm("Are the factory params valid?")
+    return {field: str(value) for field, value in params.items()}
 
 
 def _print_safe_txs_queue_link(safe: ApeSafe) -> None:
@@ -361,34 +559,39 @@ def _check_tx(tx: TransactionReceipt, params_list: Sequence[VestingParams]) -> N
     """Check contracts created by the transaction against the parsed vesting parameters"""
     log.info("Validate contracts from multisend transaction")
 
+    created = tx.events["VestingEscrowCreated"] if "VestingEscrowCreated" in tx.events else []
     with log.block("Check deployed contracts count"):
-        new_contracts_count = len(tx.new_contracts) if tx.new_contracts else 0
-        if len(params_list) != new_contracts_count:
+        if len(params_list) != len(created):
             raise RuntimeError(
-                f"Deployed contracts count mismatch. Expected: {len(params_list)}, actual: {new_contracts_count}"
+                f"Deployed contracts count mismatch. Expected: {len(params_list)}, actual: {len(created)}"
             )
 
-    address: str
-    for address in tx.new_contracts:
-        contract = VestingEscrow.at(address)
-        recipient = contract.recipient()
-        try:
-            [params] = [p for p in params_list if p.recipient == recipient]
-        except ValueError as e:
-            raise ValueError(f"Recipient {recipient} for {address=} was not found in source") from e
-        log.info(f"Testing {recipient=} vesting at {address=}")
-        _check_deployed_vesting(contract, params)
+    states = async_read_escrows_state([event["escrow"] for event in created])
+    with log.block("Match deployed contracts to source"):
+        for event, state in zip(created, states):
+            assert state.recipient == event["recipient"], f"{state.escrow}.recipient doesn't match the creation event"
+        rows = match_params([VestingParams.from_state(state) for state in states], params_list)
+
+    for state, row in zip(states, rows):
+        address = state.escrow
+        recipient = state.recipient
+        log.info(f"Testing {recipient=} vesting at {address=}, row {row + 1}")
+        _check_deployed_vesting(state, params_list[row])
         log.okay(f"Vesting at {address=} is valid")
 
+    _test_claims([(VestingEscrow.at(state.escrow), params_list[row]) for state, row in zip(states, rows)])
+    log.okay(f"All {len(states)} vestings are claimable")
+
 
-def _check_deployed_vesting(contract: VestingEscrow, params: VestingParams) -> None:
-    """Compare the values returned by contract view functions with the values of VestingParams argument"""
+def _check_deployed_vesting(state: EscrowState, params: VestingParams) -> None:
+    """Compare the vesting state read from the escrow views with the values of VestingParams argument"""
 
     def assert_field_value(field: str, expected):
-        actual = getattr(contract, field)()
-        assert actual == expected, f"{contract}.{field} = {actual}, expected: {expected}"
+        actual = getattr(state, field)
+        assert actual == expected, f"{state.escrow}.{field} = {actual}, expected: {expected}"
 
     with log.block("Checking vesting parameters"):
+        assert_field_value("token", LDO_ADDRESS)
         assert_field_value("total_locked", params.amount)
         assert_field_value("recipient", params.recipient)
         assert_field_value("start_time", params.vesting_start)
@@ -398,43 +601,50 @@ def _check_deployed_vesting(contract: VestingEscrow, params: VestingParams) -> N
         assert_field_value("initialized", True)
 
     with log.block("Checking vesting LDO balance"):
-        assert _ldo_balance(contract) == params.amount, "Vesting's LDO balance mismatch"
+        assert state.token_balance == params.amount, "Vesting's LDO balance mismatch"
 
-    _test_claim(contract, params)
 
+def _test_claims(vestings: Sequence[tuple[VestingEscrow, VestingParams]]) -> None:
+    """
+    Check the vestings can be claimed after the cliff and after the end on a single chain snapshot
 
-def _test_claim(vesting: VestingEscrow, params: VestingParams) -> None:
-    def assert_claimable(step: str):
-        assert vesting.unclaimed() > 0, f"Nothing to claim after {step}"
+    Instead of a snapshot per vesting and step, the chain moves forward once per distinct time and all the vestings
+    due at that time are claimed. A vesting claimed at the cliff only loses the end step if everything was already
+    vested at the cliff claim, when both steps are the same claim of the same amount.
+    """
+    ldo = ERC20.at(LDO_ADDRESS)
+
+    def assert_claimable(vesting: VestingEscrow, params: VestingParams, step: str):
         recipient = params.recipient
-        s = _ldo_balance(recipient)
+        unclaimed, s = batch_call([(vesting.unclaimed,), (ldo.balanceOf, recipient)])
+        assert unclaimed > 0, f"{vesting.address}: nothing to claim after {step}"
         assert vesting.claim({"from": recipient})
         e = _ldo_balance(recipient)
-        assert e > s, f"No balance change on claim() after {step}"
-
-    with chain_snapshot():
-        # 1. before start
-        with log.block("Testing claim before start"):
-            if params.vesting_start > chain.time():
-                assert vesting.unclaimed() == 0, "Unexpected claimable before start"
-
-    with chain_snapshot():
-        cliff_end = params.vesting_start + params.cliff_length
-        if cliff_end >= chain.time():
-            # 2. before cliff
-            with log.block("Testing claim before cliff"):
-                assert vesting.unclaimed() == 0, "Unexpected claimable before cliff"
-            chain.sleep(cliff_end - chain.time() + 1)
-            chain.mine()
-        # 3. after cliff
-        with log.block("Testing claim after cliff"):
-            assert_claimable(step="cliff")
+        assert e > s, f"{vesting.address}: no balance change on claim() after {step}"
 
     with chain_snapshot():
-        # 4. after end
-        vesting_end = params.vesting_start + params.vesting_duration
-        if vesting_end >= chain.time():
-            chain.sleep(vesting_end - chain.time() + 1)
-            chain.mine()
-        with log.block("Testing claim after end of the program"):
-            assert_claimable(step="end")
+        now = chain.time()
+        with log.block("Testing claim before start and before cliff"):
+            unclaimed = batch_call([(vesting.unclaimed,) for vesting, _ in vestings])
+            for (vesting, params), amount in zip(vestings, unclaimed):
+                if params.vesting_start > now:
+                    assert amount == 0, f"{vesting.address}: unexpected claimable before start"
+                if params.vesting_start + params.cliff_length >= now:
+                    assert amount == 0, f"{vesting.address}: unexpected claimable before cliff"
+
+        buckets: dict[int, list[tuple[VestingEscrow, VestingParams, str]]] = defaultdict(list)
+        for vesting, params in vestings:
+            cliff_end = params.vesting_start + params.cliff_length
+            vesting_end = params.vesting_start + params.vesting_duration
+            cliff_claim_time = cliff_end + 1 if cliff_end >= now else now
+            buckets[cliff_claim_time].append((vesting, params, "cliff"))
+            if cliff_claim_time < vesting_end:
+                buckets[vesting_end + 1 if vesting_end >= now else now].append((vesting, params, "end"))
+
+        for time in sorted(buckets):
+            with log.block(f"Testing {len(buckets[time])} claims at {_unix_time_to_date(time)}"):
+                if time > chain.time():
+                    chain.sleep(time - chain.time())
+                    chain.mine()
+                for vesting, params, step in buckets[time]:
+                    assert_claimable(vesting, params, step)
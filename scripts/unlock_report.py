@@ -0,0 +1,36 @@
+"""
+Usage:
+    brownie run unlock_report index [output] [step] [periods] [db]
+
+Forecast of the tokens unlocked per period across all the indexed escrows (see `indexer`), starting from the latest
+block. The escrows states are read with VestingLens, so claims and revocations are taken into account.
+`python -m utils.unlock_report` makes the same report from the escrow params CSV files without a node.
+"""
+
+from contextlib import nullcontext
+from typing import Optional
+
+from brownie import chain  # type: ignore
+
+from utils import log
+from utils.event_index import EventIndex, default_db_path
+from utils.lens import get_params_cache, read_escrows_state
+from utils.unlock_report import DEFAULT_PERIODS, STEPS, unlock_periods, write_periods
+from utils.vesting_schedule import VestingSchedule
+
+
+def index(output: Optional[str] = None, step: str = "week", periods=DEFAULT_PERIODS, db_path: Optional[str] = None):
+    """Write the unlock forecast of the indexed escrows to the .csv or .json output file, CSV to stdout without it"""
+    with EventIndex(db_path or default_db_path()) as event_index:
+        escrows = [escrow.escrow for escrow in event_index.escrows()]
+
+    with log.block(f"Reading the state of {len(escrows)} escrows"):
+        with get_params_cache() or nullcontext() as cache:
+            states = read_escrows_state(escrows, cache=cache)
+
+    start = chain.time()
+    step_seconds = STEPS[step]
+    schedule = VestingSchedule.from_states(state for state in states if state.initialized)
+    write_periods(unlock_periods(schedule, start, start + int(periods) * step_seconds, step_seconds), output)
+    if output:
+        log.okay("Unlock forecast saved to", output)
@@ -2,11 +2,19 @@ import json
 
 import pytest
 from brownie import ZERO_ADDRESS
+from brownie._config import CONFIG
 
-from tests.utils import mint_or_transfer_for_testing
+from tests.utils import mint_or_transfer_for_testing, move_chain_reset_point
+from utils.event_index import EventIndex
+from utils.immutable_args import deploy_immutable_args_blueprint
 
 WEEK = 7 * 24 * 60 * 60  # seconds
 YEAR = 365.25 * 24 * 60 * 60  # seconds
+# escrows of the `escrows` fixture
+ESCROWS_COUNT = 3
+
+# local network of every `--evm-backend`, see network-config.yaml
+EVM_BACKENDS = {"ganache": "development", "anvil": "anvil-dev"}
 
 
 fully_revocable = pytest.mark.parametrize("deployed_vesting", [pytest.param(1, id="fully_revocable")], indirect=True)
@@ -17,6 +25,12 @@ def isolation_setup(fn_isolation):
     pass
 
 
+@pytest.fixture(scope="module")
+def module_isolation(deployment, module_isolation):
+    """Brownie's module isolation, resetting the chain to the shared deployment instead of the genesis"""
+    yield
+
+
 @pytest.fixture(scope="session")
 def balance():
     return 10**20
@@ -90,26 +104,26 @@ def cliff():
     return int(1 * YEAR)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def token(ERC20, accounts, deployed):
     if deployed:
         return ERC20.at(deployed["factoryDeployConstructorArgs"]["token"])
     return ERC20.deploy("Lido Token", "LFI", 18, {"from": accounts[0]})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def voting(Voting, token, owner, deployed):
     if deployed:
         return Voting.at(deployed["votingAdapterDeployConstructorArgs"]["voting_addr"])
     return Voting.deploy(token, {"from": owner})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def snapshot_delegate(Delegate, owner):
     return Delegate.deploy({"from": owner})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def voting_adapter(
     VotingAdapter,
     owner,
@@ -122,12 +136,17 @@ def voting_adapter(
     return VotingAdapter.deploy(voting, snapshot_delegate, owner, {"from": owner})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def voting_adapter_for_update(VotingAdapter, owner, voting, snapshot_delegate):
     return VotingAdapter.deploy(voting, snapshot_delegate, owner, {"from": owner})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def vesting_lens(VestingLens, owner):
+    return VestingLens.deploy({"from": owner})
+
+
+@pytest.fixture(scope="session")
 def destructible(SelfDestructible, owner):
     return SelfDestructible.deploy({"from": owner})
 
@@ -147,18 +166,44 @@ def sleep_time(start_time, end_time):
     return (end_time - start_time) // 3
 
 
-@pytest.fixture(scope="module")
-def vesting_target(VestingEscrow, owner, deployed):
+@pytest.fixture(scope="session")
+def escrow_impl(VestingEscrow, VestingEscrowPacked, VestingEscrowImmutableArgs, cmd_opts):
+    """Contract of the escrow implementation used as the factory target"""
+    return {
+        "default": VestingEscrow,
+        "packed": VestingEscrowPacked,
+        "immutable-args": VestingEscrowImmutableArgs,
+    }[cmd_opts.escrow_impl]
+
+
+@pytest.fixture(scope="session")
+def factory_impl(VestingEscrowFactory, VestingEscrowFactoryImmutableArgs, cmd_opts):
+    if cmd_opts.escrow_impl == "immutable-args":
+        return VestingEscrowFactoryImmutableArgs
+    return VestingEscrowFactory
+
+
+@pytest.fixture(scope="session")
+def vesting_target(VestingEscrow, escrow_impl, owner, deployed):
     if deployed:
         return VestingEscrow.at(deployed["vestingEscrowAddress"])
-    return VestingEscrow.deploy({"from": owner})
+    return escrow_impl.deploy({"from": owner})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def factory_target(vesting_target, owner, cmd_opts):
+    """Escrow implementation or, in the immutable args mode, the proxy blueprint"""
+    if cmd_opts.escrow_impl == "immutable-args":
+        return deploy_immutable_args_blueprint(vesting_target, {"from": owner})
+    return vesting_target
+
+
+@pytest.fixture(scope="session")
 def vesting_factory(
     VestingEscrowFactory,
+    factory_impl,
     owner,
-    vesting_target,
+    factory_target,
     manager,
     token,
     voting_adapter,
@@ -166,8 +211,8 @@ def vesting_factory(
 ):
     if deployed:
         return VestingEscrowFactory.at(deployed["factoryAddress"])
-    return VestingEscrowFactory.deploy(
-        vesting_target,
+    return factory_impl.deploy(
+        factory_target,
         token,
         owner,
         manager,
@@ -176,7 +221,7 @@ def vesting_factory(
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def vesting_factory_with_invalid_token(
     VestingEscrowFactory,
     owner,
@@ -195,6 +240,30 @@ def vesting_factory_with_invalid_token(
     )
 
 
+@pytest.fixture(scope="session")
+def deployment(
+    chain,
+    token,
+    voting,
+    snapshot_delegate,
+    voting_adapter,
+    voting_adapter_for_update,
+    vesting_lens,
+    destructible,
+    vesting_target,
+    factory_target,
+    vesting_factory,
+    vesting_factory_with_invalid_token,
+):
+    """
+    Contracts deployed once per test process, every xdist worker has its own chain
+
+    All the session scoped contracts are deployed here before the first module runs, a contract deployed later
+    would be wiped by the reset after its module.
+    """
+    move_chain_reset_point(chain)
+
+
 @pytest.fixture(
     scope="module",
     params=[pytest.param(0, id="simple")],
@@ -256,6 +325,43 @@ def deployed_vesting_with_cliff(
     return VestingEscrow.at(tx.new_contracts[0])
 
 
+@pytest.fixture
+def deploy_escrows(vesting_factory, token, owner, recipient, balance, duration, start_time, cliff, deployed):
+    """
+    Factory deploying escrows in a single `deploy_vesting_contracts` batch funded with `balance`, returns the addresses
+
+    The escrows are of `recipient` unless `recipients` lists the recipient of every escrow, `with_cliff` and
+    `fully_revokable` apply to all of them or, as a sequence, to each one. The amounts differ by 1 wei.
+    """
+
+    def deploy(count=ESCROWS_COUNT, recipients=None, with_cliff=False, fully_revokable=False):
+        recipients = recipients or [recipient] * count
+        if isinstance(fully_revokable, bool):
+            fully_revokable = [fully_revokable] * len(recipients)
+        mint_or_transfer_for_testing(owner, owner, token, balance, deployed)
+        token.approve(vesting_factory, balance, {"from": owner})
+        amount = balance // len(recipients)
+        params = [
+            (amount - i, escrow_recipient, duration, start_time, cliff if with_cliff else 0, revokable)
+            for i, (escrow_recipient, revokable) in enumerate(zip(recipients, fully_revokable))
+        ]
+        return vesting_factory.deploy_vesting_contracts(params, {"from": owner}).return_value
+
+    return deploy
+
+
+@pytest.fixture
+def escrows(VestingEscrow, deploy_escrows):
+    return [VestingEscrow.at(escrow) for escrow in deploy_escrows()]
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Empty event index"""
+    with EventIndex(str(tmp_path / "escrows.sqlite")) as index:
+        yield index
+
+
 @pytest.fixture(scope="session")
 def cmd_opts(request):
     return request.config.option
@@ -283,3 +389,57 @@ def pytest_addoption(parser):
         help="Path to the deployment JSON file with addresses of deployed contracts."
         "Should be used only with --network=mainnet-fork",
     )
+    parser.addoption(
+        "--evm-backend",
+        action="store",
+        default=None,
+        choices=list(EVM_BACKENDS),
+        help="Run tests on a local chain of the given node instead of --network: ganache (the development network) "
+        "or anvil (the anvil-dev network of network-config.yaml)",
+    )
+    parser.addoption(
+        "--escrow-impl",
+        action="store",
+        default="default",
+        choices=["default", "packed", "immutable-args"],
+        help="Escrow implementation used as the factory target: VestingEscrow (default), VestingEscrowPacked or "
+        "VestingEscrowImmutableArgs deployed by VestingEscrowFactoryImmutableArgs",
+    )
+    parser.addoption(
+        "--update-gas-snapshots",
+        action="store_true",
+        default=False,
+        help="Record the gas used by the tests/gas/ benchmarks to tests/gas/snapshots.json instead of checking it",
+    )
+    parser.addoption(
+        "--gas-tolerance",
+        action="store",
+        type=float,
+        default=1.0,
+        help="Allowed gas increase over tests/gas/snapshots.json in percent",
+    )
+    parser.addoption(
+        "--gas-report",
+        action="store",
+        default=None,
+        help="Path to write the gas used by the tests/gas/ benchmarks along with the baseline values",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    """Switch to the network of `--evm-backend`, after brownie has taken the network of `--network`"""
+    backend = config.getoption("evm_backend")
+    if backend is None:
+        return
+    if config.getoption("network"):
+        raise pytest.UsageError("--evm-backend and --network can't be used together")
+    if config.getoption("deploy_json"):
+        raise pytest.UsageError("--deploy-json needs a fork of the deployed network, not a local --evm-backend")
+
+    network = EVM_BACKENDS[backend]
+    if network not in CONFIG.networks:
+        raise pytest.UsageError(
+            f"Network {network} is missing, add it with `brownie networks import network-config.yaml True`"
+        )
+    CONFIG.argv["network"] = network
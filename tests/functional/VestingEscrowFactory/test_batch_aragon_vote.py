@@ -0,0 +1,65 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+pytestmark = pytest.mark.no_deploy
+
+
+def test_batch_aragon_vote(escrows, vesting_factory, voting_adapter, voting, token, recipient):
+    vote_id = 154
+    supports = True
+    data = voting_adapter.encode_aragon_vote_calldata(vote_id, supports)
+    tx = vesting_factory.batch_aragon_vote(escrows, data, {"from": recipient})
+
+    assert len(tx.events["CastVote"]) == len(escrows)
+    for event, escrow in zip(tx.events["CastVote"], escrows):
+        assert event.address == voting
+        assert event["voteId"] == vote_id
+        assert event["voter"] == escrow
+        assert event["supports"] == supports
+        assert event["stake"] == token.balanceOf(escrow)
+
+
+def test_batch_aragon_vote_after_upgrade(
+    escrows, vesting_factory, voting_adapter, voting_adapter_for_update, owner, recipient
+):
+    vesting_factory.update_voting_adapter(voting_adapter_for_update, {"from": owner})
+    data = voting_adapter.encode_aragon_vote_calldata(154, True)
+    tx = vesting_factory.batch_aragon_vote(escrows, data, {"from": recipient})
+    assert len(tx.events["CastVote"]) == len(escrows)
+
+
+def test_batch_aragon_vote_adapter_not_set(escrows, vesting_factory, voting_adapter, owner, recipient):
+    vesting_factory.update_voting_adapter(ZERO_ADDRESS, {"from": owner})
+    data = voting_adapter.encode_aragon_vote_calldata(154, True)
+    with brownie.reverts("voting adapter not set"):
+        vesting_factory.batch_aragon_vote(escrows, data, {"from": recipient})
+
+
+def test_batch_aragon_vote_after_claim_all(escrows, vesting_factory, voting_adapter, recipient, chain, end_time):
+    chain.sleep(end_time - chain.time())
+    escrows[1].claim({"from": recipient})
+    data = voting_adapter.encode_aragon_vote_calldata(154, True)
+    with brownie.reverts("insufficient balance"):
+        vesting_factory.batch_aragon_vote(escrows, data, {"from": recipient})
+
+
+def test_batch_aragon_vote_from_not_recipient(escrows, vesting_factory, voting_adapter, not_recipient):
+    data = voting_adapter.encode_aragon_vote_calldata(154, True)
+    with brownie.reverts("msg.sender not recipient"):
+        vesting_factory.batch_aragon_vote(escrows, data, {"from": not_recipient})
+
+
+def test_batch_aragon_vote_escrow_of_other_factory(
+    escrows, factory_impl, factory_target, token, owner, manager, voting_adapter, recipient
+):
+    other_factory = factory_impl.deploy(factory_target, token, owner, manager, voting_adapter, {"from": owner})
+    data = voting_adapter.encode_aragon_vote_calldata(154, True)
+    with brownie.reverts("msg.sender not factory"):
+        other_factory.batch_aragon_vote(escrows, data, {"from": recipient})
+
+
+def test_aragon_vote_via_factory_directly(escrows, voting_adapter, recipient):
+    data = voting_adapter.encode_aragon_vote_calldata(154, True)
+    with brownie.reverts("msg.sender not factory"):
+        escrows[0].aragon_vote_via_factory(recipient, voting_adapter, data, {"from": recipient})
@@ -0,0 +1,59 @@
+import brownie
+import pytest
+
+pytestmark = pytest.mark.no_deploy
+
+
+def test_batch_claim(escrows, vesting_factory, token, recipient, chain, end_time):
+    chain.sleep(end_time - chain.time())
+    tx = vesting_factory.batch_claim(escrows, {"from": recipient})
+
+    total = sum(escrow.total_locked() for escrow in escrows)
+    assert tx.return_value == total
+    assert token.balanceOf(recipient) == total
+    assert len(tx.events["Claim"]) == len(escrows)
+    for escrow in escrows:
+        assert escrow.unclaimed() == 0
+        assert escrow.total_claimed() == escrow.total_locked()
+
+
+def test_batch_claim_beneficiary(escrows, vesting_factory, token, recipient, random_guy, chain, end_time):
+    chain.sleep(end_time - chain.time())
+    tx = vesting_factory.batch_claim(escrows, random_guy, {"from": recipient})
+
+    assert token.balanceOf(random_guy) == tx.return_value
+    assert token.balanceOf(recipient) == 0
+    assert all(event["beneficiary"] == random_guy for event in tx.events["Claim"])
+
+
+def test_batch_claim_partially_vested(escrows, vesting_factory, token, recipient, chain, start_time, sleep_time):
+    chain.sleep(start_time - chain.time() + sleep_time)
+    tx = vesting_factory.batch_claim(escrows, {"from": recipient})
+
+    assert tx.return_value == sum(event["claimed"] for event in tx.events["Claim"])
+    assert token.balanceOf(recipient) == tx.return_value
+    assert all(escrow.unclaimed() == 0 for escrow in escrows)
+
+
+def test_batch_claim_empty(vesting_factory, recipient):
+    tx = vesting_factory.batch_claim([], {"from": recipient})
+    assert tx.return_value == 0
+
+
+def test_batch_claim_from_not_recipient(escrows, vesting_factory, not_recipient, chain, end_time):
+    chain.sleep(end_time - chain.time())
+    with brownie.reverts("msg.sender not recipient"):
+        vesting_factory.batch_claim(escrows, {"from": not_recipient})
+
+
+def test_batch_claim_escrow_of_other_factory(
+    escrows, factory_impl, factory_target, token, owner, manager, voting_adapter, recipient
+):
+    other_factory = factory_impl.deploy(factory_target, token, owner, manager, voting_adapter, {"from": owner})
+    with brownie.reverts("msg.sender not factory"):
+        other_factory.batch_claim(escrows, {"from": recipient})
+
+
+def test_claim_via_factory_directly(escrows, recipient):
+    with brownie.reverts("msg.sender not factory"):
+        escrows[0].claim_via_factory(recipient, recipient, {"from": recipient})
@@ -0,0 +1,93 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+from tests.utils import mint_or_transfer_for_testing
+
+pytestmark = pytest.mark.no_deploy
+
+
+@pytest.fixture()
+def initial_funding(token, balance, vesting_factory, owner, deployed):
+    mint_or_transfer_for_testing(owner, owner, token, balance, deployed)
+    token.approve(vesting_factory, balance, {"from": owner})
+
+
+@pytest.fixture()
+def params_list(accounts, balance, start_time, duration, cliff):
+    return [
+        (balance // 2, accounts[1], duration, start_time, cliff, False),
+        (balance // 4, accounts[2], duration * 2, start_time + 100, 0, True),
+        (balance // 4, accounts[3], duration, start_time, cliff, False),
+    ]
+
+
+@pytest.mark.usefixtures("initial_funding")
+def test_deploy_batch(VestingEscrow, owner, vesting_factory, token, params_list):
+    tx = vesting_factory.deploy_vesting_contracts(params_list, {"from": owner})
+
+    assert len(tx.new_contracts) == len(params_list)
+    assert tx.return_value == tx.new_contracts
+    assert len(tx.events["VestingEscrowCreated"]) == len(params_list)
+
+    for escrow_address, params in zip(tx.return_value, params_list):
+        amount, recipient, vesting_duration, vesting_start, cliff_length, is_fully_revokable = params
+        escrow = VestingEscrow.at(escrow_address)
+        assert escrow.token() == token
+        assert escrow.total_locked() == amount
+        assert escrow.recipient() == recipient
+        assert escrow.start_time() == vesting_start
+        assert escrow.end_time() == vesting_start + vesting_duration
+        assert escrow.cliff_length() == cliff_length
+        assert escrow.is_fully_revokable() == is_fully_revokable
+        assert escrow.factory() == vesting_factory
+        assert token.balanceOf(escrow) == amount
+
+
+@pytest.mark.usefixtures("initial_funding")
+def test_deploy_batch_single_transfer_from(owner, vesting_factory, token, params_list, balance):
+    tx = vesting_factory.deploy_vesting_contracts(params_list, {"from": owner})
+
+    transfers = tx.events["Transfer"]
+    assert len(transfers) == len(params_list) + 1
+    assert transfers[0]["_from"] == owner
+    assert transfers[0]["_to"] == vesting_factory
+    assert transfers[0]["_value"] == balance
+    assert all(t["_from"] == vesting_factory for t in list(transfers)[1:])
+    assert token.balanceOf(vesting_factory) == 0
+    assert token.allowance(owner, vesting_factory) == 0
+
+
+def test_deploy_batch_no_approve(owner, vesting_factory, params_list):
+    with brownie.reverts(""):
+        vesting_factory.deploy_vesting_contracts(params_list, {"from": owner})
+
+
+@pytest.mark.usefixtures("initial_funding")
+def test_deploy_batch_empty(owner, vesting_factory):
+    with brownie.reverts("empty batch"):
+        vesting_factory.deploy_vesting_contracts([], {"from": owner})
+
+
+@pytest.mark.usefixtures("initial_funding")
+def test_deploy_batch_zero_recipient(owner, vesting_factory, params_list):
+    amount, _, vesting_duration, vesting_start, cliff_length, is_fully_revokable = params_list[-1]
+    params_list[-1] = (amount, ZERO_ADDRESS, vesting_duration, vesting_start, cliff_length, is_fully_revokable)
+    with brownie.reverts("zero recipient"):
+        vesting_factory.deploy_vesting_contracts(params_list, {"from": owner})
+
+
+@pytest.mark.usefixtures("initial_funding")
+def test_deploy_batch_invalid_cliff(owner, vesting_factory, params_list):
+    amount, recipient, vesting_duration, vesting_start, _, is_fully_revokable = params_list[0]
+    params_list[0] = (amount, recipient, vesting_duration, vesting_start, vesting_duration + 1, is_fully_revokable)
+    with brownie.reverts("incorrect vesting cliff"):
+        vesting_factory.deploy_vesting_contracts(params_list, {"from": owner})
+
+
+@pytest.mark.usefixtures("initial_funding")
+def test_deploy_batch_invalid_amount(owner, vesting_factory, params_list):
+    _, recipient, vesting_duration, vesting_start, cliff_length, is_fully_revokable = params_list[0]
+    params_list[0] = (0, recipient, vesting_duration, vesting_start, cliff_length, is_fully_revokable)
+    with brownie.reverts("incorrect amount"):
+        vesting_factory.deploy_vesting_contracts(params_list, {"from": owner})
@@ -0,0 +1,12 @@
+from brownie import ZERO_ADDRESS
+
+
+def test_roles(vesting_factory, owner, manager, voting_adapter):
+    assert vesting_factory.roles() == (owner, manager, voting_adapter)
+
+
+def test_roles_after_change(vesting_factory, owner, random_guy, voting_adapter_for_update):
+    vesting_factory.change_manager(ZERO_ADDRESS, {"from": owner})
+    vesting_factory.update_voting_adapter(voting_adapter_for_update, {"from": owner})
+    vesting_factory.change_owner(random_guy, {"from": owner})
+    assert vesting_factory.roles() == (random_guy, ZERO_ADDRESS, voting_adapter_for_update)
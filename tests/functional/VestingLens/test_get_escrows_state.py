@@ -0,0 +1,69 @@
+from tests.conftest import fully_revocable
+
+
+def _assert_state_matches(state, escrow, token):
+    assert state["escrow"] == escrow
+    assert state["recipient"] == escrow.recipient()
+    assert state["token"] == escrow.token()
+    assert state["start_time"] == escrow.start_time()
+    assert state["end_time"] == escrow.end_time()
+    assert state["cliff_length"] == escrow.cliff_length()
+    assert state["factory"] == escrow.factory()
+    assert state["total_locked"] == escrow.total_locked()
+    assert state["is_fully_revokable"] == escrow.is_fully_revokable()
+    assert state["total_claimed"] == escrow.total_claimed()
+    assert state["disabled_at"] == escrow.disabled_at()
+    assert state["initialized"] == escrow.initialized()
+    assert state["is_fully_revoked"] == escrow.is_fully_revoked()
+    assert state["unclaimed"] == escrow.unclaimed()
+    assert state["locked"] == escrow.locked()
+    assert state["token_balance"] == token.balanceOf(escrow)
+
+
+def test_empty(vesting_lens):
+    assert vesting_lens.get_escrows_state([]) == []
+
+
+def test_state_after_deploy(vesting_lens, deployed_vesting, token):
+    [state] = vesting_lens.get_escrows_state([deployed_vesting])
+    _assert_state_matches(state, deployed_vesting, token)
+
+
+def test_state_after_claim(vesting_lens, deployed_vesting, token, recipient, chain, start_time, sleep_time):
+    chain.sleep(start_time - chain.time() + sleep_time)
+    deployed_vesting.claim({"from": recipient})
+    chain.sleep(1000)
+    chain.mine()
+
+    [state] = vesting_lens.get_escrows_state([deployed_vesting])
+    assert state["total_claimed"] > 0
+    assert state["unclaimed"] > 0
+    _assert_state_matches(state, deployed_vesting, token)
+
+
+def test_state_after_revoke_unvested(vesting_lens, deployed_vesting, token, owner, chain, start_time, sleep_time):
+    chain.sleep(start_time - chain.time() + sleep_time)
+    deployed_vesting.revoke_unvested({"from": owner})
+
+    [state] = vesting_lens.get_escrows_state([deployed_vesting])
+    assert state["locked"] == 0
+    _assert_state_matches(state, deployed_vesting, token)
+
+
+@fully_revocable
+def test_state_after_revoke_all(vesting_lens, deployed_vesting, token, owner):
+    deployed_vesting.revoke_all({"from": owner})
+
+    [state] = vesting_lens.get_escrows_state([deployed_vesting])
+    assert state["is_fully_revoked"] is True
+    assert state["token_balance"] == 0
+    _assert_state_matches(state, deployed_vesting, token)
+
+
+def test_many_escrows(vesting_lens, deployed_vesting, deployed_vesting_with_cliff, token):
+    escrows = [deployed_vesting, deployed_vesting_with_cliff, deployed_vesting]
+    states = vesting_lens.get_escrows_state(escrows)
+
+    assert len(states) == len(escrows)
+    for state, escrow in zip(states, escrows):
+        _assert_state_matches(state, escrow, token)
@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+GAS_SNAPSHOTS_FILE = os.path.join(os.path.dirname(__file__), "snapshots.json")
+
+
+class GasSnapshots:
+    """Gas used by the contract functions, stored per contract in the committed `snapshots.json` baseline"""
+
+    def __init__(self, filename, update, tolerance):
+        self.filename = filename
+        self.update = update
+        # gas used varies slightly with the calldata (addresses, timestamps) between the test runs
+        self.tolerance = tolerance
+        self.measured = {}
+        with open(filename) as f:
+            self.snapshots = json.load(f)
+
+    def check(self, group, name, tx):
+        """Fail if the transaction used more gas than the baseline allows, record it in the update mode"""
+        print(f"\n{group}.{name}: {tx.gas_used}")
+        self.measured.setdefault(group, {})[name] = tx.gas_used
+        if self.update:
+            self.snapshots.setdefault(group, {})[name] = tx.gas_used
+            return
+        expected = self.snapshots.get(group, {}).get(name)
+        assert expected is not None, f"no gas snapshot for {group}.{name}, run with --update-gas-snapshots"
+        limit = expected * (1 + self.tolerance / 100)
+        assert tx.gas_used <= limit, f"{group}.{name} gas regression: {expected} -> {tx.gas_used}"
+
+    def save(self):
+        _dump(self.snapshots, self.filename)
+
+    def save_report(self, filename):
+        """Write the measured values next to the baseline ones"""
+        report = {
+            group: {
+                name: {"gas_used": gas_used, "baseline": self.snapshots.get(group, {}).get(name)}
+                for name, gas_used in values.items()
+            }
+            for group, values in self.measured.items()
+        }
+        _dump(report, filename)
+
+
+def _dump(data, filename):
+    with open(filename, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+@pytest.fixture(scope="session")
+def gas_snapshots(cmd_opts):
+    snapshots = GasSnapshots(GAS_SNAPSHOTS_FILE, cmd_opts.update_gas_snapshots, cmd_opts.gas_tolerance)
+    yield snapshots
+    if snapshots.update:
+        snapshots.save()
+    if cmd_opts.gas_report:
+        snapshots.save_report(cmd_opts.gas_report)
+
+
+@pytest.fixture(scope="module")
+def token_no_return(ERC20NoReturn, owner):
+    return ERC20NoReturn.deploy("XYZ", "XYZ", 18, {"from": owner})
+
+
+@pytest.fixture(scope="module")
+def vesting_factory_no_return(factory_impl, factory_target, token_no_return, owner, manager, voting_adapter):
+    return factory_impl.deploy(factory_target, token_no_return, owner, manager, voting_adapter, {"from": owner})
+
+
+@pytest.fixture(scope="module")
+def vesting_no_return(
+    VestingEscrow,
+    vesting_factory_no_return,
+    token_no_return,
+    recipient,
+    owner,
+    balance,
+    duration,
+    start_time,
+    cliff,
+):
+    token_no_return._mint_for_testing(balance, {"from": owner})
+    token_no_return.approve(vesting_factory_no_return, balance, {"from": owner})
+    tx = vesting_factory_no_return.deploy_vesting_contract(
+        balance, recipient, duration, start_time, cliff, True, {"from": owner}
+    )
+    return VestingEscrow.at(tx.new_contracts[0])
@@ -0,0 +1,45 @@
+import pytest
+
+from tests.utils import mint_or_transfer_for_testing
+
+pytestmark = pytest.mark.no_deploy
+
+AMOUNT = 10**18
+
+
+def _deploy_escrows(vesting_factory, token, owner, recipient, duration, start_time, count):
+    token.approve(vesting_factory, AMOUNT * count, {"from": owner})
+    params = [(AMOUNT, recipient, duration, start_time, 0, False)] * count
+    return vesting_factory.deploy_vesting_contracts(params, {"from": owner}).return_value
+
+
+@pytest.mark.parametrize("batch_size", [10, 50])
+def test_batch_claim_gas(
+    VestingEscrow,
+    vesting_factory,
+    token,
+    owner,
+    recipient,
+    duration,
+    start_time,
+    chain,
+    deployed,
+    batch_size,
+):
+    mint_or_transfer_for_testing(owner, owner, token, 2 * AMOUNT * batch_size, deployed)
+    separate = _deploy_escrows(vesting_factory, token, owner, recipient, duration, start_time, batch_size)
+    batched = _deploy_escrows(vesting_factory, token, owner, recipient, duration, start_time, batch_size)
+    chain.sleep(start_time - chain.time() + duration // 2)
+
+    per_call_gas = sum(VestingEscrow.at(escrow).claim({"from": recipient}).gas_used for escrow in separate)
+    tx = vesting_factory.batch_claim(batched, {"from": recipient})
+
+    assert len(tx.events["Claim"]) == batch_size
+    print(
+        f"\nbatch of {batch_size}: "
+        f"per-call {per_call_gas} ({per_call_gas // batch_size} per escrow), "
+        f"batched {tx.gas_used} ({tx.gas_used // batch_size} per escrow), "
+        f"saved {per_call_gas - tx.gas_used}"
+    )
+    # the batch saves at least the intrinsic gas of the separate transactions
+    assert tx.gas_used < per_call_gas - 21_000 * (batch_size - 1)
@@ -0,0 +1,62 @@
+import pytest
+from eth_utils import keccak, to_checksum_address
+
+from tests.utils import mint_or_transfer_for_testing
+
+pytestmark = pytest.mark.no_deploy
+
+TX_BASE_GAS = 21_000
+AMOUNT = 10**18
+
+
+def _recipients(count):
+    return [to_checksum_address(keccak(text=f"recipient-{i}")[-20:]) for i in range(count)]
+
+
+def _params_list(count, duration, start_time, cliff):
+    return [
+        (AMOUNT, recipient, duration, start_time, cliff, i % 2 == 0) for i, recipient in enumerate(_recipients(count))
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [10, 50, 100])
+def test_deploy_batch_gas(
+    VestingEscrow,
+    vesting_factory,
+    token,
+    owner,
+    duration,
+    start_time,
+    cliff,
+    deployed,
+    batch_size,
+):
+    params_list = _params_list(batch_size, duration, start_time, cliff)
+    total = AMOUNT * batch_size
+    mint_or_transfer_for_testing(owner, owner, token, 2 * total, deployed)
+
+    # per-call path, as built by `multisig_tx build`
+    token.approve(vesting_factory, total, {"from": owner})
+    per_call_gas = 0
+    for params in params_list:
+        tx = vesting_factory.deploy_vesting_contract(*params, {"from": owner})
+        per_call_gas += tx.gas_used
+    # a multisend pays the intrinsic gas only once, so it is at least this expensive
+    multisend_gas = per_call_gas - TX_BASE_GAS * (batch_size - 1)
+
+    token.approve(vesting_factory, total, {"from": owner})
+    tx = vesting_factory.deploy_vesting_contracts(params_list, {"from": owner})
+
+    assert len(tx.return_value) == batch_size
+    assert token.balanceOf(vesting_factory) == 0
+    for escrow, params in zip(tx.return_value, params_list):
+        assert token.balanceOf(escrow) == AMOUNT
+        assert VestingEscrow.at(escrow).recipient() == params[1]
+
+    print(
+        f"\nbatch of {batch_size}: "
+        f"per-call {multisend_gas} ({multisend_gas // batch_size} per escrow), "
+        f"batched {tx.gas_used} ({tx.gas_used // batch_size} per escrow), "
+        f"saved {multisend_gas - tx.gas_used}"
+    )
+    assert tx.gas_used < multisend_gas
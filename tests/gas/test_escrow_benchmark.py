@@ -0,0 +1,117 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytestmark = [
+    pytest.mark.no_deploy,
+    pytest.mark.parametrize("deployed_vesting_with_cliff", [pytest.param(1, id="fully_revocable")], indirect=True),
+]
+
+EXTRA_AMOUNT = 10**18
+STATES = ["before_cliff", "mid_vesting", "after_end", "after_revoke"]
+
+
+def _recover_erc20(c):
+    c.token._mint_for_testing(EXTRA_AMOUNT, {"from": c.random_guy})
+    c.token.transfer(c.escrow, EXTRA_AMOUNT, {"from": c.random_guy})
+    return c.escrow.recover_erc20(c.token, EXTRA_AMOUNT, {"from": c.random_guy})
+
+
+ESCROW_TXS = {
+    "claim": lambda c: c.escrow.claim({"from": c.recipient}),
+    "revoke_unvested(owner)": lambda c: c.escrow.revoke_unvested({"from": c.owner}),
+    "revoke_unvested(manager)": lambda c: c.escrow.revoke_unvested({"from": c.manager}),
+    "revoke_all": lambda c: c.escrow.revoke_all({"from": c.owner}),
+    "recover_erc20": _recover_erc20,
+    "recover_ether": lambda c: c.escrow.recover_ether({"from": c.random_guy}),
+    "aragon_vote": lambda c: c.escrow.aragon_vote(
+        c.voting_adapter.encode_aragon_vote_calldata(154, True), {"from": c.recipient}
+    ),
+    "snapshot_set_delegate": lambda c: c.escrow.snapshot_set_delegate(
+        c.voting_adapter.encode_snapshot_set_delegate_calldata(c.recipient), {"from": c.recipient}
+    ),
+    "delegate": lambda c: c.escrow.delegate(
+        c.voting_adapter.encode_delegate_calldata(c.random_guy), {"from": c.recipient}
+    ),
+}
+# nothing is locked to revoke
+NOT_APPLICABLE = {
+    ("revoke_unvested(owner)", "after_end"),
+    ("revoke_unvested(manager)", "after_end"),
+    ("revoke_unvested(owner)", "after_revoke"),
+    ("revoke_unvested(manager)", "after_revoke"),
+}
+NO_RETURN_TXS = ["claim", "revoke_unvested(owner)", "revoke_all", "recover_erc20"]
+
+STATE_VIEWS = ["unclaimed", "locked"]
+# getters cost does not depend on the vesting state
+GETTERS = [
+    "recipient",
+    "token",
+    "start_time",
+    "end_time",
+    "cliff_length",
+    "factory",
+    "total_locked",
+    "is_fully_revokable",
+    "total_claimed",
+    "disabled_at",
+    "initialized",
+    "is_fully_revoked",
+]
+
+
+@pytest.fixture
+def ctx(deployed_vesting_with_cliff, token, voting_adapter, owner, manager, recipient, random_guy):
+    return SimpleNamespace(
+        escrow=deployed_vesting_with_cliff,
+        token=token,
+        voting_adapter=voting_adapter,
+        owner=owner,
+        manager=manager,
+        recipient=recipient,
+        random_guy=random_guy,
+    )
+
+
+def _set_state(state, c, chain, start_time, end_time, cliff, duration):
+    if state == "before_cliff":
+        chain.sleep(start_time + cliff // 2 - chain.time())
+    elif state == "after_end":
+        chain.sleep(end_time + 1 - chain.time())
+    else:
+        chain.sleep(start_time + duration // 2 - chain.time())
+    if state == "after_revoke":
+        c.escrow.revoke_unvested({"from": c.owner})
+
+
+@pytest.mark.parametrize(
+    "name,state", [(name, state) for state in STATES for name in ESCROW_TXS if (name, state) not in NOT_APPLICABLE]
+)
+def test_escrow_tx_gas(ctx, escrow_impl, gas_snapshots, chain, start_time, end_time, cliff, duration, name, state):
+    _set_state(state, ctx, chain, start_time, end_time, cliff, duration)
+    tx = ESCROW_TXS[name](ctx)
+    gas_snapshots.check(escrow_impl._name, f"{name}@{state}", tx)
+
+
+@pytest.mark.parametrize("name,state", [(name, state) for state in STATES for name in STATE_VIEWS])
+def test_escrow_view_gas(ctx, escrow_impl, gas_snapshots, chain, start_time, end_time, cliff, duration, name, state):
+    _set_state(state, ctx, chain, start_time, end_time, cliff, duration)
+    tx = getattr(ctx.escrow, name).transact({"from": ctx.random_guy})
+    gas_snapshots.check(escrow_impl._name, f"{name}@{state}", tx)
+
+
+@pytest.mark.parametrize("name", GETTERS)
+def test_escrow_getter_gas(ctx, escrow_impl, gas_snapshots, name):
+    tx = getattr(ctx.escrow, name).transact({"from": ctx.random_guy})
+    gas_snapshots.check(escrow_impl._name, name, tx)
+
+
+@pytest.mark.parametrize("name", NO_RETURN_TXS)
+def test_escrow_no_return_token_gas(
+    ctx, vesting_no_return, token_no_return, escrow_impl, gas_snapshots, chain, start_time, duration, name
+):
+    chain.sleep(start_time + duration // 2 - chain.time())
+    ctx.escrow, ctx.token = vesting_no_return, token_no_return
+    tx = ESCROW_TXS[name](ctx)
+    gas_snapshots.check(escrow_impl._name, f"{name}@no_return_token", tx)
@@ -0,0 +1,87 @@
+import pytest
+
+from tests.utils import mint_or_transfer_for_testing
+from utils.immutable_args import deploy_immutable_args_blueprint
+
+pytestmark = pytest.mark.no_deploy
+
+AMOUNT = 10**18
+OPERATIONS = ["deploy", "unclaimed", "locked", "claim", "revoke_unvested", "revoke_all"]
+
+
+@pytest.fixture(scope="module")
+def factories(
+    VestingEscrow,
+    VestingEscrowPacked,
+    VestingEscrowImmutableArgs,
+    VestingEscrowFactory,
+    VestingEscrowFactoryImmutableArgs,
+    token,
+    owner,
+    manager,
+    voting_adapter,
+):
+    factories = {
+        impl._name: VestingEscrowFactory.deploy(
+            impl.deploy({"from": owner}),
+            token,
+            owner,
+            manager,
+            voting_adapter,
+            {"from": owner},
+        )
+        for impl in [VestingEscrow, VestingEscrowPacked]
+    }
+    blueprint = deploy_immutable_args_blueprint(VestingEscrowImmutableArgs.deploy({"from": owner}), {"from": owner})
+    factories[VestingEscrowImmutableArgs._name] = VestingEscrowFactoryImmutableArgs.deploy(
+        blueprint,
+        token,
+        owner,
+        manager,
+        voting_adapter,
+        {"from": owner},
+    )
+    return factories
+
+
+def test_escrow_impl_gas(
+    VestingEscrow,
+    factories,
+    token,
+    owner,
+    recipient,
+    chain,
+    duration,
+    start_time,
+    deployed,
+):
+    mint_or_transfer_for_testing(owner, owner, token, 2 * AMOUNT * len(factories), deployed)
+
+    gas = {name: {} for name in factories}
+    escrows = {}
+    for name, factory in factories.items():
+        token.approve(factory, 2 * AMOUNT, {"from": owner})
+        txs = [
+            factory.deploy_vesting_contract(AMOUNT, recipient, duration, start_time, 0, revokable, {"from": owner})
+            for revokable in [False, True]
+        ]
+        gas[name]["deploy"] = txs[0].gas_used
+        escrows[name] = [VestingEscrow.at(tx.new_contracts[0]) for tx in txs]
+
+    chain.sleep(start_time - chain.time() + duration // 2)
+    for name, (ordinary, fully_revokable) in escrows.items():
+        gas[name]["unclaimed"] = ordinary.unclaimed.estimate_gas()
+        gas[name]["locked"] = ordinary.locked.estimate_gas()
+        gas[name]["claim"] = ordinary.claim({"from": recipient}).gas_used
+        gas[name]["revoke_unvested"] = ordinary.revoke_unvested({"from": owner}).gas_used
+        gas[name]["revoke_all"] = fully_revokable.revoke_all({"from": owner}).gas_used
+
+    print(f"\n{'operation':<16}" + "".join(f"{name:>28}" for name in gas))
+    for op in OPERATIONS:
+        print(f"{op:<16}" + "".join(f"{gas[name][op]:>28}" for name in gas))
+
+    default = gas["VestingEscrow"]
+    # the packed escrow reads fewer storage slots, the immutable args one copies the args from the proxy code once
+    for name in ["VestingEscrowPacked", "VestingEscrowImmutableArgs"]:
+        for op in OPERATIONS:
+            assert gas[name][op] < default[op], f"{name}.{op}"
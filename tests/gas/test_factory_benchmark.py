@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytestmark = pytest.mark.no_deploy
+
+AMOUNT = 10**18
+BATCH_SIZE = 10
+
+
+def _deploy_vesting_contract(c):
+    c.token._mint_for_testing(AMOUNT, {"from": c.owner})
+    c.token.approve(c.factory, AMOUNT, {"from": c.owner})
+    return c.factory.deploy_vesting_contract(
+        AMOUNT, c.recipient, c.duration, c.start_time, c.cliff, False, {"from": c.owner}
+    )
+
+
+def _deploy_vesting_contracts(c):
+    c.token._mint_for_testing(AMOUNT * BATCH_SIZE, {"from": c.owner})
+    c.token.approve(c.factory, AMOUNT * BATCH_SIZE, {"from": c.owner})
+    params = [(AMOUNT, c.recipient, c.duration, c.start_time, c.cliff, False)] * BATCH_SIZE
+    return c.factory.deploy_vesting_contracts(params, {"from": c.owner})
+
+
+def _batch_claim(c):
+    escrows = _deploy_vesting_contracts(c).return_value
+    c.chain.sleep(c.start_time + c.duration // 2 - c.chain.time())
+    return c.factory.batch_claim(escrows, {"from": c.recipient})
+
+
+def _batch_aragon_vote(c):
+    escrows = _deploy_vesting_contracts(c).return_value
+    data = c.voting_adapter.encode_aragon_vote_calldata(154, True)
+    return c.factory.batch_aragon_vote(escrows, data, {"from": c.recipient})
+
+
+def _recover_erc20(c):
+    c.token._mint_for_testing(AMOUNT, {"from": c.random_guy})
+    c.token.transfer(c.factory, AMOUNT, {"from": c.random_guy})
+    return c.factory.recover_erc20(c.token, AMOUNT, {"from": c.random_guy})
+
+
+FACTORY_TXS = {
+    "deploy_vesting_contract": _deploy_vesting_contract,
+    f"deploy_vesting_contracts({BATCH_SIZE})": _deploy_vesting_contracts,
+    # `VestingEscrow.*_via_factory` methods are measured as a part of the batches
+    f"batch_claim({BATCH_SIZE})": _batch_claim,
+    f"batch_aragon_vote({BATCH_SIZE})": _batch_aragon_vote,
+    "recover_erc20": _recover_erc20,
+    "recover_ether": lambda c: c.factory.recover_ether({"from": c.random_guy}),
+    "update_voting_adapter": lambda c: c.factory.update_voting_adapter(c.voting_adapter_for_update, {"from": c.owner}),
+    "change_owner": lambda c: c.factory.change_owner(c.random_guy, {"from": c.owner}),
+    "change_manager": lambda c: c.factory.change_manager(c.random_guy, {"from": c.owner}),
+}
+NO_RETURN_TXS = ["deploy_vesting_contract", f"deploy_vesting_contracts({BATCH_SIZE})", "recover_erc20"]
+GETTERS = ["token", "target", "roles", "owner", "manager", "voting_adapter"]
+
+
+@pytest.fixture
+def ctx(
+    vesting_factory,
+    token,
+    voting_adapter,
+    voting_adapter_for_update,
+    owner,
+    recipient,
+    random_guy,
+    duration,
+    start_time,
+    cliff,
+    chain,
+):
+    return SimpleNamespace(
+        factory=vesting_factory,
+        token=token,
+        voting_adapter=voting_adapter,
+        voting_adapter_for_update=voting_adapter_for_update,
+        owner=owner,
+        recipient=recipient,
+        random_guy=random_guy,
+        duration=duration,
+        start_time=start_time,
+        cliff=cliff,
+        chain=chain,
+    )
+
+
+@pytest.mark.parametrize("name", FACTORY_TXS)
+def test_factory_tx_gas(ctx, factory_impl, gas_snapshots, name):
+    tx = FACTORY_TXS[name](ctx)
+    gas_snapshots.check(factory_impl._name, name, tx)
+
+
+@pytest.mark.parametrize("name", GETTERS)
+def test_factory_getter_gas(ctx, factory_impl, gas_snapshots, name):
+    tx = getattr(ctx.factory, name).transact({"from": ctx.random_guy})
+    gas_snapshots.check(factory_impl._name, name, tx)
+
+
+@pytest.mark.parametrize("name", NO_RETURN_TXS)
+def test_factory_no_return_token_gas(
+    ctx, vesting_factory_no_return, token_no_return, factory_impl, gas_snapshots, name
+):
+    ctx.factory, ctx.token = vesting_factory_no_return, token_no_return
+    tx = FACTORY_TXS[name](ctx)
+    gas_snapshots.check(factory_impl._name, f"{name}@no_return_token", tx)
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytestmark = pytest.mark.no_deploy
+
+AMOUNT = 10**18
+
+
+def _recover_erc20(c):
+    c.token._mint_for_testing(AMOUNT, {"from": c.random_guy})
+    c.token.transfer(c.voting_adapter, AMOUNT, {"from": c.random_guy})
+    return c.voting_adapter.recover_erc20(c.token, AMOUNT, {"from": c.random_guy})
+
+
+# `aragon_vote`, `snapshot_set_delegate` and `delegate` are delegatecalled by the escrows,
+# their cost is a part of the escrow functions measured in `test_escrow_benchmark.py`
+VOTING_ADAPTER_TXS = {
+    "change_owner": lambda c: c.voting_adapter.change_owner(c.random_guy, {"from": c.owner}),
+    "recover_erc20": _recover_erc20,
+    "recover_ether": lambda c: c.voting_adapter.recover_ether({"from": c.random_guy}),
+}
+# view name: args
+VOTING_ADAPTER_VIEWS = {
+    "encode_aragon_vote_calldata": lambda c: (154, True),
+    "encode_snapshot_set_delegate_calldata": lambda c: (c.random_guy,),
+    "encode_delegate_calldata": lambda c: (c.random_guy,),
+    "voting_contract_addr": lambda c: (),
+    "snapshot_delegate_contract_addr": lambda c: (),
+    "owner": lambda c: (),
+}
+
+
+@pytest.fixture
+def ctx(voting_adapter, token, owner, random_guy):
+    return SimpleNamespace(voting_adapter=voting_adapter, token=token, owner=owner, random_guy=random_guy)
+
+
+@pytest.mark.parametrize("name", VOTING_ADAPTER_TXS)
+def test_voting_adapter_tx_gas(ctx, gas_snapshots, name):
+    tx = VOTING_ADAPTER_TXS[name](ctx)
+    gas_snapshots.check("VotingAdapter", name, tx)
+
+
+@pytest.mark.parametrize("name", VOTING_ADAPTER_VIEWS)
+def test_voting_adapter_view_gas(ctx, gas_snapshots, name):
+    args = VOTING_ADAPTER_VIEWS[name](ctx)
+    tx = getattr(ctx.voting_adapter, name).transact(*args, {"from": ctx.random_guy})
+    gas_snapshots.check("VotingAdapter", name, tx)
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from brownie import web3
+from web3 import HTTPProvider, Web3
+
+from tests.utils import LatencyProxy
+from utils.async_calls import async_batch_call, async_read_escrows_state, escrow_calls
+from utils.lens import read_escrows_state
+
+pytestmark = pytest.mark.no_deploy
+
+ESCROWS_COUNT = 50
+LATENCY = 0.05
+CONCURRENCY = 20
+
+
+@pytest.fixture
+def escrows(deploy_escrows):
+    return deploy_escrows(ESCROWS_COUNT)
+
+
+@pytest.fixture
+def proxy():
+    with LatencyProxy(web3.provider.endpoint_uri, LATENCY) as proxy:
+        yield proxy
+
+
+def test_async_batch_call(escrows, VestingEscrow, chain, start_time):
+    chain.sleep(start_time - chain.time() + 1000)
+    chain.mine()
+    calls = escrow_calls(escrows, "total_locked") + escrow_calls(escrows, "unclaimed")
+
+    values = async_batch_call(calls, concurrency=CONCURRENCY)
+
+    expected = [VestingEscrow.at(escrow).total_locked() for escrow in escrows]
+    expected += [VestingEscrow.at(escrow).unclaimed() for escrow in escrows]
+    assert values == expected
+
+
+def test_async_batch_call_pins_block(escrows, VestingEscrow, recipient, chain, end_time):
+    block = web3.eth.block_number
+    chain.sleep(end_time - chain.time())
+    VestingEscrow.at(escrows[0]).claim({"from": recipient})
+
+    values = async_batch_call(escrow_calls(escrows[:1], "total_claimed"), block_identifier=block)
+    assert values == [0]
+
+
+def test_async_read_escrows_state(escrows, vesting_lens, chain, start_time):
+    chain.sleep(start_time - chain.time() + 1000)
+    chain.mine()
+
+    states = async_read_escrows_state(escrows, concurrency=CONCURRENCY)
+
+    assert states == read_escrows_state(escrows, vesting_lens)
+
+
+def test_async_batch_call_throughput(escrows, proxy):
+    calls = escrow_calls(escrows, "total_locked")
+
+    # one request per call as in the async path
+    sync_web3 = Web3(HTTPProvider(proxy.uri), middlewares=[])
+    started = time.perf_counter()
+    expected = [
+        method.decode_output(sync_web3.eth.call({"to": method._address, "data": method.encode_input()}).hex())
+        for method, in calls
+    ]
+    sync_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    values = async_batch_call(calls, concurrency=CONCURRENCY, endpoint_uri=proxy.uri)
+    async_elapsed = time.perf_counter() - started
+
+    assert values == expected
+    assert proxy.max_in_flight <= CONCURRENCY
+    # the calls are sent in ESCROWS_COUNT / CONCURRENCY waves instead of one by one
+    assert async_elapsed * 3 < sync_elapsed
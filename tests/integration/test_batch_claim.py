@@ -0,0 +1,39 @@
+import pytest
+
+from scripts.batch_claim import build_batch_claims, find_claimable_escrows
+from scripts.indexer import sync_events
+
+pytestmark = pytest.mark.no_deploy
+
+ESCROWS_COUNT = 5
+
+
+@pytest.fixture
+def escrows(deploy_escrows, recipient, random_guy):
+    # escrow of another recipient must not be claimed
+    recipients = [recipient] * 2 + [random_guy] + [recipient] * (ESCROWS_COUNT - 2)
+    escrows = deploy_escrows(recipients=recipients)
+    return [escrow for escrow, escrow_recipient in zip(escrows, recipients) if escrow_recipient == recipient]
+
+
+def test_find_and_batch_claim(
+    index, escrows, vesting_factory, vesting_lens, token, recipient, random_guy, chain, start_time, sleep_time
+):
+    chain.sleep(start_time - chain.time() + sleep_time)
+    chain.mine()
+    # already claimed escrow is skipped
+    vesting_factory.batch_claim(escrows[:1], {"from": recipient})
+    sync_events(index, vesting_factory.address)
+
+    states = find_claimable_escrows(index, vesting_factory.address, recipient.address, vesting_lens)
+    assert [state.escrow for state in states] == escrows[1:]
+
+    batches = build_batch_claims(vesting_factory, states, random_guy.address, chunk_size=3)
+    assert [len(batch.escrows) for batch in batches] == [3, 1]
+
+    for batch in batches:
+        tx = recipient.transfer(batch.to, data=batch.data)
+        assert [event.address for event in tx.events["Claim"]] == batch.escrows
+        # vested a bit more since the build
+        assert sum(event["claimed"] for event in tx.events["Claim"]) >= batch.amount
+    assert token.balanceOf(random_guy) >= sum(batch.amount for batch in batches)
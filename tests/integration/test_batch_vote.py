@@ -0,0 +1,42 @@
+import pytest
+
+from scripts.batch_vote import build_batch_votes, estimate_vote_gas, find_voting_escrows
+from scripts.indexer import sync_events
+
+pytestmark = pytest.mark.no_deploy
+
+ESCROWS_COUNT = 5
+
+
+@pytest.fixture
+def escrows(deploy_escrows, recipient, random_guy):
+    # escrow of another recipient must not be voted from
+    recipients = [recipient] * 2 + [random_guy] + [recipient] * (ESCROWS_COUNT - 2)
+    escrows = deploy_escrows(recipients=recipients)
+    return [escrow for escrow, escrow_recipient in zip(escrows, recipients) if escrow_recipient == recipient]
+
+
+def test_find_and_batch_vote(
+    index, escrows, VestingEscrow, vesting_factory, vesting_lens, voting_adapter, recipient, chain, end_time
+):
+    chain.sleep(end_time - chain.time())
+    # escrow without tokens is skipped
+    VestingEscrow.at(escrows[0]).claim({"from": recipient})
+    sync_events(index, vesting_factory.address)
+
+    states = find_voting_escrows(index, vesting_factory.address, recipient.address, vesting_lens)
+    assert [state.escrow for state in states] == escrows[1:]
+
+    data = voting_adapter.encode_aragon_vote_calldata(154, True)
+    batches = build_batch_votes(vesting_factory, [state.escrow for state in states], data, chunk_size=3)
+    assert [len(batch.escrows) for batch in batches] == [3, 1]
+
+    report = estimate_vote_gas(batches, data, recipient.address)
+    assert report.escrows_count == len(states)
+    assert len(report.per_batch) == len(batches)
+    assert report.batched_total < report.per_escrow_total
+
+    for batch, gas in zip(batches, report.per_batch):
+        tx = recipient.transfer(batch.to, data=batch.data)
+        assert [event["voter"] for event in tx.events["CastVote"]] == batch.escrows
+        assert tx.gas_used <= gas
@@ -0,0 +1,98 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+import utils.deployed_state as deployed_state
+from utils.deployed_state import DeployedState
+
+pytestmark = pytest.mark.no_deploy
+
+PROCESSES = 4
+UPDATES = 25
+
+
+def _deploy(filename: str, process: int) -> None:
+    state = DeployedState(filename)
+    for i in range(UPDATES):
+        state.update({f"contract{process}_{i}Address": f"0x{process:02x}{i:038x}", f"counter{process}": i})
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return str(tmp_path / "deployed-development.json")
+
+
+def test_update_and_read(filename):
+    state = DeployedState(filename)
+    assert state.read().get("factoryAddress") is None
+
+    state.update({"factoryAddress": "0x01", "factoryDeployTx": "0xaa"})
+    state.update({"factoryAddress": "0x02", "factoryDeployTx": "0xbb", "lensAddress": "0x03"})
+
+    assert state.read().toDict() == {"factoryAddress": "0x02", "factoryDeployTx": "0xbb", "lensAddress": "0x03"}
+    with open(filename) as f:
+        assert json.load(f) == state.read().toDict()
+    assert [entry["update"]["factoryAddress"] for entry in state.journal()] == ["0x01", "0x02"]
+
+
+def test_read_does_not_reparse(filename, monkeypatch):
+    state = DeployedState(filename)
+    state.update({"factoryAddress": "0x01"})
+    loads = []
+    monkeypatch.setattr(deployed_state, "load_json", lambda f: loads.append(f) or {})
+
+    assert state.read().factoryAddress == "0x01"
+    assert state.read().factoryAddress == "0x01"
+    assert loads == []
+
+
+def test_read_is_cached_until_the_state_changes(filename):
+    state = DeployedState(filename)
+    read = state.update({"factoryAddress": "0x01"})
+    assert state.read() is read
+
+    with pytest.raises(AttributeError):
+        read.lensAddress
+    assert state.read().toDict() == {"factoryAddress": "0x01"}
+
+    DeployedState(filename).update({"lensAddress": "0x02"})
+    assert state.read() is not read
+    assert state.read().toDict() == {"factoryAddress": "0x01", "lensAddress": "0x02"}
+
+
+@pytest.mark.parametrize("mode", [0o644, 0o664])
+def test_update_keeps_file_mode(filename, mode):
+    DeployedState(filename).update({"factoryAddress": "0x01"})
+    assert os.stat(filename).st_mode & 0o777 == deployed_state.DEFAULT_FILE_MODE
+
+    os.chmod(filename, mode)
+    DeployedState(filename).update({"lensAddress": "0x02"})
+    assert os.stat(filename).st_mode & 0o777 == mode
+
+
+def test_read_sees_other_writers(filename):
+    state = DeployedState(filename)
+    state.update({"factoryAddress": "0x01"})
+    DeployedState(filename).update({"lensAddress": "0x02"})
+
+    assert state.read().toDict() == {"factoryAddress": "0x01", "lensAddress": "0x02"}
+    # the update merges into the state written by the other process, not into the stale copy
+    state.update({"votingAdapterAddress": "0x03"})
+    assert set(DeployedState(filename).read().toDict()) == {"factoryAddress", "lensAddress", "votingAdapterAddress"}
+
+
+def test_concurrent_updates(filename):
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_deploy, args=(filename, p)) for p in range(PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    state = DeployedState(filename).read().toDict()
+    assert len(state) == PROCESSES * (UPDATES + 1)
+    assert all(state[f"counter{p}"] == UPDATES - 1 for p in range(PROCESSES))
+    assert len(DeployedState(filename).journal()) == PROCESSES * UPDATES
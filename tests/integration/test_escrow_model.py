@@ -0,0 +1,252 @@
+from typing import NamedTuple
+
+import pytest
+from brownie import chain, web3
+from brownie.exceptions import VirtualMachineError
+from eth_utils import to_checksum_address
+from hypothesis import Phase, settings
+from hypothesis import strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, initialize, invariant, rule, run_state_machine_as_test
+
+from tests.utils import mint_or_transfer_for_testing
+from utils.factory_model import MAX_UINT256, EscrowModel, Revert, TokenModel, VestingEscrowModel
+from utils.lens import read_escrows_state
+
+pytestmark = pytest.mark.no_deploy
+
+DAY = 24 * 60 * 60
+MODEL_EXAMPLES = 100
+CHAIN_EXAMPLES = 20
+CHAIN_STEPS = 20
+# the targeting phase takes longer than running the sequences
+PHASES = [Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink]
+
+ROLES = ("recipient", "owner", "manager", "random_guy")
+FACTORY = to_checksum_address(f"0x{0xFAC:040x}")
+
+roles = st.sampled_from(ROLES)
+amounts = st.one_of(st.just(MAX_UINT256), st.integers(0, 10**18))
+top_ups = st.integers(1, 10**19)
+sleeps = st.one_of(st.integers(1, 3600), st.integers(1, 120 * DAY))
+
+# the amount logged by the call event, `claim` logs the claimed amount even if it is zero
+EVENTS = {
+    "claim": ("Claim", "claimed"),
+    "revoke_unvested": ("UnvestedTokensRevoked", "revoked"),
+    "revoke_all": ("VestingFullyRevoked", "revoked"),
+    "recover_erc20": ("ERC20Recovered", "amount"),
+}
+
+
+class EscrowCall(NamedTuple):
+    """Escrow call or, for `top_up`, a transfer of extra tokens to the escrow"""
+
+    method: str
+    sender: str
+    args: tuple
+    timestamp: int
+
+
+class EscrowMachine(RuleBasedStateMachine):
+    """Random sequences of the escrow calls, extra token transfers and time jumps stepped on the model"""
+
+    model: VestingEscrowModel
+    roles: dict[str, str]
+    now: int
+    supply: int
+
+    def execute(self, call: EscrowCall) -> None:
+        try:
+            self.step(call)
+        except Revert:
+            pass
+
+    def step(self, call: EscrowCall) -> int:
+        if call.method == "top_up":
+            (amount,) = call.args
+            self.fund(call.sender, amount)
+            self.model.token_model.transfer(call.sender, self.model.storage.escrow, amount)
+            return amount
+        return getattr(self.model, call.method)(call.sender, call.timestamp, *call.args)
+
+    def fund(self, account: str, amount: int) -> None:
+        """Tokens of the top up, minted to the account"""
+        self.model.token_model.balances[account] += amount
+        self.supply += amount
+
+    def call(self, method: str, sender: str, *args) -> None:
+        self.execute(EscrowCall(method, self.roles[sender], args, self.now))
+
+    @rule(seconds=sleeps)
+    def sleep(self, seconds):
+        self.now += seconds
+
+    @rule(sender=roles, beneficiary=st.sampled_from(["recipient", "random_guy"]), amount=amounts)
+    def claim(self, sender, beneficiary, amount):
+        self.call("claim", sender, self.roles[beneficiary], amount)
+
+    @rule(sender=roles)
+    def revoke_unvested(self, sender):
+        self.call("revoke_unvested", sender)
+
+    @rule(sender=roles)
+    def revoke_all(self, sender):
+        self.call("revoke_all", sender)
+
+    @rule(amount=top_ups)
+    def top_up(self, amount):
+        self.call("top_up", "random_guy", amount)
+
+    @rule(sender=roles, amount=st.one_of(amounts, top_ups))
+    def recover_erc20(self, sender, amount):
+        self.call("recover_erc20", sender, self.model.storage.token, amount)
+
+    @invariant()
+    def tokens_are_conserved(self):
+        assert sum(self.model.token_model.balances.values()) == self.supply
+
+    @invariant()
+    def escrow_covers_unclaimed_and_locked(self):
+        storage = self.model.storage
+        assert storage.total_claimed <= storage.total_locked
+        vesting = self.model.locked(self.now) + self.model.unclaimed(self.now)
+        assert self.model.token_model.balances[storage.escrow] >= vesting
+        if not storage.is_fully_revoked and self.now < storage.disabled_at:
+            assert vesting + storage.total_claimed == storage.total_locked
+
+
+class ModelEscrowMachine(EscrowMachine):
+    """Escrow of a random schedule, without the chain"""
+
+    roles = {name: to_checksum_address(f"0x{i:040x}") for i, name in enumerate(ROLES, start=1)}
+    escrow = to_checksum_address(f"0x{0xE5C:040x}")
+    token = to_checksum_address(f"0x{0x70C:040x}")
+
+    @initialize(
+        amount=st.integers(1, 10**27),
+        duration=st.integers(1, 4 * 365 * DAY),
+        cliff=st.floats(0, 1),
+        is_fully_revokable=st.booleans(),
+    )
+    def init_escrow(self, amount, duration, cliff, is_fully_revokable):
+        self.now = 1_700_000_000
+        start_time = self.now + DAY
+        storage = EscrowModel(
+            escrow=self.escrow,
+            recipient=self.roles["recipient"],
+            token=self.token,
+            start_time=start_time,
+            end_time=start_time + duration,
+            cliff_length=int(duration * cliff),
+            factory=FACTORY,
+            total_locked=amount,
+            is_fully_revokable=is_fully_revokable,
+            total_claimed=0,
+            disabled_at=start_time + duration,
+            initialized=True,
+            is_fully_revoked=False,
+        )
+        token_model = TokenModel({self.escrow: amount})
+        self.model = VestingEscrowModel(storage, token_model, self.roles["owner"], self.roles["manager"])
+        self.supply = amount
+
+
+class ChainEscrowMachine(EscrowMachine):
+    """
+    Calls are stepped on the model only at the checkpoints, replaying the calls made since the previous checkpoint
+
+    The chain can't mine a transaction at the exact timestamp, so every call is sent after the chain time reaches
+    the call time and the model is stepped at the timestamp of the mined block.
+    """
+
+    def __init__(self, escrow, lens, token, accounts: dict, deployed: dict):
+        super().__init__()
+        self.escrow = escrow
+        self.lens = lens
+        self.token = token
+        self.deployed = deployed
+        self.accounts = {account.address: account for account in accounts.values()}
+        self.roles = {name: account.address for name, account in accounts.items()}
+        self.now = chain.time()
+        self.pending: list[EscrowCall] = []
+
+        (state,) = read_escrows_state([escrow], lens)
+        storage = EscrowModel(*state[: len(EscrowModel._fields)])
+        addresses = [escrow.address, *self.accounts]
+        token_model = TokenModel({address: token.balanceOf(address) for address in addresses})
+        self.model = VestingEscrowModel(storage, token_model, self.roles["owner"], self.roles["manager"])
+        self.supply = sum(token_model.balances.values())
+
+    def execute(self, call: EscrowCall) -> None:
+        self.pending.append(call)
+
+    @rule()
+    def checkpoint(self):
+        for call in self.pending:
+            self.replay(call)
+        self.pending.clear()
+
+        (state,) = read_escrows_state([self.escrow], self.lens)
+        assert EscrowModel(*state[: len(EscrowModel._fields)]) == self.model.storage
+        for address, balance in self.model.token_model.balances.items():
+            assert self.token.balanceOf(address) == balance, address
+
+    def fund(self, account: str, amount: int) -> None:
+        """Tokens of the top up, transferred from the owner with the deployed token"""
+        if not self.deployed:
+            super().fund(account, amount)
+        elif not self.model.token_model.transfer(self.roles["owner"], account, amount):
+            raise AssertionError(f"owner has no {amount} tokens to top up the escrow")
+
+    def replay(self, call: EscrowCall) -> None:
+        if call.timestamp > chain.time():
+            chain.sleep(call.timestamp - chain.time())
+        try:
+            tx = self.send(call)
+            reverted = None
+        except VirtualMachineError as e:
+            tx, reverted = None, e
+        call = call._replace(timestamp=web3.eth.get_block("latest").timestamp)
+
+        try:
+            expected = self.step(call)
+        except Revert as e:
+            assert reverted is not None, f"{call} succeeded, the model reverted with {e.reason}"
+            if e.reason is not None:
+                assert reverted.revert_msg == e.reason, call
+            return
+        assert reverted is None, f"{call} reverted with {reverted.revert_msg}"
+        if call.method in EVENTS:
+            name, field = EVENTS[call.method]
+            logged = [event[field] for event in tx.events[name]] if name in tx.events else []
+            assert logged == ([expected] if expected or call.method == "claim" else []), call
+
+    def send(self, call: EscrowCall):
+        sender = {"from": self.accounts[call.sender]}
+        if call.method == "top_up":
+            (amount,) = call.args
+            owner = self.accounts[self.roles["owner"]]
+            mint_or_transfer_for_testing(owner, sender["from"], self.token, amount, self.deployed)
+            return self.token.transfer(self.escrow, amount, sender)
+        return getattr(self.escrow, call.method)(*call.args, sender)
+
+    def teardown(self):
+        self.checkpoint()
+        chain.revert()
+
+
+def test_model_sequences():
+    run_state_machine_as_test(
+        ModelEscrowMachine, settings=settings(max_examples=MODEL_EXAMPLES, phases=PHASES, deadline=None)
+    )
+
+
+@pytest.mark.parametrize(
+    "deployed_vesting", [pytest.param(0, id="simple"), pytest.param(1, id="fully_revocable")], indirect=True
+)
+def test_model_matches_chain(deployed_vesting, vesting_lens, token, owner, manager, recipient, random_guy, deployed):
+    accounts = {"recipient": recipient, "owner": owner, "manager": manager, "random_guy": random_guy}
+    run_state_machine_as_test(
+        lambda: ChainEscrowMachine(deployed_vesting, vesting_lens, token, accounts, deployed),
+        settings=settings(max_examples=CHAIN_EXAMPLES, stateful_step_count=CHAIN_STEPS, phases=PHASES, deadline=None),
+    )
@@ -0,0 +1,195 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS, web3
+from brownie.test import given, strategy
+
+from tests.utils import mint_or_transfer_for_testing
+from utils.factory_model import (
+    EscrowModel,
+    FactoryModel,
+    Revert,
+    TokenModel,
+    Transfer,
+    VestingEscrowCreated,
+    VestingEscrowInitialized,
+    simulate_deployment,
+)
+from utils.lens import read_escrows_state
+from utils.vesting_params import VestingParams
+
+pytestmark = pytest.mark.no_deploy
+
+# the reasons of the asserts on token transfers, the test token reverts on them without a reason
+TOKEN_FAILURES = (
+    "transferFrom deployer to escrow failed",
+    "transferFrom deployer to factory failed",
+    "transfer factory to escrow failed",
+)
+
+
+@pytest.fixture
+def funded(vesting_factory, token, owner, balance, deployed):
+    mint_or_transfer_for_testing(owner, owner, token, balance, deployed)
+    token.approve(vesting_factory, balance, {"from": owner})
+
+
+@pytest.fixture
+def model(funded, vesting_factory, token, owner):
+    return _model(vesting_factory, token, owner)
+
+
+def _model(vesting_factory, token, owner) -> FactoryModel:
+    """Model of the factory in the current chain state, hypothesis reverts the chain between the examples"""
+    token_model = TokenModel(
+        {owner.address: token.balanceOf(owner)},
+        {(owner.address, vesting_factory.address): token.allowance(owner, vesting_factory)},
+    )
+    return FactoryModel(
+        vesting_factory.address, token.address, token_model, web3.eth.get_transaction_count(vesting_factory.address)
+    )
+
+
+def _events(tx) -> list:
+    events = []
+    for event in tx.events:
+        if event.name == "Transfer":
+            events.append(Transfer(event["_from"], event["_to"], event["_value"]))
+        elif event.name == "VestingEscrowInitialized":
+            events.append(VestingEscrowInitialized(*event.values()))
+        elif event.name == "VestingEscrowCreated":
+            events.append(VestingEscrowCreated(*event.values()))
+    return events
+
+
+def _assert_same_outcome(model, call, model_call, vesting_lens, token, owner):
+    events_count = len(model.events)
+    try:
+        expected = model_call()
+    except Revert as e:
+        if e.reason in TOKEN_FAILURES:
+            with brownie.reverts():
+                call()
+        else:
+            with brownie.reverts(e.reason):
+                call()
+        return
+
+    tx = call()
+    assert tx.return_value == expected
+    assert _events(tx) == model.events[events_count:]
+
+    escrows = expected if isinstance(expected, list) else [expected]
+    states = read_escrows_state(escrows, vesting_lens)
+    assert [EscrowModel(*state[: len(EscrowModel._fields)]) for state in states] == [model.escrows[e] for e in escrows]
+    for escrow in escrows:
+        assert token.balanceOf(escrow) == model.token_model.balances[escrow]
+    assert token.balanceOf(owner) == model.token_model.balances[owner.address]
+
+
+params_strategy = {
+    "amount": strategy("uint", max_value=10**20),
+    "vesting_duration": strategy("uint", max_value=10**9),
+    "vesting_start": strategy("uint", max_value=2**40),
+    "cliff_length": strategy("uint", max_value=10**9),
+    "is_fully_revokable": strategy("bool"),
+    "zero_recipient": strategy("bool"),
+}
+
+
+@given(**params_strategy)
+def test_deploy_vesting_contract(
+    funded,
+    vesting_factory,
+    vesting_lens,
+    token,
+    owner,
+    recipient,
+    amount,
+    vesting_duration,
+    vesting_start,
+    cliff_length,
+    is_fully_revokable,
+    zero_recipient,
+):
+    model = _model(vesting_factory, token, owner)
+    params = VestingParams(
+        amount,
+        ZERO_ADDRESS if zero_recipient else recipient.address,
+        vesting_duration,
+        vesting_start,
+        cliff_length,
+        is_fully_revokable,
+    )
+    _assert_same_outcome(
+        model,
+        lambda: vesting_factory.deploy_vesting_contract(*params, {"from": owner}),
+        lambda: model.deploy_vesting_contract(owner.address, params),
+        vesting_lens,
+        token,
+        owner,
+    )
+
+
+@given(
+    amounts=strategy("uint[]", max_value=10**20, min_length=0, max_length=5),
+    vesting_duration=strategy("uint", max_value=10**9),
+    cliff_length=strategy("uint", max_value=10**9),
+)
+def test_deploy_vesting_contracts(
+    funded, vesting_factory, vesting_lens, token, owner, recipient, start_time, amounts, vesting_duration, cliff_length
+):
+    model = _model(vesting_factory, token, owner)
+    params_list = [
+        VestingParams(amount, recipient.address, vesting_duration, start_time, cliff_length, False)
+        for amount in amounts
+    ]
+    _assert_same_outcome(
+        model,
+        lambda: vesting_factory.deploy_vesting_contracts(params_list, {"from": owner}),
+        lambda: model.deploy_vesting_contracts(owner.address, params_list),
+        vesting_lens,
+        token,
+        owner,
+    )
+
+
+def test_deploy_end_time_overflow(model, vesting_factory, vesting_lens, token, owner, recipient):
+    params = VestingParams(1, recipient.address, 2, 2**256 - 1, 0, False)
+    with pytest.raises(Revert) as e:
+        model.deploy_vesting_contract(owner.address, params)
+    assert e.value.reason is None
+    _assert_same_outcome(
+        model,
+        lambda: vesting_factory.deploy_vesting_contract(*params, {"from": owner}),
+        lambda: model.deploy_vesting_contract(owner.address, params),
+        vesting_lens,
+        token,
+        owner,
+    )
+
+
+def test_reverted_deploy_leaves_model_untouched(model, owner, recipient, balance):
+    state = (model.nonce, dict(model.token_model.balances), list(model.events))
+    with pytest.raises(Revert, match="transferFrom deployer to escrow failed"):
+        model.deploy_vesting_contract(owner.address, VestingParams(balance + 1, recipient.address, 100, 0, 0, False))
+    assert (model.nonce, dict(model.token_model.balances), model.events) == state
+
+
+def test_simulate_deployment(owner, recipient, token, vesting_factory):
+    params_list = [
+        VestingParams(10, recipient.address, 100, 0, 50, False),
+        VestingParams(10, recipient.address, 100, 0, 150, False),
+        VestingParams(0, recipient.address, 100, 0, 0, False),
+        VestingParams(10, ZERO_ADDRESS, 100, 0, 0, True),
+        VestingParams(10, recipient.address, 0, 0, 0, False),
+        VestingParams(10, "0xnot-an-address", 100, 0, 0, False),
+    ]
+    model, errors = simulate_deployment(params_list, owner.address, token.address, vesting_factory.address)
+    assert [num for num, _ in errors] == [1, 2, 3, 4, 5]
+    assert [reason for _, reason in errors[:4]] == [
+        "incorrect vesting cliff",
+        "incorrect amount",
+        "zero recipient",
+        "incorrect vesting duration",
+    ]
+    assert len(model.escrows) == 1
@@ -0,0 +1,67 @@
+import pytest
+
+from scripts.indexer import sync_events
+from tests.conftest import fully_revocable
+from tests.utils import mint_or_transfer_for_testing
+
+pytestmark = pytest.mark.no_deploy
+
+
+def test_sync_escrow_created(index, vesting_factory, deployed_vesting, owner, recipient, chain):
+    last_block = sync_events(index, vesting_factory.address, chunk_size=5)
+
+    assert last_block == chain.height
+    assert index.last_synced_block(vesting_factory.address) == last_block
+    [created] = index.escrows(factory=vesting_factory.address)
+    assert created.escrow == deployed_vesting.address
+    assert created.creator == owner
+    assert created.recipient == recipient
+    assert index.escrows(recipient=recipient) == [created]
+    assert index.events() == []
+
+
+def test_sync_escrow_events(index, vesting_factory, deployed_vesting, token, owner, recipient, random_guy, chain):
+    chain.sleep(deployed_vesting.start_time() - chain.time() + 1000)
+    claim_tx = deployed_vesting.claim(random_guy, {"from": recipient})
+    revoke_tx = deployed_vesting.revoke_unvested({"from": owner})
+
+    sync_events(index, vesting_factory.address, chunk_size=5)
+
+    [claim, revoke] = index.events(escrow=deployed_vesting.address)
+    assert claim.event == "Claim"
+    assert claim.account == random_guy
+    assert claim.amount == claim_tx.return_value
+    assert claim.tx_hash == claim_tx.txid
+    assert revoke.event == "UnvestedTokensRevoked"
+    assert revoke.account == owner
+    assert revoke.amount == revoke_tx.events["UnvestedTokensRevoked"]["revoked"]
+    assert index.events(event="Claim") == [claim]
+
+
+@fully_revocable
+def test_sync_is_incremental(
+    index, vesting_factory, deployed_vesting, token, owner, recipient, balance, chain, deployed
+):
+    first_block = sync_events(index, vesting_factory.address)
+
+    extra = 10**17
+    mint_or_transfer_for_testing(owner, owner, token, extra, deployed)
+    token.transfer(deployed_vesting, extra, {"from": owner})
+    deployed_vesting.recover_erc20(token, extra, {"from": recipient})
+    deployed_vesting.revoke_all({"from": owner})
+    mint_or_transfer_for_testing(owner, owner, token, balance, deployed)
+    token.approve(vesting_factory, balance, {"from": owner})
+    tx = vesting_factory.deploy_vesting_contract(balance, recipient, 3600, chain.time(), 0, 0, {"from": owner})
+
+    last_block = sync_events(index, vesting_factory.address, chunk_size=2)
+
+    assert last_block > first_block
+    assert [e.escrow for e in index.escrows()] == [deployed_vesting.address, tx.new_contracts[0]]
+    assert [(e.event, e.amount) for e in index.events()] == [
+        ("ERC20Recovered", extra),
+        ("VestingFullyRevoked", balance),
+    ]
+
+    # nothing new to sync, already stored events are not duplicated
+    assert sync_events(index, vesting_factory.address) == last_block
+    assert len(index.events()) == 2
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+from eth_account import Account
+
+from utils.manifest import load_manifest, save_manifest, sign_manifest, verify_manifest
+
+pytestmark = pytest.mark.no_deploy
+
+BODY = {
+    "csv_sha256": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+    "safe": "0x7Cd64b87251f793027590c34b206145c3aa362Ae",
+    "factory": {
+        "address": "0xDA1DF6442aFD2EC36aBEa91029794B9b2156ADD0",
+        "owner": "0x7Cd64b87251f793027590c34b206145c3aa362Ae",
+        "manager": "0x0000000000000000000000000000000000000000",
+    },
+}
+
+
+@pytest.fixture
+def signer():
+    return Account.create()
+
+
+def test_sign_and_load(signer, tmp_path):
+    filename = str(tmp_path / "manifest.json")
+    save_manifest(sign_manifest(BODY, signer.key), filename)
+
+    manifest = load_manifest(filename, signer.address)
+    assert manifest["signer"] == signer.address
+    assert {k: manifest[k] for k in BODY} == BODY
+
+
+def test_untrusted_signer(signer):
+    manifest = sign_manifest(BODY, signer.key)
+    with pytest.raises(ValueError, match="Manifest is signed by"):
+        verify_manifest(manifest, Account.create().address)
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [("csv_sha256", "00" * 32), ("safe", "0x0000000000000000000000000000000000000001"), ("factory", {})],
+)
+def test_tampered(signer, field, value):
+    manifest = {**sign_manifest(BODY, signer.key), field: value}
+    with pytest.raises(ValueError, match="Manifest is signed by"):
+        verify_manifest(manifest, signer.address)
+
+
+def test_keys_order_does_not_matter(signer, tmp_path):
+    manifest = sign_manifest(BODY, signer.key)
+    filename = tmp_path / "manifest.json"
+    filename.write_text(json.dumps(dict(reversed(list(manifest.items())))))
+    assert load_manifest(str(filename), signer.address) == manifest
+
+
+def test_missing_fields(signer):
+    manifest = sign_manifest(BODY, signer.key)
+    del manifest["safe"]
+    with pytest.raises(ValueError, match="Manifest fields missing: safe"):
+        verify_manifest(manifest, signer.address)
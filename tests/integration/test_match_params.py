@@ -0,0 +1,60 @@
+import pytest
+
+from tests.utils import mint_or_transfer_for_testing
+from utils.lens import read_escrows_state
+from utils.vesting_params import VestingParams, match_params
+
+pytestmark = pytest.mark.no_deploy
+
+RECIPIENT = "0x407573A78962129593fF8a58D72ad7e7632517A6"
+OTHER = "0x2222222222222222222222222222222222222222"
+
+
+def _params(amount, recipient=RECIPIENT, is_fully_revokable=False):
+    return VestingParams(amount, recipient, 1000, 1672531200, 100, is_fully_revokable)
+
+
+def test_match_params_repeated_recipient():
+    params_list = [_params(1), _params(2), _params(1, OTHER), _params(1)]
+    deployed = [_params(1, OTHER), _params(1), _params(2), _params(1)]
+    assert match_params(deployed, params_list) == [2, 0, 1, 3]
+
+
+def test_match_params_address_case():
+    assert match_params([_params(1, RECIPIENT)], [_params(1, RECIPIENT.lower())]) == [0]
+
+
+def test_match_params_extra_escrow():
+    with pytest.raises(ValueError, match="escrow 2 not found"):
+        match_params([_params(1), _params(1), _params(1)], [_params(1), _params(1)])
+
+
+def test_match_params_different_params():
+    with pytest.raises(ValueError, match="escrow 0 not found"):
+        match_params([_params(1, is_fully_revokable=True)], [_params(1)])
+
+
+def test_match_params_not_deployed():
+    with pytest.raises(ValueError, match=r"Rows not deployed: \[1\]"):
+        match_params([_params(1)], [_params(1), _params(2)])
+
+
+def test_match_created_escrows(
+    vesting_factory, vesting_lens, token, owner, recipient, balance, duration, start_time, deployed
+):
+    mint_or_transfer_for_testing(owner, owner, token, balance, deployed)
+    token.approve(vesting_factory, balance, {"from": owner})
+    amount = balance // 4
+    params_list = [
+        VestingParams(amount, recipient.address, duration, start_time, 0, False),
+        VestingParams(amount, recipient.address, duration, start_time, 0, True),
+        VestingParams(amount, recipient.address, duration, start_time, 0, False),
+        VestingParams(amount, owner.address, duration, start_time, 0, False),
+    ]
+    tx = vesting_factory.deploy_vesting_contracts(params_list, {"from": owner})
+
+    states = read_escrows_state([event["escrow"] for event in tx.events["VestingEscrowCreated"]], vesting_lens)
+    rows = match_params([VestingParams.from_state(state) for state in states], params_list)
+
+    assert rows == [0, 1, 2, 3]
+    assert [state.escrow for state in states] == list(tx.return_value)
@@ -0,0 +1,29 @@
+import pytest
+from brownie import web3
+
+from tests.utils import mint_or_transfer_for_testing
+
+pytestmark = pytest.mark.no_deploy
+
+# receives a token of every module, see test_module_isolation_rollback.py
+MARKER = "0x00000000000000000000000000000000000015e1"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def module_transfer(token, owner, balance, deployed):
+    # the transfer of the module run before on the same chain is rolled back
+    assert token.balanceOf(MARKER) == 0
+    mint_or_transfer_for_testing(owner, owner, token, balance, deployed)
+    token.transfer(MARKER, 1, {"from": owner})
+
+
+def test_session_contracts_survive(vesting_factory, factory_target, vesting_lens, voting_adapter, token):
+    assert vesting_factory.token() == token
+    assert vesting_factory.target() == factory_target
+    assert vesting_factory.voting_adapter() == voting_adapter
+    for contract in (vesting_factory, factory_target, vesting_lens, voting_adapter, token):
+        assert web3.eth.get_code(contract.address)
+
+
+def test_module_state_is_kept_between_tests(token):
+    assert token.balanceOf(MARKER) == 1
@@ -0,0 +1,8 @@
+# the tests of test_module_isolation.py in a second module, the module run later sees the transfer of the other
+# one rolled back while the session contracts are still deployed
+from tests.integration.test_module_isolation import (  # noqa: F401
+    module_transfer,
+    pytestmark,
+    test_module_state_is_kept_between_tests,
+    test_session_contracts_survive,
+)
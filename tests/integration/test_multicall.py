@@ -0,0 +1,70 @@
+import pytest
+from brownie import chain
+from brownie.exceptions import VirtualMachineError
+
+import utils.multicall as multicall_module
+from tests.utils import mint_or_transfer_for_testing
+from utils.multicall import MULTICALL3_ADDRESS, batch_call, get_multicall, read_fields
+
+pytestmark = pytest.mark.no_deploy
+
+
+def test_batch_call_matches_direct_calls(token, accounts, owner, balance, deployed):
+    mint_or_transfer_for_testing(owner, owner, token, balance, deployed)
+    for i, account in enumerate(accounts[:5]):
+        token.transfer(account, i * 10**18, {"from": owner})
+
+    results = batch_call([(token.balanceOf, account) for account in accounts[:5]])
+
+    assert results == [token.balanceOf(account) for account in accounts[:5]]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_batch_call_chunks(vesting_factory, token, owner, manager, voting_adapter, vesting_target, chunk_size):
+    calls = [
+        (vesting_factory.owner,),
+        (vesting_factory.manager,),
+        (vesting_factory.voting_adapter,),
+        (vesting_factory.token,),
+        (vesting_factory.target,),
+    ]
+
+    assert batch_call(calls, chunk_size) == [owner, manager, voting_adapter, token, vesting_target]
+
+
+def test_batch_call_empty():
+    assert batch_call([]) == []
+
+
+def test_read_fields(deployed_vesting, recipient, start_time, end_time, balance):
+    fields = read_fields(deployed_vesting, ["recipient", "start_time", "end_time", "total_locked", "initialized"])
+
+    assert fields == {
+        "recipient": recipient,
+        "start_time": start_time,
+        "end_time": end_time,
+        "total_locked": balance,
+        "initialized": True,
+    }
+
+
+def test_failed_call_reverts_batch(deployed_vesting, token, owner):
+    with pytest.raises(VirtualMachineError):
+        batch_call([(token.balanceOf, owner), (deployed_vesting.revoke_unvested,)])
+
+
+def test_multicall_is_reused(token, owner, monkeypatch):
+    multicall = get_multicall()
+    monkeypatch.setattr(multicall_module, "_resolve_multicall", lambda: pytest.fail("Multicall3 resolved again"))
+    assert get_multicall() == multicall
+    assert batch_call([(token.balanceOf, owner)]) == [token.balanceOf(owner)]
+
+
+def test_standin_is_redeployed_after_revert(token, owner, monkeypatch):
+    monkeypatch.setattr(multicall_module, "_multicalls", {})
+    chain.snapshot()
+    multicall = get_multicall()
+    chain.revert()
+    if multicall.address != MULTICALL3_ADDRESS:
+        assert get_multicall() != multicall
+    assert batch_call([(token.balanceOf, owner)]) == [token.balanceOf(owner)]
@@ -0,0 +1,41 @@
+import pytest
+
+from tests.utils import mint_or_transfer_for_testing
+from utils.multisend import split_by_gas
+
+pytestmark = pytest.mark.no_deploy
+
+ESCROWS_COUNT = 10
+
+
+def test_split_by_gas():
+    assert split_by_gas([], 100) == []
+    assert split_by_gas([40, 40, 40], 100) == [range(0, 2), range(2, 3)]
+    assert split_by_gas([40, 40, 40], 100, chunk_gas=30) == [range(0, 1), range(1, 2), range(2, 3)]
+    assert split_by_gas([50, 50, 10, 90], 100) == [range(0, 2), range(2, 4)]
+    assert split_by_gas([10] * 10, 100) == [range(0, 10)]
+
+
+def test_split_by_gas_item_over_limit():
+    with pytest.raises(ValueError, match="Item 1 alone"):
+        split_by_gas([40, 80], 100, chunk_gas=30)
+
+
+def test_split_measured_deploys(vesting_factory, token, owner, recipient, balance, duration, start_time, deployed):
+    mint_or_transfer_for_testing(owner, owner, token, balance, deployed)
+    amount = balance // ESCROWS_COUNT
+    approve_gas = token.approve(vesting_factory, balance, {"from": owner}).gas_used
+    deploy_gas = [
+        vesting_factory.deploy_vesting_contract(
+            amount, recipient, duration, start_time, 0, False, {"from": owner}
+        ).gas_used
+        for _ in range(ESCROWS_COUNT)
+    ]
+
+    # room for 3 deployments per transaction
+    gas_limit = approve_gas + 3 * max(deploy_gas)
+    chunks = split_by_gas(deploy_gas, gas_limit, approve_gas)
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    for chunk in chunks:
+        assert approve_gas + sum(deploy_gas[i] for i in chunk) <= gas_limit
@@ -0,0 +1,81 @@
+import pytest
+from brownie import web3
+
+from utils.lens import read_escrows_params, read_escrows_state
+from utils.params_cache import REORG_DEPTH, EscrowParams, ParamsCache
+
+pytestmark = pytest.mark.no_deploy
+
+CHAIN_ID = 1
+
+
+class FailingLens:
+    def get_escrows_state(self, *args, **kwargs):
+        raise AssertionError("Cached params must not be read from the chain")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ParamsCache(str(tmp_path / "params.sqlite")) as cache:
+        yield cache
+
+
+@pytest.fixture
+def escrows(deploy_escrows):
+    return deploy_escrows(with_cliff=True, fully_revokable=[True, False, True])
+
+
+def _params(escrow: str, block_number: int = 0) -> EscrowParams:
+    return EscrowParams(escrow, "0x01", "0x02", 2**255, 2**256 - 1, block_number, "0x03", 10**27, True)
+
+
+def test_save_and_get(cache):
+    saved = [_params(f"0x{i:040x}") for i in range(3)]
+    cache.save(CHAIN_ID, saved, 100, "0xaa")
+
+    assert cache.get(CHAIN_ID, [saved[2].escrow, saved[0].escrow, "0xmissing"]) == {
+        saved[0].escrow: saved[0],
+        saved[2].escrow: saved[2],
+    }
+    assert cache.get(CHAIN_ID + 1, [p.escrow for p in saved]) == {}
+
+
+def test_invalidate_reorged(cache):
+    head = 1000
+    hashes = {head - REORG_DEPTH - 1: "0xdeep", head - 10: "0xstill", head - 5: "0xreorged"}
+    for block_number, block_hash in hashes.items():
+        cache.save(CHAIN_ID, [_params(f"0x{block_number:040x}", block_number)], block_number, block_hash)
+    cache.save(CHAIN_ID, [_params(f"0x{head + 1:040x}", head + 1)], head + 1, "0xabove")
+
+    checked = []
+
+    def get_block_hash(block_number: int) -> str:
+        checked.append(block_number)
+        return "0xnew" if block_number == head - 5 else hashes[block_number]
+
+    assert cache.invalidate_reorged(CHAIN_ID, head, get_block_hash) == 2
+    # blocks deeper than REORG_DEPTH are final and not fetched
+    assert sorted(checked) == [head - 10, head - 5]
+    escrows = [f"0x{n:040x}" for n in (*hashes, head + 1)]
+    assert sorted(cache.get(CHAIN_ID, escrows)) == [f"0x{head - REORG_DEPTH - 1:040x}", f"0x{head - 10:040x}"]
+
+
+def test_read_escrows_params_cached(cache, escrows, vesting_lens):
+    states = read_escrows_state(escrows, vesting_lens, cache=cache)
+
+    expected = [EscrowParams.from_state(state) for state in states]
+    assert cache.get(web3.eth.chain_id, escrows) == dict(zip(escrows, expected))
+    assert read_escrows_params(escrows, FailingLens(), cache=cache) == expected
+
+
+def test_read_escrows_params_reads_missing(cache, escrows, VestingEscrow, vesting_lens, recipient, chain, end_time):
+    read_escrows_params(escrows[:1], vesting_lens, cache=cache)
+    chain.sleep(end_time - chain.time())
+    VestingEscrow.at(escrows[0]).claim({"from": recipient})
+
+    params = read_escrows_params(escrows, vesting_lens, cache=cache)
+
+    states = read_escrows_state(escrows, vesting_lens)
+    assert states[0].total_claimed > 0
+    assert params == [EscrowParams.from_state(state) for state in states]
+    assert set(cache.get(web3.eth.chain_id, escrows)) == set(escrows)
@@ -0,0 +1,103 @@
+import json
+import shutil
+
+import pytest
+
+from utils.params_validation import main, validate_all, validate_batch
+
+pytestmark = pytest.mark.no_deploy
+
+HEADER = "amount,recipient,vesting_duration,vesting_start,cliff_length,is_fully_revokable\n"
+RECIPIENT = "0x407573A78962129593fF8a58D72ad7e7632517A6"
+
+
+def _write_batch(directory, name, rows, checksum=None):
+    csv_path = directory / f"{name}.csv"
+    csv_path.write_text(HEADER + "".join(f"{row}\n" for row in rows))
+    digest = checksum or validate_batch(str(csv_path)).sha256
+    (directory / f"{name}.hash").write_text(f"{digest}  escrow_params/{name}.csv\n")
+    return csv_path
+
+
+def test_escrow_params_are_valid():
+    report = validate_all()
+
+    assert report["ok"], [batch for batch in report["batches"] if not batch["ok"]]
+    assert report["total_rows"] > 0
+
+
+def test_valid_batch(tmp_path):
+    csv_path = _write_batch(tmp_path, "batch_1", [f"1_000,{RECIPIENT},144,1672480800,24,1"])
+
+    batch = validate_batch(str(csv_path))
+
+    assert batch.ok
+    assert batch.rows == 1
+    assert batch.total_amount == 1_000
+    assert batch.recipients == [(RECIPIENT, 2)]
+
+
+def test_hash_mismatch(tmp_path):
+    csv_path = _write_batch(tmp_path, "batch_1", [f"1_000,{RECIPIENT},144,1672480800,24,1"], checksum="00" * 32)
+
+    assert validate_batch(str(csv_path)).errors == [f"sha256 mismatch: expected {'00' * 32}, actual {_sha(csv_path)}"]
+
+
+def test_missing_hash(tmp_path):
+    csv_path = _write_batch(tmp_path, "batch_1", [f"1_000,{RECIPIENT},144,1672480800,24,1"])
+    (tmp_path / "batch_1.hash").unlink()
+
+    assert validate_batch(str(csv_path)).errors == ["hash file not found or empty"]
+
+
+@pytest.mark.parametrize(
+    "row,error",
+    [
+        (f"1_000,{RECIPIENT},0,1672480800,0,1", "incorrect vesting duration"),
+        (f"1_000,{RECIPIENT},144,1672480800,145,1", "incorrect vesting cliff"),
+        ("1_000,0x0000000000000000000000000000000000000000,144,1672480800,24,1", "zero recipient"),
+        ("1_000,0x42,144,1672480800,24,1", "invalid recipient 0x42"),
+        (f"0,{RECIPIENT},144,1672480800,24,1", "incorrect amount"),
+        (f"1_000,{RECIPIENT},144,1672480800,24,yes", "invalid is_fully_revokable yes"),
+        (f"1_000,{RECIPIENT},144,1672480800", "Fields length mismatch to construct VestingParams"),
+        (f"1 LDO,{RECIPIENT},144,1672480800,24,1", "invalid literal for int() with base 10: '1 LDO'"),
+    ],
+)
+def test_invalid_row(tmp_path, row, error):
+    csv_path = _write_batch(tmp_path, "batch_1", [f"1_000,{RECIPIENT},144,1672480800,24,1", row])
+
+    assert validate_batch(str(csv_path)).errors == [f"line 3: {error}"]
+
+
+def test_duplicate_recipients_across_batches(tmp_path):
+    _write_batch(tmp_path, "batch_2", [f"1_000,{RECIPIENT},144,1672480800,24,1"])
+    _write_batch(tmp_path, "batch_10", [f"2_000,{RECIPIENT.lower()},144,1672480800,24,0"])
+
+    report = validate_all(str(tmp_path), workers=2)
+
+    assert report["ok"]
+    assert [batch["file"] for batch in report["batches"]] == [
+        str(tmp_path / "batch_2.csv"),
+        str(tmp_path / "batch_10.csv"),
+    ]
+    assert report["total_amount"] == "3000"
+    assert report["duplicate_recipients"] == {
+        RECIPIENT: [f"{tmp_path / 'batch_2.csv'}:2", f"{tmp_path / 'batch_10.csv'}:2"]
+    }
+
+
+def test_main_writes_report(tmp_path):
+    params_dir = tmp_path / "escrow_params"
+    params_dir.mkdir()
+    csv_path = _write_batch(params_dir, "batch_1", [f"1_000,{RECIPIENT},144,1672480800,24,1"])
+    shutil.copy(csv_path, params_dir / "batch_2.csv")
+    output = tmp_path / "report.json"
+
+    assert main([str(params_dir), "--output", str(output)]) == 1
+
+    report = json.loads(output.read_text())
+    assert [batch["ok"] for batch in report["batches"]] == [True, False]
+
+
+def _sha(path):
+    return validate_batch(str(path)).sha256
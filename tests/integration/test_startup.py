@@ -0,0 +1,41 @@
+import importlib
+import sys
+
+import dotenv
+import pytest
+from brownie import network
+
+from utils.config import DEFAULT_PARAMS_MODULE, get_network_params, params_module_name
+
+pytestmark = pytest.mark.no_deploy
+
+SCRIPTS = ("main", "deploy", "multisig_tx", "batch_claim", "batch_vote", "indexer", "unlock_report")
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("must not be called on import")
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_script_import_is_lazy(script, monkeypatch):
+    # fresh imports of the script with all the utils it pulls, the originals are restored after the test
+    for name in [name for name in sys.modules if name.startswith(("scripts", "utils"))]:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(network, "show_active", _fail)
+    monkeypatch.setattr(dotenv, "load_dotenv", _fail)
+    importlib.import_module(f"scripts.{script}")
+
+
+def test_network_params_resolved_once(capsys):
+    get_network_params.cache_clear()
+
+    params = get_network_params("holesky")
+    assert get_network_params("holesky") is params
+    assert capsys.readouterr().out.count("vesting_initial_params_holesky.py") == 1
+    assert params.TOKEN == importlib.import_module("vesting_initial_params_holesky").TOKEN
+
+
+def test_params_module_name():
+    assert params_module_name("holesky") == "vesting_initial_params_holesky"
+    assert params_module_name("mainnet") == DEFAULT_PARAMS_MODULE
+    assert params_module_name("mainnet-fork") == DEFAULT_PARAMS_MODULE
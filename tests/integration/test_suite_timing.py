@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+import utils.suite_timing as suite_timing
+from utils.suite_timing import SuiteRun, format_runs
+
+pytestmark = pytest.mark.no_deploy
+
+
+def test_format_runs():
+    report = format_runs(
+        [
+            SuiteRun("development", "0", 120.0, 0),
+            SuiteRun("development", "4", 40.0, 1),
+            SuiteRun("anvil-dev", "0", 30.0, 0),
+        ]
+    )
+
+    assert report.splitlines()[1:] == [
+        "development        0      120.0    1.00x  passed",
+        "development        4       40.0    3.00x  failed (1)",
+        "anvil-dev          0       30.0    4.00x  passed",
+    ]
+
+
+def test_main(tmp_path, monkeypatch):
+    calls = []
+
+    def run_suite(network, workers, test_args):
+        calls.append((network, workers, test_args))
+        return SuiteRun(network, workers, 10.0 / (int(workers) or 1), 0)
+
+    monkeypatch.setattr(suite_timing, "run_suite", run_suite)
+    output = tmp_path / "timing.json"
+
+    argv = ["--workers", "0", "2", "--networks", "development", "anvil-dev", "--output", str(output), "--", "-x"]
+    assert suite_timing.main(argv) == 0
+
+    assert calls == [
+        ("development", "0", ["-x"]),
+        ("development", "2", ["-x"]),
+        ("anvil-dev", "0", ["-x"]),
+        ("anvil-dev", "2", ["-x"]),
+    ]
+    assert [run["seconds"] for run in json.loads(output.read_text())] == [10.0, 5.0, 10.0, 5.0]
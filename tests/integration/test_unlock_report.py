@@ -0,0 +1,112 @@
+import json
+import random
+import time
+
+import pytest
+
+from utils.lens import read_escrows_state
+from utils.unlock_report import STEPS, UnlockPeriod, main, unlock_periods
+from utils.vesting_schedule import MAX_INT64_DURATION, VestingSchedule, time_grid
+
+pytestmark = pytest.mark.no_deploy
+
+DAY = STEPS["day"]
+NOW = 1_700_000_000
+
+
+def _random_schedule(count: int, seed: int = 0) -> VestingSchedule:
+    rnd = random.Random(seed)
+    start_time = [NOW + rnd.randint(-(10**8), 10**8) for _ in range(count)]
+    duration = [rnd.randint(1, 10**8) for _ in range(count)]
+    # the Python ints path for the escrows not fitting int64
+    for i in range(0, count, 50):
+        duration[i] = MAX_INT64_DURATION + rnd.randint(1, 10**9)
+    end_time = [start + d for start, d in zip(start_time, duration)]
+    total_locked = [rnd.choice([1, rnd.randint(1, 10**27), 2**255]) for _ in range(count)]
+    return VestingSchedule(
+        start_time=start_time,
+        end_time=end_time,
+        cliff_length=[rnd.randint(0, d) for d in duration],
+        total_locked=total_locked,
+        total_claimed=[rnd.randint(0, amount) for amount in total_locked],
+        disabled_at=[
+            rnd.choice([end, rnd.randint(start - DAY, end + DAY)]) for start, end in zip(start_time, end_time)
+        ],
+        is_fully_revoked=[rnd.random() < 0.1 for _ in range(count)],
+    )
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_total_unlocked_at_is_exact(seed):
+    schedule = _random_schedule(500, seed)
+    grid = time_grid(NOW - 2 * 10**8, NOW + 3 * 10**8, 10**6)
+
+    assert list(schedule.total_unlocked_at(grid)) == list(schedule.unlocked(grid).sum(axis=0))
+
+
+def test_total_unlocked_at_many_escrows():
+    schedule = _random_schedule(20_000)
+    grid = time_grid(NOW, NOW + 730 * DAY, DAY)
+
+    started = time.perf_counter()
+    totals = schedule.total_unlocked_at(grid)
+    elapsed = time.perf_counter() - started
+
+    assert len(totals) == len(grid)
+    assert (totals[1:] >= totals[:-1]).all()
+    assert elapsed < 5
+
+
+def test_total_unlocked_at_unsorted_times():
+    with pytest.raises(ValueError, match="sorted"):
+        _random_schedule(1).total_unlocked_at([NOW + 1, NOW])
+
+
+def test_unlocked_of_deployed(
+    deployed_vesting, deployed_vesting_with_cliff, vesting_lens, recipient, owner, chain, start_time, end_time
+):
+    chain.sleep(start_time - chain.time() + 1000)
+    deployed_vesting.claim({"from": recipient})
+    deployed_vesting_with_cliff.revoke_unvested({"from": owner})
+    states = read_escrows_state([deployed_vesting, deployed_vesting_with_cliff], vesting_lens)
+    schedule = VestingSchedule.from_states(states)
+    grid = time_grid(start_time - DAY, end_time + DAY, 3600)
+
+    unlocked = schedule.unlocked(grid)
+    assert (unlocked == schedule.unclaimed(grid) + schedule.total_claimed).all()
+    assert list(schedule.total_unlocked_at(grid)) == list(unlocked.sum(axis=0))
+
+
+def test_unlock_periods():
+    schedule = VestingSchedule(
+        start_time=[NOW],
+        end_time=[NOW + 10 * DAY],
+        cliff_length=[2 * DAY],
+        total_locked=[1_000],
+        total_claimed=[0],
+        disabled_at=[NOW + 10 * DAY],
+        is_fully_revoked=[False],
+    )
+
+    periods = unlock_periods(schedule, NOW, NOW + 5 * DAY, 2 * DAY)
+
+    assert periods == [
+        UnlockPeriod(NOW, NOW + 2 * DAY, "2023-11-16", 200, 200),
+        UnlockPeriod(NOW + 2 * DAY, NOW + 4 * DAY, "2023-11-18", 200, 400),
+        UnlockPeriod(NOW + 4 * DAY, NOW + 5 * DAY, "2023-11-19", 100, 500),
+    ]
+
+
+def test_report_from_csv(tmp_path):
+    (tmp_path / "params.csv").write_text(
+        "amount,recipient,vesting_duration,vesting_start,cliff_length,is_fully_revokable\n"
+        f"7000,0x0000000000000000000000000000000000000001,{7 * DAY},{NOW},0,0\n"
+        f"14000,0x0000000000000000000000000000000000000002,{14 * DAY},{NOW},{7 * DAY},1\n"
+    )
+    output = tmp_path / "report.json"
+
+    assert main([str(tmp_path / "*.csv"), "--start", str(NOW), "--periods", "3", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert [period["unlocked"] for period in report] == [14000, 7000, 0]
+    assert report[-1]["total_unlocked"] == 21000
@@ -0,0 +1,106 @@
+import pytest
+from brownie.test import given, strategy
+
+from tests.conftest import YEAR, fully_revocable
+from utils.lens import read_escrows_state
+from utils.vesting_params import iter_params_csv
+from utils.vesting_schedule import VestingSchedule, time_grid
+
+pytestmark = pytest.mark.no_deploy
+
+DURATION = int(3 * YEAR)
+
+
+def _schedule(vesting, lens) -> VestingSchedule:
+    return VestingSchedule.from_states(read_escrows_state([vesting], lens))
+
+
+@given(sleep_time=strategy("uint", max_value=DURATION + int(YEAR)))
+def test_unclaimed_matches_claim(deployed_vesting_with_cliff, vesting_lens, recipient, chain, start_time, sleep_time):
+    schedule = _schedule(deployed_vesting_with_cliff, vesting_lens)
+
+    chain.sleep(start_time - chain.time() + sleep_time)
+    tx = deployed_vesting_with_cliff.claim({"from": recipient})
+
+    assert tx.return_value == schedule.unclaimed([tx.timestamp])[0, 0]
+
+
+@given(sleep_time=strategy("uint", max_value=DURATION - 1000))
+def test_locked_matches_revoke(deployed_vesting, vesting_lens, owner, chain, start_time, sleep_time):
+    schedule = _schedule(deployed_vesting, vesting_lens)
+
+    chain.sleep(start_time - chain.time() + sleep_time)
+    tx = deployed_vesting.revoke_unvested({"from": owner})
+
+    assert tx.events["UnvestedTokensRevoked"]["revoked"] == schedule.locked([tx.timestamp])[0, 0]
+
+
+@given(
+    claim_time=strategy("uint", max_value=DURATION // 2),
+    revoke_time=strategy("uint", min_value=DURATION // 2, max_value=DURATION - 1000),
+    sleep_time=strategy("uint", max_value=DURATION),
+)
+def test_unclaimed_after_claim_and_revoke(
+    deployed_vesting,
+    vesting_lens,
+    recipient,
+    owner,
+    chain,
+    start_time,
+    claim_time,
+    revoke_time,
+    sleep_time,
+):
+    chain.sleep(start_time - chain.time() + claim_time)
+    deployed_vesting.claim({"from": recipient})
+    chain.sleep(start_time - chain.time() + revoke_time)
+    deployed_vesting.revoke_unvested({"from": owner})
+    schedule = _schedule(deployed_vesting, vesting_lens)
+
+    chain.sleep(sleep_time)
+    tx = deployed_vesting.claim({"from": recipient})
+
+    assert tx.return_value == schedule.unclaimed([tx.timestamp])[0, 0]
+    assert schedule.locked([tx.timestamp])[0, 0] == 0
+
+
+@fully_revocable
+def test_fully_revoked(deployed_vesting, vesting_lens, owner, chain, start_time, end_time):
+    chain.sleep(start_time - chain.time() + 1000)
+    deployed_vesting.revoke_all({"from": owner})
+    schedule = _schedule(deployed_vesting, vesting_lens)
+
+    grid = time_grid(start_time, end_time + 1000, 86400)
+    assert (schedule.unclaimed(grid) == 0).all()
+    assert (schedule.locked(grid) == 0).all()
+
+
+def test_many_escrows_at_many_times(deployed_vesting, deployed_vesting_with_cliff, vesting_lens, start_time, end_time):
+    schedule = VestingSchedule.from_states(
+        read_escrows_state([deployed_vesting, deployed_vesting_with_cliff], vesting_lens)
+    )
+    grid = time_grid(start_time - 1000, end_time + 1000, 3600)
+
+    unclaimed = schedule.unclaimed(grid)
+    locked = schedule.locked(grid)
+
+    assert unclaimed.shape == locked.shape == (2, len(grid))
+    assert ((unclaimed + locked) == schedule.total_locked).all()
+    assert (unclaimed[1] <= unclaimed[0]).all()
+    assert list(schedule.totals([end_time])["unclaimed"]) == [schedule.total_locked.sum()]
+
+
+def test_from_csv(tmp_path):
+    csv_path = tmp_path / "params.csv"
+    csv_path.write_text(
+        "amount,recipient,vesting_duration,vesting_start,cliff_length,is_fully_revokable\n"
+        "42_000,0x0000000000000000000000000000000000000001,144,1672480800,24,1\n"
+        "1_000,0x0000000000000000000000000000000000000002,100,1672308000,0,0\n"
+    )
+    schedule = VestingSchedule.from_csv(str(tmp_path / "*.csv"))
+    assert len(schedule) == len(list(iter_params_csv(str(csv_path))))
+
+    vested = schedule.total_vested_at([1672480800 + 23, 1672480800 + 24, 1672308000 + 50, 1672480800 + 144])
+
+    assert list(vested[0]) == [0, 42_000 * 24 // 144, 0, 42_000]
+    assert list(vested[1]) == [1_000, 1_000, 500, 1_000]
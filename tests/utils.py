@@ -1,6 +1,97 @@
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from brownie._config import __version__ as brownie_version
+
+# brownie releases whose `chain.reset()` reverts to the snapshot kept in `Chain._reset_id`
+RESET_POINT_BROWNIE_VERSIONS = ((1, 19), (1, 20))
+
+
 def mint_or_transfer_for_testing(owner, recipient, token, balance, deployed):
     if deployed:
         if recipient != owner:
             token.transfer(recipient, balance, {"from": owner})
     else:
         token._mint_for_testing(balance, {"from": recipient})
+
+
+def move_chain_reset_point(chain):
+    """
+    Make the current chain state the one `chain.reset()` reverts to instead of the state on connect
+
+    Brownie's `module_isolation` resets the chain before and after every module, so the contracts deployed before
+    the move survive it. Brownie has no public API for this, the reset snapshot id is the private `Chain._reset_id`,
+    hence the version guard: check `Chain.reset` of a new brownie release before adding it.
+    """
+    version = tuple(int(part) for part in brownie_version.split(".")[:2])
+    if version not in RESET_POINT_BROWNIE_VERSIONS:
+        raise RuntimeError(f"Moving the chain reset point is not checked with brownie {brownie_version}")
+    chain.snapshot()
+    chain._reset_id = chain._snapshot_id
+
+
+class _ProxyServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # the default backlog of 5 connections stalls concurrent clients on SYN retries
+    request_queue_size = 1024
+
+
+class LatencyProxy:
+    """JSON-RPC proxy delaying every request by `latency` seconds, a stand-in for a remote node in front of a local one"""
+
+    def __init__(self, endpoint_uri: str, latency: float):
+        self.endpoint_uri = endpoint_uri
+        self.latency = latency
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = _ProxyServer(("127.0.0.1", 0), self._handler())
+
+    @property
+    def uri(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "LatencyProxy":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _forward(self, body: bytes) -> bytes:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            request = urllib.request.Request(self.endpoint_uri, body, {"Content-Type": "application/json"})
+            with urllib.request.urlopen(request) as response:
+                return response.read()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _handler(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                response = proxy._forward(self.rfile.read(int(self.headers["Content-Length"])))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,111 @@
+import asyncio
+from typing import Any, Optional, Sequence, Union
+
+from aiohttp import ClientSession
+from brownie import ERC20, VestingEscrow, web3  # type: ignore
+from brownie.network.contract import ContractCall
+from web3 import Web3
+from web3.eth import AsyncEth
+from web3.providers.async_rpc import AsyncHTTPProvider
+
+from utils.env import get_env
+from utils.lens import EscrowState
+
+# view calls in flight at once, keep it under the rate limit of the node
+ASYNC_CONCURRENCY = 100
+
+# EscrowState fields read with the escrow views of the same name, the token balance is read from the token
+ESCROW_VIEW_FIELDS = EscrowState._fields[1:-1]
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def get_concurrency() -> int:
+    return int(get_env("ASYNC_CONCURRENCY") or ASYNC_CONCURRENCY)
+
+
+def async_web3(endpoint_uri: Optional[str] = None) -> Web3:
+    """Web3 with the asyncio `eth` module on the endpoint of the active brownie network by default"""
+    provider = AsyncHTTPProvider(endpoint_uri or web3.provider.endpoint_uri)
+    return Web3(provider, modules={"eth": (AsyncEth,)}, middlewares=[])
+
+
+def escrow_calls(escrows: Sequence[str], field: str) -> list[tuple]:
+    """Calls of the VestingEscrow view `field` of every escrow, built from the ABI without any RPC request"""
+    abi = next(item for item in VestingEscrow.abi if item.get("name") == field)
+    return [(ContractCall(escrow, abi, field, None),) for escrow in escrows]
+
+
+def token_balance_calls(tokens: Sequence[str], accounts: Sequence[str]) -> list[tuple]:
+    """Calls of `balanceOf` of every account on the token of the same index"""
+    abi = next(item for item in ERC20.abi if item.get("name") == "balanceOf")
+    return [(ContractCall(token, abi, "balanceOf", None), account) for token, account in zip(tokens, accounts)]
+
+
+def async_read_escrows_state(
+    escrows: Sequence[str],
+    concurrency: Optional[int] = None,
+    endpoint_uri: Optional[str] = None,
+    block_identifier: Union[int, str, None] = None,
+) -> list[EscrowState]:
+    """
+    Read the same state as `utils.lens.read_escrows_state` with concurrent calls of the escrows views
+
+    Needs no VestingLens. All the calls read the same block, the latest one at the time of the call by default. The
+    token balance of an escrow without a token is 0.
+    """
+    if not escrows:
+        return []
+    if block_identifier is None:
+        block_identifier = web3.eth.block_number
+
+    calls = [call for field in ESCROW_VIEW_FIELDS for call in escrow_calls(escrows, field)]
+    values = async_batch_call(calls, concurrency, endpoint_uri, block_identifier)
+    count = len(escrows)
+    rows = list(zip(*(values[i : i + count] for i in range(0, len(values), count))))
+
+    tokens = [row[ESCROW_VIEW_FIELDS.index("token")] for row in rows]
+    with_token = [i for i, token in enumerate(tokens) if token != ZERO_ADDRESS]
+    balances = [0] * count
+    calls = token_balance_calls([tokens[i] for i in with_token], [escrows[i] for i in with_token])
+    for i, balance in zip(with_token, async_batch_call(calls, concurrency, endpoint_uri, block_identifier)):
+        balances[i] = balance
+
+    return [EscrowState(escrow, *row, balance) for escrow, row, balance in zip(escrows, rows, balances)]
+
+
+def async_batch_call(
+    calls: Sequence[tuple],
+    concurrency: Optional[int] = None,
+    endpoint_uri: Optional[str] = None,
+    block_identifier: Union[int, str, None] = None,
+) -> list[Any]:
+    """
+    Execute view calls as concurrent `eth_call` requests and decode the results
+
+    Takes the same calls as `utils.multicall.batch_call`, a tuple of a contract view method followed by its
+    arguments, and returns the results in the calls order. At most `concurrency` requests are in flight. All the
+    calls read the same block, the latest one at the time of the call by default.
+    """
+    if not calls:
+        return []
+    if block_identifier is None:
+        block_identifier = web3.eth.block_number
+    w3 = async_web3(endpoint_uri)
+    return asyncio.run(_gather_calls(w3, calls, concurrency or get_concurrency(), block_identifier))
+
+
+async def _gather_calls(w3: Web3, calls: Sequence[tuple], concurrency: int, block_identifier) -> list[Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(method: ContractCall, *args) -> Any:
+        async with semaphore:
+            data = await w3.eth.call(  # type: ignore
+                {"to": method._address, "data": method.encode_input(*args)}, block_identifier
+            )
+        return method.decode_output(data.hex())
+
+    # the session cached by web3 is bound to the event loop, so every run gets its own one
+    async with ClientSession(raise_for_status=True) as session:
+        await w3.provider.cache_async_session(session)  # type: ignore
+        return await asyncio.gather(*(call(*c) for c in calls))
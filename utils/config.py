@@ -1,23 +1,41 @@
-from dotmap import DotMap
+import importlib
+import os
+from functools import lru_cache
+from typing import Optional
+
 from brownie import network
 from brownie.utils import color
+from dotmap import DotMap
+
+DEFAULT_PARAMS_MODULE = "vesting_initial_params"
+PARAMS_FIELDS = ("TOKEN", "OWNER", "MANAGER", "ARAGON_VOTING", "SNAPSHOT_DELEGATION")
+
+
+def params_module_name(network_name: str) -> str:
+    """`vesting_initial_params_{network}` if there is such a file, `vesting_initial_params` otherwise"""
+    name = f"{DEFAULT_PARAMS_MODULE}_{network_name.replace('-', '_')}"
+    return name if os.path.isfile(f"{name}.py") else DEFAULT_PARAMS_MODULE
+
 
-if network.show_active() == "holesky":
-    print(f'Using {color("cyan")}vesting_initial_params_holesky.py{color} addresses')
-    from vesting_initial_params_holesky import *
-else:
-    print(f'Using {color("magenta")}vesting_initial_params.py{color} addresses')
-    from vesting_initial_params import *
+@lru_cache(maxsize=None)
+def get_network_params(network_name: Optional[str] = None) -> DotMap:
+    """Initial params of the network, the active one by default, resolved on the first call"""
+    module_name = params_module_name(network_name or network.show_active())
+    highlight = "magenta" if module_name == DEFAULT_PARAMS_MODULE else "cyan"
+    print(f"Using {color(highlight)}{module_name}.py{color} addresses")
+    module = importlib.import_module(module_name)
+    return DotMap({field: getattr(module, field) for field in PARAMS_FIELDS})
 
 
 def get_common_deploy_args():
+    params = get_network_params(network.show_active())
     return DotMap(
         {
-            "token": TOKEN,
-            "owner": OWNER,
-            "manager": MANAGER,
-            "aragon_voting": ARAGON_VOTING,
-            "snapshot_delegation": SNAPSHOT_DELEGATION,
+            "token": params.TOKEN,
+            "owner": params.OWNER,
+            "manager": params.MANAGER,
+            "aragon_voting": params.ARAGON_VOTING,
+            "snapshot_delegation": params.SNAPSHOT_DELEGATION,
         }
     )
 
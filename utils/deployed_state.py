@@ -1,10 +1,20 @@
+import fcntl
 import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from stat import S_IMODE
+from typing import Optional
 
 from brownie import network
 from dotmap import DotMap
 
 import utils.log as log
 
+# of a new state file, as created by open() with the usual umask
+DEFAULT_FILE_MODE = 0o644
+
 
 def load_json(file):
     try:
@@ -13,16 +23,140 @@ def load_json(file):
         return {}
 
 
+class DeployedState:
+    """
+    Deployed contracts metadata of a network, `deployed-{network}.json`
+
+    The parsed state is kept in memory and the file is parsed again only when another process has replaced it.
+    Updates are made under an exclusive lock of the `.lock` file next to it, merged into the latest state on disk
+    and written to a temporary file renamed over the state file, so readers never see a partial write. Every update
+    is also appended to the `.journal.jsonl` file, keeping the history of all the deployed addresses and txs.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.lock_filename = f"{filename}.lock"
+        self.journal_filename = f"{os.path.splitext(filename)[0]}.journal.jsonl"
+        self._state: dict = {}
+        self._stat: Optional[tuple] = None
+        self._map: Optional[DotMap] = None
+
+    def read(self) -> DotMap:
+        """
+        The state as a `DotMap` built once per change of the state and shared by all the callers, so it must not be
+        modified. It is not dynamic, a missing key is read with `get` instead of being added as an empty map.
+        """
+        self._reload()
+        return self._dotmap()
+
+    def update(self, state_update: dict) -> DotMap:
+        with self._lock():
+            self._reload()
+            state = {**self._state, **state_update}
+            self._write(state)
+            self._append_journal(state_update)
+            self._set(state, self._file_stat())
+        log.info("Saving metadata to", self.filename)
+        return self._dotmap()
+
+    def journal(self) -> list[dict]:
+        """All the updates made to the state, oldest first"""
+        try:
+            with open(self.journal_filename, encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _reload(self) -> None:
+        stat = self._file_stat()
+        if stat == self._stat:
+            return
+        try:
+            with open(self.filename, encoding="utf-8") as f:
+                state = load_json(f)
+        except FileNotFoundError:
+            state = {}
+        self._set(state, stat)
+
+    def _set(self, state: dict, stat: Optional[tuple]) -> None:
+        self._state = state
+        self._stat = stat
+        self._map = None
+
+    def _dotmap(self) -> DotMap:
+        if self._map is None:
+            self._map = DotMap(self._state, _dynamic=False)
+        return self._map
+
+    def _file_stat(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        # the inode changes on every rename over the file
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _write(self, state: dict) -> None:
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        fd, tmp_filename = tempfile.mkstemp(prefix=".deployed-", suffix=".tmp", dir=directory)
+        try:
+            # mkstemp creates the file readable by the owner only, keep the mode of the replaced file
+            os.chmod(tmp_filename, self._file_mode())
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, self.filename)
+        except BaseException:
+            os.unlink(tmp_filename)
+            raise
+        _fsync_dir(directory)
+
+    def _file_mode(self) -> int:
+        try:
+            return S_IMODE(os.stat(self.filename).st_mode)
+        except FileNotFoundError:
+            return DEFAULT_FILE_MODE
+
+    def _append_journal(self, state_update: dict) -> None:
+        entry = {"time": int(time.time()), "pid": os.getpid(), "update": state_update}
+        with open(self.journal_filename, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @contextmanager
+    def _lock(self):
+        with open(self.lock_filename, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+_states: dict[str, DeployedState] = {}
+
+
+def get_deployed_state(filename: Optional[str] = None) -> DeployedState:
+    """Store of the given file, `deployed-{network}.json` of the active network by default, one per process"""
+    filename = filename or f"./deployed-{network.show_active()}.json"
+    if filename not in _states:
+        _states[filename] = DeployedState(filename)
+    return _states[filename]
+
+
 def read_or_update_state(stateUpdate={}):
-    deployed_filename = f"./deployed-{network.show_active()}.json"
-    with open(deployed_filename, "a+") as fp:
-        fp.seek(0)
-        state = load_json(fp)
-        if stateUpdate:
-            state = {**state, **stateUpdate}
-            fp.seek(0)
-            fp.truncate()
-            json.dump(state, fp, indent=4)
-            log.info("Saving metadata to", deployed_filename)
-        fp.close()
-    return DotMap(state)
+    state = get_deployed_state()
+    if stateUpdate:
+        return state.update(stateUpdate)
+    return state.read()
+
+
+def _fsync_dir(directory: str) -> None:
+    """Persist the rename itself"""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
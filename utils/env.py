@@ -1,9 +1,15 @@
 import os
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
-load_dotenv()
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load `.env` once, on the first env read instead of the import"""
+    load_dotenv()
 
 
 def get_env(name):
+    load_env()
     return os.getenv(name)
@@ -0,0 +1,129 @@
+import sqlite3
+from typing import Iterable, NamedTuple, Optional
+
+from brownie import network  # type: ignore
+
+from utils.env import get_env
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS escrows (
+    escrow TEXT PRIMARY KEY,
+    factory TEXT NOT NULL,
+    creator TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS escrows_recipient ON escrows (recipient);
+CREATE INDEX IF NOT EXISTS escrows_block_number ON escrows (block_number);
+
+CREATE TABLE IF NOT EXISTS escrow_events (
+    escrow TEXT NOT NULL,
+    event TEXT NOT NULL,
+    account TEXT NOT NULL,
+    amount TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS escrow_events_escrow ON escrow_events (escrow);
+CREATE INDEX IF NOT EXISTS escrow_events_block_number ON escrow_events (block_number);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    factory TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL
+);
+"""
+
+
+class EscrowCreated(NamedTuple):
+    """VestingEscrowCreated event of the factory"""
+
+    escrow: str
+    factory: str
+    creator: str
+    recipient: str
+    block_number: int
+    tx_hash: str
+    log_index: int
+
+
+class EscrowEvent(NamedTuple):
+    """Claim, UnvestedTokensRevoked, VestingFullyRevoked or ERC20Recovered event of the escrow"""
+
+    escrow: str
+    event: str
+    account: str  # beneficiary, recoverer or recovered token
+    amount: int
+    block_number: int
+    tx_hash: str
+    log_index: int
+
+
+class EventIndex:
+    """SQLite storage of the factory and escrows events"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "EventIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def last_synced_block(self, factory: str) -> Optional[int]:
+        row = self._conn.execute("SELECT last_block FROM sync_state WHERE factory = ?", (factory,)).fetchone()
+        return row[0] if row else None
+
+    def save_chunk(
+        self,
+        factory: str,
+        last_block: int,
+        created: Iterable[EscrowCreated],
+        events: Iterable[EscrowEvent],
+    ) -> None:
+        """Store events of the synced block range and move the sync pointer in a single transaction"""
+        with self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO escrows VALUES (?, ?, ?, ?, ?, ?, ?)", created)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO escrow_events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (e._replace(amount=str(e.amount)) for e in events),
+            )
+            self._conn.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (factory, last_block))
+
+    def escrows(self, factory: Optional[str] = None, recipient: Optional[str] = None) -> list[EscrowCreated]:
+        rows = self._select("escrows", factory=factory, recipient=recipient)
+        return [EscrowCreated(*row) for row in rows]
+
+    def events(self, escrow: Optional[str] = None, event: Optional[str] = None) -> list[EscrowEvent]:
+        rows = self._select("escrow_events", escrow=escrow, event=event)
+        return [EscrowEvent(*row[:3], int(row[3]), *row[4:]) for row in rows]
+
+    def _select(self, table: str, **filters) -> list[tuple]:
+        filters = {column: value for column, value in filters.items() if value is not None}
+        query = f"SELECT * FROM {table}"
+        if filters:
+            query += " WHERE " + " AND ".join(f"{column} = :{column}" for column in filters)
+        query += " ORDER BY block_number, log_index"
+        return self._conn.execute(query, filters).fetchall()
+
+
+def default_db_path() -> str:
+    """Index of the active network, `./escrows-{network}.sqlite`"""
+    return f"./escrows-{network.show_active()}.sqlite"
+
+
+def get_factory_address(factory_address: Optional[str] = None) -> str:
+    """Indexed factory, FACTORY_ADDRESS env unless given"""
+    factory_address = factory_address or get_env("FACTORY_ADDRESS")
+    if not factory_address:
+        raise RuntimeError("Factory address is not provided and FACTORY_ADDRESS env is not set")
+    return factory_address
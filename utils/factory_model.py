@@ -0,0 +1,348 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence, Union
+
+import rlp
+from eth_utils import keccak, to_canonical_address, to_checksum_address
+
+from utils.vesting_params import VestingParams
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+MAX_UINT256 = 2**256 - 1
+# VestingEscrowFactory.MAX_BATCH_SIZE
+MAX_BATCH_SIZE = 100
+
+
+class Revert(Exception):
+    """Modelled revert, `reason` is None for reverts without a reason string, e.g. on uint256 overflow"""
+
+    def __init__(self, reason: Optional[str]):
+        super().__init__(reason or "reverted without a reason")
+        self.reason = reason
+
+
+class VestingEscrowCreated(NamedTuple):
+    creator: str
+    recipient: str
+    escrow: str
+
+
+class VestingEscrowInitialized(NamedTuple):
+    factory: str
+    recipient: str
+    token: str
+    amount: int
+    start_time: int
+    end_time: int
+    cliff_length: int
+    is_fully_revokable: bool
+
+
+class Transfer(NamedTuple):
+    sender: str
+    receiver: str
+    value: int
+
+
+Event = Union[VestingEscrowCreated, VestingEscrowInitialized, Transfer]
+
+
+class EscrowModel(NamedTuple):
+    """Storage of the initialized VestingEscrow"""
+
+    escrow: str
+    recipient: str
+    token: str
+    start_time: int
+    end_time: int
+    cliff_length: int
+    factory: str
+    total_locked: int
+    is_fully_revokable: bool
+    total_claimed: int
+    disabled_at: int
+    initialized: bool
+    is_fully_revoked: bool
+
+
+class TokenModel:
+    """ERC20 balances and allowances, a failed transfer returns False like LDO (MiniMe) does"""
+
+    def __init__(self, balances: Optional[dict] = None, allowances: Optional[dict] = None):
+        self.balances: dict[str, int] = defaultdict(int, balances or {})
+        self.allowances: dict[tuple[str, str], int] = defaultdict(int, allowances or {})
+
+    def transfer(self, sender: str, receiver: str, value: int) -> bool:
+        if self.balances[sender] < value:
+            return False
+        self.balances[sender] -= value
+        self.balances[receiver] += value
+        return True
+
+    def transfer_from(self, spender: str, sender: str, receiver: str, value: int) -> bool:
+        if self.allowances[sender, spender] < value or self.balances[sender] < value:
+            return False
+        self.allowances[sender, spender] -= value
+        return self.transfer(sender, receiver, value)
+
+
+class FactoryModel:
+    """
+    Pure Python model of `VestingEscrowFactory.deploy_vesting_contract(s)` and `VestingEscrow.initialize`
+
+    Mirrors the asserts with their reasons, the token transfers, the escrow storage, the emitted events and the
+    addresses of the escrows, created with CREATE from the factory address and nonce. A reverted call leaves the
+    model untouched, as a reverted transaction leaves the chain.
+    """
+
+    def __init__(self, address: str, token: str, token_model: TokenModel, nonce: int = 1):
+        self.address = to_checksum_address(address)
+        self.token = to_checksum_address(token)
+        self.token_model = token_model
+        self.nonce = nonce  # contracts start with nonce 1 (EIP-161)
+        self.escrows: dict[str, EscrowModel] = {}
+        self.events: list[Event] = []
+
+    def deploy_vesting_contract(self, sender: str, params: VestingParams) -> str:
+        """Model of the transaction calling `deploy_vesting_contract` with all the arguments"""
+        with self._transaction():
+            return self._deploy_vesting_contract(to_checksum_address(sender), to_checksum_address(sender), params)
+
+    def deploy_vesting_contracts(self, sender: str, params_list: Sequence[VestingParams]) -> list[str]:
+        """Model of the transaction calling `deploy_vesting_contracts`"""
+        sender = to_checksum_address(sender)
+        if len(params_list) > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch of {len(params_list)} vestings exceeds MAX_BATCH_SIZE of {MAX_BATCH_SIZE}")
+
+        with self._transaction():
+            _assert(len(params_list) > 0, "empty batch")
+            total = _uint256(sum(params.amount for params in params_list))
+            _assert(
+                self.token_model.transfer_from(self.address, sender, self.address, total),
+                "transferFrom deployer to factory failed",
+            )
+            self.events.append(Transfer(sender, self.address, total))
+            return [self._deploy_vesting_contract(sender, self.address, params) for params in params_list]
+
+    def _deploy_vesting_contract(self, sender: str, funder: str, params: VestingParams) -> str:
+        amount, recipient, vesting_duration, vesting_start, cliff_length, is_fully_revokable = params
+        for field, value in zip(VestingParams._fields, params):
+            if isinstance(value, int) and not isinstance(value, bool) and not 0 <= value <= MAX_UINT256:
+                raise ValueError(f"{field}={value} is out of uint256 range")
+        recipient = to_checksum_address(recipient)
+
+        _assert(vesting_duration > 0, "incorrect vesting duration")
+        _assert(cliff_length <= vesting_duration, "incorrect vesting cliff")
+        _assert(recipient != ZERO_ADDRESS, "zero recipient")
+        _assert(amount > 0, "incorrect amount")
+
+        escrow = _create_address(self.address, self.nonce)
+        self.nonce += 1
+
+        if funder == self.address:
+            _assert(
+                self.token_model.transfer(self.address, escrow, amount),
+                "transfer factory to escrow failed",
+            )
+        else:
+            _assert(
+                self.token_model.transfer_from(self.address, funder, escrow, amount),
+                "transferFrom deployer to escrow failed",
+            )
+        self.events.append(Transfer(funder, escrow, amount))
+
+        end_time = _uint256(vesting_start + vesting_duration)
+        self._initialize(escrow, amount, recipient, vesting_start, end_time, cliff_length, is_fully_revokable)
+
+        self.events.append(VestingEscrowCreated(sender, recipient, escrow))
+        return escrow
+
+    def _initialize(
+        self,
+        escrow: str,
+        amount: int,
+        recipient: str,
+        start_time: int,
+        end_time: int,
+        cliff_length: int,
+        is_fully_revokable: bool,
+    ) -> None:
+        _assert(escrow not in self.escrows, "can only initialize once")
+        _assert(self.token_model.balances[escrow] >= amount, "insufficient balance")
+
+        self.escrows[escrow] = EscrowModel(
+            escrow=escrow,
+            recipient=recipient,
+            token=self.token,
+            start_time=start_time,
+            end_time=end_time,
+            cliff_length=cliff_length,
+            factory=self.address,
+            total_locked=amount,
+            is_fully_revokable=is_fully_revokable,
+            total_claimed=0,
+            disabled_at=end_time,
+            initialized=True,
+            is_fully_revoked=False,
+        )
+        self.events.append(
+            VestingEscrowInitialized(
+                self.address, recipient, self.token, amount, start_time, end_time, cliff_length, is_fully_revokable
+            )
+        )
+
+    def _transaction(self):
+        return _Rollback(self)
+
+
+class VestingEscrowModel:
+    """
+    Pure Python model of the `VestingEscrow` calls after the initialization, stepped at the given block timestamps
+
+    Mirrors the asserts with their reasons, the vesting math with the reverts on uint256 overflow and underflow, and
+    the token transfers. The calls return the amount logged by the call event, the claimed amount for `claim`. Only
+    the escrow token is modelled. A call checks everything before changing the state, so a revert leaves the model
+    untouched.
+    """
+
+    def __init__(self, storage: EscrowModel, token_model: TokenModel, owner: str, manager: str):
+        self.storage = storage
+        self.token_model = token_model
+        self.owner = _checksum(owner)
+        self.manager = _checksum(manager)
+
+    def total_vested_at(self, time: int) -> int:
+        start_time, end_time, locked = self.storage.start_time, self.storage.end_time, self.storage.total_locked
+        if time < _uint256(start_time + self.storage.cliff_length):
+            return 0
+        return min(_uint256(locked * (time - start_time)) // _sub(end_time, start_time), locked)
+
+    def unclaimed(self, now: int) -> int:
+        if self.storage.is_fully_revoked:
+            return 0
+        claim_time = min(now, self.storage.disabled_at)
+        return _sub(self.total_vested_at(claim_time), self.storage.total_claimed)
+
+    def locked(self, now: int) -> int:
+        if now >= self.storage.disabled_at:
+            return 0
+        return _sub(self.storage.total_locked, self.total_vested_at(now))
+
+    def claim(self, sender: str, now: int, beneficiary: Optional[str] = None, amount: int = MAX_UINT256) -> int:
+        sender = _checksum(sender)
+        _assert(sender == self.storage.recipient, "msg.sender not recipient")
+
+        claimable = min(self.unclaimed(now), amount)
+        self._transfer(_checksum(beneficiary or sender), claimable)
+        self.storage = self.storage._replace(total_claimed=self.storage.total_claimed + claimable)
+        return claimable
+
+    def revoke_unvested(self, sender: str, now: int) -> int:
+        _assert(_checksum(sender) in (self.owner, self.manager), "msg.sender not owner or manager")
+
+        revokable = self.locked(now)
+        _assert(revokable > 0, "nothing to revoke")
+        self._transfer(self.owner, revokable)
+        self.storage = self.storage._replace(disabled_at=now)
+        return revokable
+
+    def revoke_all(self, sender: str, now: int) -> int:
+        _assert(_checksum(sender) == self.owner, "msg.sender not owner")
+        _assert(self.storage.is_fully_revokable, "not allowed for ordinary vesting")
+        _assert(not self.storage.is_fully_revoked, "already fully revoked")
+
+        revokable = _uint256(self.locked(now) + self.unclaimed(now))
+        _assert(revokable > 0, "nothing to revoke")
+        self._transfer(self.owner, revokable)
+        self.storage = self.storage._replace(is_fully_revoked=True, disabled_at=now)
+        return revokable
+
+    def recover_erc20(self, sender: str, now: int, token: str, amount: int) -> int:
+        if _checksum(token) != self.storage.token:
+            raise ValueError(f"Only the escrow token {self.storage.token} is modelled")
+
+        balance = self.token_model.balances[self.storage.escrow]
+        recoverable = min(amount, _sub(balance, _uint256(self.locked(now) + self.unclaimed(now))))
+        if recoverable > 0:
+            self._transfer(self.storage.recipient, recoverable)
+        return recoverable
+
+    def _transfer(self, receiver: str, value: int) -> None:
+        _assert(self.token_model.transfer(self.storage.escrow, receiver, value), "transfer failed")
+
+
+class _Rollback:
+    """Restore the model state if the modelled transaction reverts"""
+
+    def __init__(self, model: FactoryModel):
+        self.model = model
+
+    def __enter__(self):
+        token = self.model.token_model
+        self.state = (
+            self.model.nonce,
+            dict(self.model.escrows),
+            len(self.model.events),
+            dict(token.balances),
+            dict(token.allowances),
+        )
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            return
+        nonce, escrows, events_count, balances, allowances = self.state
+        self.model.nonce = nonce
+        self.model.escrows = escrows
+        del self.model.events[events_count:]
+        self.model.token_model.balances = defaultdict(int, balances)
+        self.model.token_model.allowances = defaultdict(int, allowances)
+
+
+def simulate_deployment(
+    params_list: Sequence[VestingParams], funder: str, token: str, factory: str = ZERO_ADDRESS
+) -> tuple[FactoryModel, list[tuple[int, str]]]:
+    """
+    Model the multisend deploying every row with `deploy_vesting_contract` after a single approval of the total
+
+    The funder is assumed to hold the total, so only the rows are checked, and only the escrow addresses depend on
+    the factory. Returns the model and the (row, reason) list of the reverting rows; the rest of the rows are still
+    deployed in the model.
+    """
+    total = sum(params.amount for params in params_list)
+    funder = to_checksum_address(funder)
+    factory = to_checksum_address(factory)
+    model = FactoryModel(factory, token, TokenModel({funder: total}, {(funder, factory): total}))
+
+    errors = []
+    for num, params in enumerate(params_list):
+        try:
+            model.deploy_vesting_contract(funder, params)
+        except (Revert, ValueError) as e:
+            errors.append((num, str(e)))
+    return model, errors
+
+
+def _assert(condition: bool, reason: Optional[str]) -> None:
+    if not condition:
+        raise Revert(reason)
+
+
+def _uint256(value: int) -> int:
+    """Vyper reverts without a reason on uint256 overflow"""
+    _assert(value <= MAX_UINT256, None)
+    return value
+
+
+def _sub(a: int, b: int) -> int:
+    """Vyper reverts without a reason on uint256 underflow"""
+    _assert(a >= b, None)
+    return a - b
+
+
+# a step of the escrow model is cheaper than checksumming its addresses
+_checksum = lru_cache(maxsize=None)(to_checksum_address)
+
+
+def _create_address(sender: str, nonce: int) -> str:
+    """Address of the contract created with CREATE"""
+    return to_checksum_address(keccak(rlp.encode([to_canonical_address(sender), nonce]))[12:])
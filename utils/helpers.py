@@ -1,4 +1,3 @@
-import os
 import sys
 from contextlib import contextmanager
 
@@ -12,9 +11,14 @@ def get_is_live():
     return network.show_active() != "development"
 
 
+def is_development_chain():
+    active = network.show_active()
+    return active == "development" or active.endswith("-fork")
+
+
 def get_deployer_account():
     is_live = get_is_live()
-    if is_live and "DEPLOYER" not in os.environ:
+    if is_live and get_env("DEPLOYER") is None:
         raise EnvironmentError("Please set DEPLOYER env variable to the deployer account name")
 
     return loadAccount("DEPLOYER") if is_live else accounts[0]
@@ -0,0 +1,35 @@
+from eth_utils import to_canonical_address
+
+# EIP-5202 blueprint preamble: magic 0xFE71, version 0, no data section
+BLUEPRINT_PREAMBLE = bytes.fromhex("fe7100")
+
+# Initcode returning the rest of its code as the runtime:
+#   PUSH1 11, CODESIZE, SUB, DUP1, PUSH1 11, RETURNDATASIZE, CODECOPY, RETURNDATASIZE, RETURN
+# `create_from_blueprint` appends the ABI encoded args to the initcode, so they end up after the proxy code.
+RUNTIME_COPIER = bytes.fromhex("600b380380600b3d393df3")
+
+# EIP-1167 minimal proxy runtime split around the implementation address,
+# must be in sync with `VestingEscrowImmutableArgs.ARGS_OFFSET`
+PROXY_PREFIX = bytes.fromhex("363d3d373d3d3d363d73")
+PROXY_SUFFIX = bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+
+# Vyper blueprint deploy code: PUSH2 len, RETURNDATASIZE, DUP2, PUSH1 10, RETURNDATASIZE, CODECOPY, RETURN
+DEPLOY_PREAMBLE = "61{:04x}3d81600a3d39f3"
+
+
+def blueprint_code(implementation: str) -> bytes:
+    """Code of the blueprint deploying EIP-1167 proxies to the implementation with the constructor args appended"""
+    return BLUEPRINT_PREAMBLE + RUNTIME_COPIER + PROXY_PREFIX + to_canonical_address(implementation) + PROXY_SUFFIX
+
+
+def blueprint_deploy_code(implementation: str) -> bytes:
+    code = blueprint_code(implementation)
+    return bytes.fromhex(DEPLOY_PREAMBLE.format(len(code))) + code
+
+
+def deploy_immutable_args_blueprint(implementation: str, tx_params: dict) -> str:
+    """Deploy the blueprint to be used as `VestingEscrowFactoryImmutableArgs` target, return its address"""
+    tx_params = dict(tx_params)
+    sender = tx_params.pop("from")
+    tx = sender.transfer(data=blueprint_deploy_code(str(implementation)), **tx_params)
+    return tx.contract_address
@@ -0,0 +1,109 @@
+from typing import NamedTuple, Optional, Sequence
+
+from brownie import VestingLens, accounts, web3  # type: ignore
+
+import utils.log as log
+from utils.env import get_env
+from utils.helpers import is_development_chain
+from utils.params_cache import EscrowParams, ParamsCache
+
+# must not exceed VestingLens.MAX_ESCROWS
+LENS_CHUNK_SIZE = 100
+
+
+class EscrowState(NamedTuple):
+    """State of the VestingEscrow as returned by VestingLens.get_escrows_state"""
+
+    escrow: str
+    recipient: str
+    token: str
+    start_time: int
+    end_time: int
+    cliff_length: int
+    factory: str
+    total_locked: int
+    is_fully_revokable: bool
+    total_claimed: int
+    disabled_at: int
+    initialized: bool
+    is_fully_revoked: bool
+    unclaimed: int
+    locked: int
+    token_balance: int
+
+
+def get_lens() -> VestingLens:
+    """Get VestingLens at VESTING_LENS_ADDRESS or deploy a new one on a development chain"""
+    address = get_env("VESTING_LENS_ADDRESS")
+    if address:
+        return VestingLens.at(address)
+
+    if not is_development_chain():
+        raise RuntimeError("VESTING_LENS_ADDRESS env is required on live networks")
+
+    lens = VestingLens.deploy({"from": accounts[0]})
+    log.info("VestingLens deployed at", lens.address)
+    return lens
+
+
+def get_params_cache() -> Optional[ParamsCache]:
+    """
+    Cache of the escrows params at ESCROW_PARAMS_CACHE path, `./escrow-params.sqlite` by default
+
+    Entries of reorged blocks are dropped on open. No cache on development chains, their escrows don't outlive the run.
+    """
+    if is_development_chain():
+        return None
+
+    cache = ParamsCache(get_env("ESCROW_PARAMS_CACHE") or "./escrow-params.sqlite")
+    dropped = cache.invalidate_reorged(web3.eth.chain_id, web3.eth.block_number, _block_hash)
+    if dropped:
+        log.warn("Escrow params of reorged blocks dropped from the cache", dropped)
+    return cache
+
+
+def read_escrows_state(
+    escrows: Sequence[str],
+    lens: Optional[VestingLens] = None,
+    chunk_size: int = LENS_CHUNK_SIZE,
+    cache: Optional[ParamsCache] = None,
+) -> list[EscrowState]:
+    """
+    Read the state of the given escrows with one eth_call per chunk of escrows
+
+    With the cache given, all the chunks are read at the same block and the params of the initialized escrows are
+    saved to the cache.
+    """
+    lens = lens or get_lens()
+    block = web3.eth.get_block("latest") if cache else None
+    block_identifier = block.number if block else None
+
+    states = []
+    for i in range(0, len(escrows), chunk_size):
+        chunk = list(escrows[i : i + chunk_size])
+        states.extend(EscrowState(*s) for s in lens.get_escrows_state(chunk, block_identifier=block_identifier))
+
+    if cache:
+        params = (EscrowParams.from_state(state) for state in states if state.initialized)
+        cache.save(web3.eth.chain_id, params, block.number, block.hash.hex())
+    return states
+
+
+def read_escrows_params(
+    escrows: Sequence[str],
+    lens: Optional[VestingLens] = None,
+    chunk_size: int = LENS_CHUNK_SIZE,
+    cache: Optional[ParamsCache] = None,
+) -> list[EscrowParams]:
+    """Immutable params of the given escrows, only the escrows missing from the cache are read with the lens"""
+    cached = cache.get(web3.eth.chain_id, escrows) if cache else {}
+    missing = [escrow for escrow in escrows if escrow not in cached]
+    if missing:
+        states = read_escrows_state(missing, lens, chunk_size, cache)
+        cached.update((state.escrow, EscrowParams.from_state(state)) for state in states)
+    return [cached[escrow] for escrow in escrows]
+
+
+def _block_hash(block_number: int) -> Optional[str]:
+    block = web3.eth.get_block(block_number)
+    return block.hash.hex() if block else None
@@ -0,0 +1,45 @@
+import json
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_utils import encode_hex
+
+# the signed values checked by `multisig_tx` instead of asking the operator
+MANIFEST_FIELDS = ("csv_sha256", "safe", "factory")
+
+
+def manifest_message(manifest: dict) -> str:
+    """Canonical text of the manifest signed by its author"""
+    body = {k: v for k, v in manifest.items() if k != "signature"}
+    return json.dumps(body, sort_keys=True, separators=(",", ":"))
+
+
+def sign_manifest(body: dict, private_key) -> dict:
+    """Add the signer and the EIP-191 signature of the manifest body"""
+    manifest = {**body, "signer": Account.from_key(private_key).address}
+    signed = Account.sign_message(encode_defunct(text=manifest_message(manifest)), private_key=private_key)
+    return {**manifest, "signature": encode_hex(signed.signature)}
+
+
+def verify_manifest(manifest: dict, trusted_signer: str) -> dict:
+    """Check the manifest has all the fields and is signed by the trusted signer"""
+    missing = [field for field in (*MANIFEST_FIELDS, "signer", "signature") if field not in manifest]
+    if missing:
+        raise ValueError(f"Manifest fields missing: {', '.join(missing)}")
+
+    signer = Account.recover_message(encode_defunct(text=manifest_message(manifest)), signature=manifest["signature"])
+    if signer.lower() != trusted_signer.lower() or signer.lower() != manifest["signer"].lower():
+        raise ValueError(f"Manifest is signed by {signer}, expected {trusted_signer}")
+    return manifest
+
+
+def load_manifest(filename: str, trusted_signer: str) -> dict:
+    """Read the manifest file and verify it"""
+    with open(filename, encoding="utf-8") as f:
+        return verify_manifest(json.load(f), trusted_signer)
+
+
+def save_manifest(manifest: dict, filename: str) -> None:
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,70 @@
+from typing import Any, Optional, Sequence
+
+from brownie import Multicall3, accounts, chain, web3  # type: ignore
+from brownie.network.contract import ContractCall
+
+import utils.log as log
+from utils.env import get_env
+from utils.helpers import is_development_chain
+
+# https://github.com/mds1/multicall#multicall3-contract-addresses
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# must not exceed Multicall3.MAX_CALLS of the development stand-in
+MULTICALL_CHUNK_SIZE = 100
+
+# Multicall3 of each chain id, resolved once
+_multicalls: dict[int, Multicall3] = {}
+
+
+def get_multicall() -> Multicall3:
+    """Get Multicall3 of the active network or deploy the stand-in on a development chain"""
+    multicall = _multicalls.get(chain.id)
+    # brownie drops the contracts wiped by a chain revert from the container, so the stand-in is checked locally
+    if multicall is None or (multicall.address != MULTICALL3_ADDRESS and multicall not in Multicall3):
+        multicall = _multicalls[chain.id] = _resolve_multicall()
+    return multicall
+
+
+def _resolve_multicall() -> Multicall3:
+    if web3.eth.get_code(MULTICALL3_ADDRESS):
+        return Multicall3.at(MULTICALL3_ADDRESS)
+
+    if not is_development_chain():
+        raise RuntimeError(f"Multicall3 not found at {MULTICALL3_ADDRESS}")
+
+    multicall = Multicall3.deploy({"from": accounts[0]})
+    log.info("Multicall3 stand-in deployed at", multicall.address)
+    return multicall
+
+
+def get_chunk_size() -> int:
+    return int(get_env("MULTICALL_CHUNK_SIZE") or MULTICALL_CHUNK_SIZE)
+
+
+def batch_call(calls: Sequence[tuple], chunk_size: Optional[int] = None) -> list[Any]:
+    """
+    Execute view calls via Multicall3 and decode the results
+
+    Each call is a tuple of a contract view method followed by its arguments,
+    e.g. `(token.balanceOf, holder)`. Results are returned in the calls order.
+    """
+    chunk_size = chunk_size or get_chunk_size()
+    if not calls:
+        return []
+
+    multicall = get_multicall()
+    results = []
+    for i in range(0, len(calls), chunk_size):
+        chunk = calls[i : i + chunk_size]
+        methods: list[ContractCall] = [method for method, *_ in chunk]
+        encoded = [(method._address, False, method.encode_input(*args)) for method, *args in chunk]
+        responses = multicall.aggregate3.call(encoded)
+        results.extend(method.decode_output(data) for method, (_, data) in zip(methods, responses))
+    return results
+
+
+def read_fields(contract, fields: Sequence[str], chunk_size: Optional[int] = None) -> dict[str, Any]:
+    """Read the given view fields of the contract in a single batch"""
+    values = batch_call([(getattr(contract, field),) for field in fields], chunk_size)
+    return dict(zip(fields, values))
@@ -0,0 +1,30 @@
+from typing import Sequence
+
+from gnosis.safe.multi_send import MultiSend
+
+# half of the 30M mainnet block gas limit
+DEFAULT_MULTISEND_GAS_LIMIT = 15_000_000
+
+
+def split_by_gas(gas_costs: Sequence[int], gas_limit: int, chunk_gas: int = 0) -> list[range]:
+    """
+    Split consecutive items into the minimal number of chunks, each of them costing under `gas_limit`
+    with `chunk_gas` spent once per chunk (e.g. for a token approval) on top of the items gas
+    """
+    chunks = []
+    start, used = 0, chunk_gas
+    for i, gas in enumerate(gas_costs):
+        if chunk_gas + gas > gas_limit:
+            raise ValueError(f"Item {i} alone needs {chunk_gas + gas} gas, over the limit of {gas_limit}")
+        if used + gas > gas_limit:
+            chunks.append(range(start, i))
+            start, used = i, chunk_gas
+        used += gas
+    if start < len(gas_costs):
+        chunks.append(range(start, len(gas_costs)))
+    return chunks
+
+
+def decode_multisend(data: bytes) -> list[tuple[str, bytes]]:
+    """(to, data) of the calls packed into `MultiSend.multiSend` calldata"""
+    return [(tx.to, tx.data) for tx in MultiSend.from_transaction_data(data)]
@@ -0,0 +1,146 @@
+import sqlite3
+from typing import Callable, Iterable, NamedTuple, Optional, Sequence
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS escrow_params (
+    chain_id INTEGER NOT NULL,
+    escrow TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    token TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL,
+    cliff_length TEXT NOT NULL,
+    factory TEXT NOT NULL,
+    total_locked TEXT NOT NULL,
+    is_fully_revokable INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    block_hash TEXT NOT NULL,
+    PRIMARY KEY (chain_id, escrow)
+);
+CREATE INDEX IF NOT EXISTS escrow_params_block_number ON escrow_params (chain_id, block_number);
+"""
+
+# blocks behind the head considered safe from reorgs, entries read closer to the head are re-checked
+REORG_DEPTH = 64
+
+# under the SQLite limit of 999 query parameters
+QUERY_CHUNK_SIZE = 500
+
+# VestingEscrow fields changing after `initialize`, never cached and always read from the chain
+MUTABLE_FIELDS = ("total_claimed", "disabled_at", "is_fully_revoked", "unclaimed", "locked", "token_balance")
+
+
+class EscrowParams(NamedTuple):
+    """VestingEscrow fields set once by `initialize`"""
+
+    escrow: str
+    recipient: str
+    token: str
+    start_time: int
+    end_time: int
+    cliff_length: int
+    factory: str
+    total_locked: int
+    is_fully_revokable: bool
+
+    @classmethod
+    def from_state(cls, state) -> "EscrowParams":
+        """Params of the escrow from `utils.lens.EscrowState` value"""
+        return cls(*(getattr(state, field) for field in cls._fields))
+
+
+class ParamsCache:
+    """
+    SQLite cache of the immutable escrows params, keyed by chain id and escrow address
+
+    Every entry keeps the number and the hash of the block it was read at. Entries read within `REORG_DEPTH`
+    blocks of the head are dropped by `invalidate_reorged` once their block is no longer on the chain.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ParamsCache":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get(self, chain_id: int, escrows: Sequence[str]) -> dict[str, EscrowParams]:
+        """Cached params of the given escrows, missing escrows are not in the result"""
+        params = {}
+        for i in range(0, len(escrows), QUERY_CHUNK_SIZE):
+            chunk = list(escrows[i : i + QUERY_CHUNK_SIZE])
+            rows = self._conn.execute(
+                f"SELECT * FROM escrow_params WHERE chain_id = ? AND escrow IN ({', '.join('?' * len(chunk))})",
+                (chain_id, *chunk),
+            )
+            params.update((row[1], _from_row(row)) for row in rows)
+        return params
+
+    def save(self, chain_id: int, params: Iterable[EscrowParams], block_number: int, block_hash: str) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO escrow_params VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((chain_id, *_to_row(p), block_number, block_hash) for p in params),
+            )
+
+    def invalidate_reorged(self, chain_id: int, head: int, get_block_hash: Callable[[int], Optional[str]]) -> int:
+        """
+        Drop the entries read at blocks replaced by a reorg or above the head, returns the number of dropped entries
+
+        Only the distinct blocks within `REORG_DEPTH` of the head are fetched, deeper entries are final.
+        """
+        rows = self._conn.execute(
+            "SELECT DISTINCT block_number, block_hash FROM escrow_params WHERE chain_id = ? AND block_number > ?",
+            (chain_id, head - REORG_DEPTH),
+        ).fetchall()
+        reorged = [
+            (block_number, block_hash)
+            for block_number, block_hash in rows
+            if block_number > head or get_block_hash(block_number) != block_hash
+        ]
+        with self._conn:
+            dropped = sum(
+                self._conn.execute(
+                    "DELETE FROM escrow_params WHERE chain_id = ? AND block_number = ? AND block_hash = ?",
+                    (chain_id, block_number, block_hash),
+                ).rowcount
+                for block_number, block_hash in reorged
+            )
+        return dropped
+
+
+def _to_row(params: EscrowParams) -> tuple:
+    # uint256 values don't fit SQLite INTEGER
+    return (
+        params.escrow,
+        params.recipient,
+        params.token,
+        str(params.start_time),
+        str(params.end_time),
+        str(params.cliff_length),
+        params.factory,
+        str(params.total_locked),
+        int(params.is_fully_revokable),
+    )
+
+
+def _from_row(row: tuple) -> EscrowParams:
+    escrow, recipient, token, start_time, end_time, cliff_length, factory, total_locked, is_fully_revokable = row[1:10]
+    return EscrowParams(
+        escrow,
+        recipient,
+        token,
+        int(start_time),
+        int(end_time),
+        int(cliff_length),
+        factory,
+        int(total_locked),
+        bool(is_fully_revokable),
+    )
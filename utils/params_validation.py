@@ -0,0 +1,174 @@
+"""
+Usage:
+    python -m utils.params_validation [escrow_params_dir] [--output report.json] [--workers N]
+
+Check every batch CSV file against its .hash file and the factory invariants and print a JSON report.
+Exits with non-zero code if any batch is invalid.
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Sequence
+
+from eth_utils import is_address, to_checksum_address
+
+from utils.vesting_params import VestingParams
+
+ESCROW_PARAMS_DIR = "escrow_params"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+class BatchReport(NamedTuple):
+    """Result of a single batch file validation"""
+
+    file: str
+    sha256: str
+    expected_sha256: Optional[str]
+    rows: int
+    total_amount: int
+    errors: list[str]
+    recipients: list[tuple[str, int]]  # (recipient, line number)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def validate_batch(filename: str) -> BatchReport:
+    """Hash and parse the batch file in a single pass and check every row"""
+    hasher = sha256()
+    errors = []
+    recipients = []
+    total_amount = 0
+    rows = 0
+
+    with open(filename, mode="rb") as f:
+        reader = csv.reader(_hashed_lines(f, hasher), delimiter=",")
+        header = next(reader, None)
+        if header != list(VestingParams._fields):
+            errors.append(f"line 1: unexpected header {header}")
+        for row in reader:
+            line = reader.line_num
+            if not row:
+                continue
+            rows += 1
+            try:
+                params = VestingParams.from_tuple(tuple(row))
+            except ValueError as e:
+                errors.append(f"line {line}: {e}")
+                continue
+            errors.extend(f"line {line}: {error}" for error in _check_params(params, row[5]))
+            if is_address(params.recipient):
+                recipients.append((to_checksum_address(params.recipient), line))
+            total_amount += params.amount
+
+    digest = hasher.hexdigest()
+    expected = _read_expected_sha256(filename)
+    if expected is None:
+        errors.append("hash file not found or empty")
+    elif expected != digest:
+        errors.append(f"sha256 mismatch: expected {expected}, actual {digest}")
+
+    return BatchReport(filename, digest, expected, rows, total_amount, errors, recipients)
+
+
+def validate_all(directory: str = ESCROW_PARAMS_DIR, workers: Optional[int] = None) -> dict:
+    """Validate all the batch files of the directory in a process pool and build the report"""
+    filenames = sorted(glob.glob(os.path.join(directory, "*.csv")), key=_natural_key)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        batches = list(executor.map(validate_batch, filenames))
+
+    locations: dict[str, list[str]] = {}
+    for batch in batches:
+        for recipient, line in batch.recipients:
+            locations.setdefault(recipient, []).append(f"{batch.file}:{line}")
+
+    return {
+        "ok": all(batch.ok for batch in batches),
+        "batches": [_batch_to_dict(batch) for batch in batches],
+        "total_rows": sum(batch.rows for batch in batches),
+        "total_amount": str(sum(batch.total_amount for batch in batches)),
+        # recipients of several vestings are not invalid per se, listed for the review
+        "duplicate_recipients": {recipient: lines for recipient, lines in locations.items() if len(lines) > 1},
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate escrow params batch files")
+    parser.add_argument("directory", nargs="?", default=ESCROW_PARAMS_DIR)
+    parser.add_argument("--output", help="Write the JSON report to the file instead of stdout")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    args = parser.parse_args(argv)
+
+    report = validate_all(args.directory, args.workers)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    return 0 if report["ok"] else 1
+
+
+def _hashed_lines(f: BinaryIO, hasher) -> Iterator[str]:
+    for line in f:
+        hasher.update(line)
+        yield line.decode("utf-8")
+
+
+def _check_params(params: VestingParams, raw_is_fully_revokable: str) -> list[str]:
+    """Mirror the VestingEscrowFactory asserts"""
+    errors = []
+    if params.vesting_duration <= 0:
+        errors.append("incorrect vesting duration")
+    if params.cliff_length > params.vesting_duration:
+        errors.append("incorrect vesting cliff")
+    if not is_address(params.recipient):
+        errors.append(f"invalid recipient {params.recipient}")
+    elif params.recipient == ZERO_ADDRESS:
+        errors.append("zero recipient")
+    if params.amount <= 0:
+        errors.append("incorrect amount")
+    if params.vesting_start < 0 or params.cliff_length < 0:
+        errors.append("negative uint256 value")
+    if raw_is_fully_revokable not in ("0", "1"):
+        errors.append(f"invalid is_fully_revokable {raw_is_fully_revokable}")
+    return errors
+
+
+def _read_expected_sha256(csv_filename: str) -> Optional[str]:
+    """Read the checksum of the `sha256sum` formatted .hash file next to the CSV one"""
+    hash_filename = os.path.splitext(csv_filename)[0] + ".hash"
+    if not os.path.exists(hash_filename):
+        return None
+    with open(hash_filename, encoding="utf-8") as f:
+        parts = f.read().split()
+    return parts[0].lower() if parts else None
+
+
+def _batch_to_dict(batch: BatchReport) -> dict:
+    return {
+        "file": batch.file,
+        "ok": batch.ok,
+        "sha256": batch.sha256,
+        "expected_sha256": batch.expected_sha256,
+        "rows": batch.rows,
+        "total_amount": str(batch.total_amount),
+        "errors": batch.errors,
+    }
+
+
+def _natural_key(filename: str) -> list:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", filename)]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
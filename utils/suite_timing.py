@@ -0,0 +1,69 @@
+"""
+Usage:
+    python -m utils.suite_timing [--workers 0 4 auto] [--networks development anvil-dev] [--output FILE]
+        [-- BROWNIE_TEST_ARGS]
+
+Wall-clock comparison of the test suite runs on every network, serially and under pytest-xdist. Each run is a separate
+`brownie test` process, `--workers 0` is the serial run, any other value is passed to `-n` and every xdist worker
+launches its own chain on the port of the network plus the worker index. The speedup is relative to the first run.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from typing import List, NamedTuple, Optional, Sequence
+
+DEFAULT_WORKERS = ["0", "auto"]
+DEFAULT_NETWORKS = ["development"]
+
+
+class SuiteRun(NamedTuple):
+    network: str
+    workers: str
+    seconds: float
+    returncode: int
+
+
+def run_suite(network: str, workers: str, test_args: Sequence[str]) -> SuiteRun:
+    command = ["brownie", "test", *test_args, "--network", network]
+    if workers != "0":
+        command += ["-n", workers]
+    started = time.perf_counter()
+    returncode = subprocess.run(command).returncode
+    return SuiteRun(network, workers, time.perf_counter() - started, returncode)
+
+
+def format_runs(runs: List[SuiteRun]) -> str:
+    baseline = runs[0].seconds
+    width = max(len("network"), *(len(run.network) for run in runs))
+    lines = [f"{'network':<{width}} {'workers':>8} {'seconds':>10} {'speedup':>8}  status"]
+    for run in runs:
+        status = "passed" if run.returncode == 0 else f"failed ({run.returncode})"
+        lines.append(
+            f"{run.network:<{width}} {run.workers:>8} {run.seconds:>10.1f} {baseline / run.seconds:>7.2f}x  {status}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the test suite wall-clock time by network and workers")
+    parser.add_argument("--workers", nargs="+", default=DEFAULT_WORKERS, help="xdist workers of each run, 0 is serial")
+    parser.add_argument("--networks", nargs="+", default=DEFAULT_NETWORKS, help="Brownie networks of the runs")
+    parser.add_argument("--output", help="Write the runs to the .json file")
+    parser.add_argument("test_args", nargs=argparse.REMAINDER, help="Arguments passed to `brownie test` after --")
+    args = parser.parse_args(argv)
+
+    test_args = args.test_args[1:] if args.test_args[:1] == ["--"] else args.test_args
+    runs = [run_suite(network, workers, test_args) for network in args.networks for workers in args.workers]
+    print(format_runs(runs))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([run._asdict() for run in runs], f, indent=2)
+            f.write("\n")
+    return max(run.returncode for run in runs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
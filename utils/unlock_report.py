@@ -0,0 +1,88 @@
+"""
+Usage:
+    python -m utils.unlock_report [csv_glob] [--start TIMESTAMP] [--periods N] [--step week|day] [--output FILE]
+
+Forecast of the tokens unlocked per period across all the escrows of the CSV files, `escrow_params/*.csv` by default.
+Prints CSV or writes CSV or JSON by the output file extension. See `scripts/unlock_report.py` for deployed escrows.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional, Sequence
+
+from utils.vesting_schedule import ESCROW_PARAMS_GLOB, VestingSchedule, time_grid
+
+STEPS = {"day": 24 * 60 * 60, "week": 7 * 24 * 60 * 60}
+# two years of weeks
+DEFAULT_PERIODS = 104
+
+
+class UnlockPeriod(NamedTuple):
+    """Tokens unlocked in (period_start, period_end], amounts in wei"""
+
+    period_start: int
+    period_end: int
+    date: str  # UTC date of the period end
+    unlocked: int
+    total_unlocked: int  # unlocked by the period end
+
+
+def unlock_periods(schedule: VestingSchedule, start: int, end: int, step: int) -> list[UnlockPeriod]:
+    """Unlocks of the periods of `step` seconds from `start` to `end`, the last period may be shorter"""
+    grid = time_grid(start, end, step)
+    totals = schedule.total_unlocked_at(grid)
+    return [
+        UnlockPeriod(
+            period_start=int(grid[i - 1]),
+            period_end=int(grid[i]),
+            date=datetime.fromtimestamp(int(grid[i]), timezone.utc).strftime("%Y-%m-%d"),
+            unlocked=int(totals[i] - totals[i - 1]),
+            total_unlocked=int(totals[i]),
+        )
+        for i in range(1, len(grid))
+    ]
+
+
+def format_periods(periods: Sequence[UnlockPeriod], fmt: str = "csv") -> str:
+    if fmt == "json":
+        return json.dumps([period._asdict() for period in periods], indent=2) + "\n"
+
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(UnlockPeriod._fields)
+    writer.writerows(periods)
+    return output.getvalue()
+
+
+def write_periods(periods: Sequence[UnlockPeriod], output: Optional[str] = None) -> None:
+    """Write CSV or JSON by the output file extension, CSV to stdout without the file"""
+    if not output:
+        sys.stdout.write(format_periods(periods))
+        return
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(format_periods(periods, "json" if output.endswith(".json") else "csv"))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Forecast tokens unlocked per period")
+    parser.add_argument("pattern", nargs="?", default=ESCROW_PARAMS_GLOB, help="Glob of the escrow params CSV files")
+    parser.add_argument("--start", type=int, default=None, help="Unix time of the first period start, now by default")
+    parser.add_argument("--periods", type=int, default=DEFAULT_PERIODS, help="Number of periods")
+    parser.add_argument("--step", choices=STEPS, default="week", help="Period length")
+    parser.add_argument("--output", help="Write to the .csv or .json file instead of stdout")
+    args = parser.parse_args(argv)
+
+    start = int(time.time()) if args.start is None else args.start
+    step = STEPS[args.step]
+    schedule = VestingSchedule.from_csv(args.pattern)
+    write_periods(unlock_periods(schedule, start, start + args.periods * step, step), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import csv
+from collections import defaultdict, deque
+from typing import Iterator, NamedTuple, Sequence
+
+
+class VestingParams(NamedTuple):
+    """Tuple of parameters to read from CSV line"""
+
+    amount: int
+    recipient: str
+    vesting_duration: int
+    vesting_start: int
+    cliff_length: int
+    is_fully_revokable: bool
+
+    @classmethod
+    def from_tuple(cls, tupl: tuple) -> "VestingParams":
+        """Construct new VestingParams from tuple of strings"""
+        if len(tupl) != len(cls._fields):
+            raise ValueError("Fields length mismatch to construct VestingParams")
+        return cls(
+            int(tupl[0]),
+            tupl[1],
+            int(tupl[2]),
+            int(tupl[3]),
+            int(tupl[4]),
+            tupl[5] == "1",
+        )
+
+    @classmethod
+    def from_state(cls, state) -> "VestingParams":
+        """Params of the deployed escrow from `utils.lens.EscrowState` value"""
+        return cls(
+            state.total_locked,
+            state.recipient,
+            state.end_time - state.start_time,
+            state.start_time,
+            state.cliff_length,
+            state.is_fully_revokable,
+        )
+
+    def key(self) -> "VestingParams":
+        """Params with the recipient address in lower case, to compare checksummed and plain addresses"""
+        return self._replace(recipient=self.recipient.lower())
+
+
+def iter_params_csv(filename: str) -> Iterator[VestingParams]:
+    """Lazily read VestingParams from the CSV file, skipping the header line"""
+    with open(filename, encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=",")
+        next(reader)  # skip header line
+        for row in reader:
+            yield VestingParams.from_tuple(tuple(row))
+
+
+def match_params(deployed: Sequence[VestingParams], params_list: Sequence[VestingParams]) -> list[int]:
+    """
+    Indexes of the `params_list` rows matching the params of the deployed escrows, in order of the escrows
+
+    Every row is matched once, so repeated rows, e.g. several vestings of one recipient, must be deployed
+    the same number of times. Equal rows are matched in order of their appearance.
+    """
+    rows: dict[VestingParams, deque[int]] = defaultdict(deque)
+    for num, params in enumerate(params_list):
+        rows[params.key()].append(num)
+
+    matched = []
+    for num, params in enumerate(deployed):
+        candidates = rows.get(params.key())
+        if not candidates:
+            raise ValueError(f"Params of the escrow {num} not found in source or deployed more times: {params}")
+        matched.append(candidates.popleft())
+
+    not_deployed = sorted(num for candidates in rows.values() for num in candidates)
+    if not_deployed:
+        raise ValueError(f"Rows not deployed: {not_deployed}")
+    return matched
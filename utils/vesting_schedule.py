@@ -0,0 +1,237 @@
+import glob
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from utils.vesting_params import VestingParams, iter_params_csv
+
+ESCROW_PARAMS_GLOB = "escrow_params/*.csv"
+
+# `remainder * elapsed` of the vesting math fits int64 for durations up to ~96 years, longer ones take the exact
+# Python ints path
+MAX_INT64_DURATION = 3_000_000_000
+# timestamps and time sums of the int64 path stay under this bound
+MAX_INT64_TIME = 2**62
+# escrows per (escrows, times) int64 matrix, bounds the memory of the vectorized path
+UNLOCK_CHUNK_SIZE = 4096
+
+
+class VestingSchedule:
+    """
+    Vectorized model of the VestingEscrow schedule
+
+    Mirrors `_total_vested_at`, `_unclaimed` and `_locked` of the contract for many escrows at many timestamps.
+    Values are kept in `object` arrays of Python ints, so uint256 math is exact and no overflow is possible.
+    Methods return arrays of the (escrows, times) shape.
+    """
+
+    def __init__(
+        self,
+        start_time: Sequence[int],
+        end_time: Sequence[int],
+        cliff_length: Sequence[int],
+        total_locked: Sequence[int],
+        total_claimed: Sequence[int],
+        disabled_at: Sequence[int],
+        is_fully_revoked: Sequence[bool],
+    ):
+        self.start_time = _column(start_time)
+        self.end_time = _column(end_time)
+        self.cliff_length = _column(cliff_length)
+        self.total_locked = _column(total_locked)
+        self.total_claimed = _column(total_claimed)
+        self.disabled_at = _column(disabled_at)
+        self.is_fully_revoked = np.array(is_fully_revoked, dtype=bool).reshape(-1, 1)
+
+    def __len__(self) -> int:
+        return len(self.start_time)
+
+    @classmethod
+    def from_params(cls, params_list: Iterable[VestingParams]) -> "VestingSchedule":
+        """Schedule of the escrows to be deployed with the given params, i.e. not claimed and not revoked"""
+        params_list = list(params_list)
+        end_time = [p.vesting_start + p.vesting_duration for p in params_list]
+        return cls(
+            start_time=[p.vesting_start for p in params_list],
+            end_time=end_time,
+            cliff_length=[p.cliff_length for p in params_list],
+            total_locked=[p.amount for p in params_list],
+            total_claimed=[0] * len(params_list),
+            disabled_at=end_time,
+            is_fully_revoked=[False] * len(params_list),
+        )
+
+    @classmethod
+    def from_csv(cls, pattern: str = ESCROW_PARAMS_GLOB) -> "VestingSchedule":
+        """Schedule of the escrows from the CSV files matching the glob pattern"""
+        filenames = sorted(glob.glob(pattern))
+        return cls.from_params(params for filename in filenames for params in iter_params_csv(filename))
+
+    @classmethod
+    def from_states(cls, states: Iterable) -> "VestingSchedule":
+        """Schedule of the deployed escrows from `utils.lens.EscrowState` values"""
+        states = list(states)
+        return cls(**{field: [getattr(s, field) for s in states] for field in _STATE_FIELDS})
+
+    def total_vested_at(self, times: Sequence[int]) -> np.ndarray:
+        return self._total_vested_at(_row(times))
+
+    def unclaimed(self, times: Sequence[int]) -> np.ndarray:
+        """
+        Unclaimed tokens at the given times
+
+        The current `total_claimed` is used for every time, so times earlier than the last claim are
+        meaningless: the contract reverts on underflow there, the model returns negative values.
+        """
+        claim_time = np.minimum(_row(times), self.disabled_at)
+        unclaimed = self._total_vested_at(claim_time) - self.total_claimed
+        return np.where(self.is_fully_revoked, 0, unclaimed)
+
+    def locked(self, times: Sequence[int]) -> np.ndarray:
+        times = _row(times)
+        locked = self.total_locked - self._total_vested_at(times)
+        return np.where(times >= self.disabled_at, 0, locked)
+
+    def totals(self, times: Sequence[int]) -> dict[str, np.ndarray]:
+        """Sum of vested, unclaimed and locked tokens of all the escrows at the given times"""
+        return {
+            "vested": self.total_vested_at(times).sum(axis=0),
+            "unclaimed": self.unclaimed(times).sum(axis=0),
+            "locked": self.locked(times).sum(axis=0),
+        }
+
+    def unlocked(self, times: Sequence[int]) -> np.ndarray:
+        """
+        Tokens unlocked for the recipients by the given times
+
+        `_total_vested_at` frozen at `disabled_at`, i.e. `unclaimed + total_claimed` of the contract. A fully revoked
+        escrow only keeps what was claimed before `revoke_all`, so its `total_claimed` is counted at any time.
+        """
+        times = _row(times)
+        unlocked = self._total_vested_at(np.minimum(times, self.disabled_at))
+        return np.where(self.is_fully_revoked, self.total_claimed, unlocked)
+
+    def total_unlocked_at(self, times: Sequence[int]) -> np.ndarray:
+        """
+        `unlocked(times).sum(axis=0)` computed without the (escrows, times) matrix of Python ints
+
+        `total_locked * elapsed // duration` is split into `quotient * elapsed + remainder * elapsed // duration`
+        with `total_locked = quotient * duration + remainder`. Sums of the quotient terms and of the constant parts
+        (fully vested, frozen at `disabled_at`, revoked) change only where an escrow enters or leaves a phase of its
+        schedule, so they are prefix sums over O(escrows + times) Python ints. Only the remainder terms, under
+        `duration`, are computed per escrow and time in int64. The result is exact, escrows not fitting int64 fall
+        back to `unlocked`. Times must be sorted.
+        """
+        times = [int(t) for t in times]
+        if times != sorted(times):
+            raise ValueError("Times must be sorted")
+        times_count = len(times)
+        total = np.zeros(times_count, dtype=object)
+        if not times_count or not len(self):
+            return total
+
+        duration = (self.end_time - self.start_time)[:, 0]
+        revoked = self.is_fully_revoked[:, 0]
+        fast = (
+            ~revoked
+            & (duration <= MAX_INT64_DURATION).astype(bool)
+            & (self.end_time[:, 0] <= MAX_INT64_TIME).astype(bool)
+            & (self.disabled_at[:, 0] <= MAX_INT64_TIME).astype(bool)
+            & (times[-1] <= MAX_INT64_TIME)
+        )
+        slow = ~revoked & ~fast
+        if slow.any():
+            total += _subset(self, slow).unlocked(times).sum(axis=0)
+        total += sum(self.total_claimed[revoked, 0])
+        if not fast.any():
+            return total
+
+        s = _subset(self, fast)
+        start = s.start_time[:, 0].astype(np.int64)
+        end = s.end_time[:, 0].astype(np.int64)
+        disabled_at = s.disabled_at[:, 0].astype(np.int64)
+        duration = end - start
+        total_locked = s.total_locked[:, 0]
+        quotient = total_locked // duration.astype(object)
+        remainder = (total_locked % duration.astype(object)).astype(np.int64)
+
+        grid = np.array(times, dtype=np.int64)
+        # first time index at or after the cliff end, the vesting end and `disabled_at`
+        cliff_idx = np.searchsorted(grid, start + s.cliff_length[:, 0].astype(np.int64))
+        end_idx = np.searchsorted(grid, end)
+        disabled_idx = np.searchsorted(grid, disabled_at)
+        linear_end_idx = np.minimum(end_idx, disabled_idx)
+
+        # the amount vested by `disabled_at`, kept since then
+        frozen = np.where(
+            disabled_at < start + s.cliff_length[:, 0].astype(np.int64),
+            0,
+            np.minimum(total_locked * (disabled_at - start).astype(object) // duration.astype(object), total_locked),
+        )
+        constant = np.zeros(times_count + 1, dtype=object)
+        full = end_idx < disabled_idx
+        np.add.at(constant, end_idx[full], total_locked[full])
+        np.add.at(constant, disabled_idx[full], -total_locked[full])
+        np.add.at(constant, disabled_idx, frozen)
+
+        linear = cliff_idx < linear_end_idx
+        quotient_sum = np.zeros(times_count + 1, dtype=object)
+        np.add.at(quotient_sum, cliff_idx[linear], quotient[linear])
+        np.add.at(quotient_sum, linear_end_idx[linear], -quotient[linear])
+        quotient_start_sum = np.zeros(times_count + 1, dtype=object)
+        np.add.at(quotient_start_sum, cliff_idx[linear], quotient[linear] * start[linear].astype(object))
+        np.add.at(quotient_start_sum, linear_end_idx[linear], -quotient[linear] * start[linear].astype(object))
+
+        total += np.cumsum(constant)[:-1]
+        total += np.array(times, dtype=object) * np.cumsum(quotient_sum)[:-1] - np.cumsum(quotient_start_sum)[:-1]
+
+        columns = np.arange(times_count)
+        rows = np.flatnonzero(linear)
+        for i in range(0, len(rows), UNLOCK_CHUNK_SIZE):
+            chunk = rows[i : i + UNLOCK_CHUNK_SIZE]
+            elapsed = np.clip(grid - start[chunk, None], 0, duration[chunk, None])
+            vested = remainder[chunk, None] * elapsed // duration[chunk, None]
+            active = (columns >= cliff_idx[chunk, None]) & (columns < linear_end_idx[chunk, None])
+            total += np.where(active, vested, 0).sum(axis=0).astype(object)
+        return total
+
+    def _total_vested_at(self, times: np.ndarray) -> np.ndarray:
+        vested = self.total_locked * (times - self.start_time) // (self.end_time - self.start_time)
+        vested = np.minimum(vested, self.total_locked)
+        return np.where(times < self.start_time + self.cliff_length, 0, vested)
+
+
+_STATE_FIELDS = (
+    "start_time",
+    "end_time",
+    "cliff_length",
+    "total_locked",
+    "total_claimed",
+    "disabled_at",
+    "is_fully_revoked",
+)
+
+
+def time_grid(start: int, end: int, step: int) -> np.ndarray:
+    """Timestamps from start to end inclusive with the given step"""
+    return np.append(np.arange(start, end, step, dtype=object), end)
+
+
+def _column(values: Sequence[int]) -> np.ndarray:
+    return np.array([int(v) for v in values], dtype=object).reshape(-1, 1)
+
+
+def _subset(schedule: VestingSchedule, rows: np.ndarray) -> VestingSchedule:
+    return VestingSchedule(
+        start_time=schedule.start_time[rows, 0],
+        end_time=schedule.end_time[rows, 0],
+        cliff_length=schedule.cliff_length[rows, 0],
+        total_locked=schedule.total_locked[rows, 0],
+        total_claimed=schedule.total_claimed[rows, 0],
+        disabled_at=schedule.disabled_at[rows, 0],
+        is_fully_revoked=schedule.is_fully_revoked[rows, 0],
+    )
+
+
+def _row(times: Sequence[int]) -> np.ndarray:
+    return np.array([int(t) for t in times], dtype=object).reshape(1, -1)